@@ -1,18 +1,18 @@
 """数据传输对象定义"""
 
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class CrawlUrlCommand:
     """爬取 URL 命令"""
     url: str
     options: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CrawlResult:
     """爬取结果"""
     task_id: str
@@ -38,17 +38,30 @@ class CrawlResult:
             metadata=task.metadata,
         )
 
+    @classmethod
+    def from_summary(cls, summary) -> "CrawlResult":
+        """从任务摘要创建结果（不含内容、错误信息和元数据）"""
+        return cls(
+            task_id=str(summary.id),
+            status=summary.status.value,
+            url=str(summary.url),
+            created_at=summary.created_at,
+            updated_at=summary.updated_at,
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class TaskQuery:
     """任务查询"""
     task_id: Optional[str] = None
+    task_ids: Optional[List[str]] = None
     status: Optional[str] = None
     limit: int = 100
     offset: int = 0
+    summary_only: bool = False  # 只返回任务摘要，不加载内容
 
 
-@dataclass
+@dataclass(slots=True)
 class XiaohongshuBrowseCommand:
     """小红书浏览命令"""
     keywords: Optional[list[str]] = None
@@ -58,9 +71,13 @@ class XiaohongshuBrowseCommand:
     max_comment_scrolls: int = 10  # 评论最大滚动次数
 
 
-@dataclass
+@dataclass(slots=True)
 class XiaohongshuDownloadImagesCommand:
     """小红书下载图片命令"""
     urls: Optional[list[str]] = None  # 直接指定的 URL 列表
     url_config_file: Optional[str] = None  # URL 配置文件路径
     output_dir: str = "output"  # 输出目录
+    max_concurrency: int = 8  # 图片下载最大并发数
+    cache_ttl: int = 24 * 3600  # 已完成 URL 缓存有效期（秒），0 表示不使用缓存
+    convert_pdf: bool = False  # 是否将生成的 Word 文档转换为 PDF（需要 LibreOffice）
+    pdf_workers: int = 1  # PDF 转换的并行 LibreOffice 实例数
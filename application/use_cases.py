@@ -7,6 +7,7 @@ from domain.entities import CrawlerTask
 from domain.repositories import ICrawlerTaskRepository
 from domain.services import IBrowserService
 from domain.exceptions import TaskNotFoundError
+from domain.value_objects import intern_task_id
 from application.dto import CrawlUrlCommand, CrawlResult, TaskQuery
 
 
@@ -21,35 +22,46 @@ class CrawlUrlUseCase:
         self._task_repository = task_repository
         self._browser_service = browser_service
 
-    async def execute(self, command: CrawlUrlCommand) -> CrawlResult:
-        """执行爬取用例"""
+    async def _crawl(self, command: CrawlUrlCommand) -> CrawlerTask:
+        """创建任务并执行爬取，只修改内存中的任务状态，不做持久化"""
         logger.info(f"Starting crawl for URL: {command.url}")
 
         # 1. 创建任务实体
         task = CrawlerTask.create(command.url, metadata=command.options or {})
-        await self._task_repository.save(task)
 
         # 2. 启动任务
         try:
             task.start()
-            await self._task_repository.save(task)
 
             # 3. 执行爬取
             content = await self._browser_service.crawl(task.url, command.options)
 
             # 4. 完成任务
             task.complete(content)
-            await self._task_repository.save(task)
 
             logger.info(f"Task {task.id} completed successfully")
 
         except Exception as e:
             logger.error(f"Task {task.id} failed: {str(e)}")
             task.fail(str(e))
-            await self._task_repository.save(task)
 
+        return task
+
+    async def execute(self, command: CrawlUrlCommand) -> CrawlResult:
+        """执行爬取用例
+
+        中间状态只保留在内存中，任务到达终态（完成或失败）后一次性持久化。
+        """
+        task = await self._crawl(command)
+        await self._task_repository.save(task)
         return CrawlResult.from_task(task)
 
+    async def execute_many(self, commands: List[CrawlUrlCommand]) -> List[CrawlResult]:
+        """批量执行爬取用例，所有任务结束后在一个事务中批量保存"""
+        tasks = [await self._crawl(command) for command in commands]
+        await self._task_repository.save_many(tasks)
+        return [CrawlResult.from_task(task) for task in tasks]
+
 
 class GetTaskUseCase:
     """获取任务用例"""
@@ -59,14 +71,24 @@ class GetTaskUseCase:
 
     async def execute(self, task_id: str) -> CrawlResult:
         """获取任务详情"""
-        from domain.value_objects import TaskId
-
-        task = await self._task_repository.find_by_id(TaskId(task_id))
+        task = await self._task_repository.find_by_id(intern_task_id(task_id))
         if not task:
             raise TaskNotFoundError(f"Task {task_id} not found")
 
         return CrawlResult.from_task(task)
 
+    async def execute_many(self, task_ids: List[str]) -> List[CrawlResult]:
+        """一次查询获取多个任务详情，按传入顺序返回"""
+        tasks = await self._task_repository.find_by_ids(
+            [intern_task_id(task_id) for task_id in task_ids], limit=len(task_ids)
+        )
+        found = {str(task.id) for task in tasks}
+        missing = [task_id for task_id in task_ids if task_id not in found]
+        if missing:
+            raise TaskNotFoundError(f"Tasks {', '.join(missing)} not found")
+
+        return [CrawlResult.from_task(task) for task in tasks]
+
 
 class ListTasksUseCase:
     """列出任务用例"""
@@ -76,21 +98,35 @@ class ListTasksUseCase:
 
     async def execute(self, query: TaskQuery) -> List[CrawlResult]:
         """列出任务"""
+        task_ids = list(query.task_ids or [])
         if query.task_id:
-            from domain.value_objects import TaskId
+            task_ids.insert(0, query.task_id)
+        if task_ids:
+            tasks = await self._task_repository.find_by_ids(
+                [intern_task_id(task_id) for task_id in task_ids],
+                limit=query.limit,
+            )
+            return [CrawlResult.from_task(task) for task in tasks]
 
-            task = await self._task_repository.find_by_id(TaskId(query.task_id))
-            return [CrawlResult.from_task(task)] if task else []
+        # 只需要列表信息时只查询摘要列
+        if query.summary_only:
+            summaries = await self._task_repository.find_summaries(
+                status=query.status,
+                limit=query.limit,
+                offset=query.offset,
+            )
+            return [CrawlResult.from_summary(summary) for summary in summaries]
 
+        # 流式读取，逐条转换为 DTO，不同时保留模型、实体两份完整列表
         if query.status:
-            tasks = await self._task_repository.find_by_status(
+            tasks = self._task_repository.iter_by_status(
                 query.status,
                 limit=query.limit,
             )
         else:
-            tasks = await self._task_repository.find_all(
+            tasks = self._task_repository.iter_all(
                 limit=query.limit,
                 offset=query.offset,
             )
 
-        return [CrawlResult.from_task(task) for task in tasks]
+        return [CrawlResult.from_task(task) async for task in tasks]
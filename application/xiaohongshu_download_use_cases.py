@@ -1,27 +1,48 @@
 """小红书图片下载用例实现"""
 
 import asyncio
-import re
+import hashlib
+import struct
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, AsyncIterator, Awaitable, Callable
 from io import BytesIO
 from loguru import logger
 from PIL import Image
 
-from docx import Document
-from docx.shared import Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-
 from domain.exceptions import DomainError
 from infrastructure.adapters.xiaohongshu_service import XiaohongshuBrowserService
 from infrastructure.utils.word_generator import WordImageGenerator
+from infrastructure.utils.docx_writer import ImageDocxWriter
+from infrastructure.utils.completion_cache import CompletedUrlCache
+from infrastructure.utils.pdf_converter import WordToPdfConverter
 from application.dto import XiaohongshuDownloadImagesCommand
 
+# Windows/Linux 文件系统不支持的字符: < > : " / \ | ? *，统一替换为下划线
+_ILLEGAL_FILENAME_TRANS = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+
+# 每个工作线程复用一个图片编码缓冲区（图片在 asyncio.to_thread 的线程池中处理）
+_encode_buffers = threading.local()
+
 
 class XiaohongshuDownloadImagesUseCase:
     """小红书图片下载用例"""
 
+    # 嵌入 Word 的图片分辨率上限（打印分辨率），超过的部分只会增大文档体积
+    EMBED_DPI = 300
+    # 缩小后重新编码 JPEG 的质量
+    EMBED_JPEG_QUALITY = 85
+    # 每次调用 LibreOffice 最多转换的文档数
+    PDF_BATCH_SIZE = 10
+    # 等待转换 PDF 的文档队列上限，转换跟不上时让文档生成等待
+    PDF_QUEUE_SIZE = 20
+    # 文档写入专用线程数
+    DOCX_WORKERS = 2
+
     def __init__(self, browser_service: XiaohongshuBrowserService):
         """初始化用例
 
@@ -29,6 +50,14 @@ class XiaohongshuDownloadImagesUseCase:
             browser_service: 小红书浏览器服务
         """
         self._browser_service = browser_service
+        self._pdf_files: Dict[str, str] = {}
+        # 执行期间的文档写入线程池，与默认线程池中的图片处理分开
+        self._docx_executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def pdf_files(self) -> Dict[str, str]:
+        """最近一次执行生成的 PDF 文件，Word 文件路径到 PDF 文件路径的映射"""
+        return self._pdf_files
 
     def _load_urls(self, command: XiaohongshuDownloadImagesCommand) -> List[str]:
         """加载 URL 列表
@@ -39,11 +68,22 @@ class XiaohongshuDownloadImagesUseCase:
         Returns:
             URL 列表
         """
-        urls = []
+        unique_urls: List[str] = []
+        seen: set[str] = set()
+        original_count = 0
+
+        def _add(url: str) -> None:
+            """边读取边去重（保持顺序）"""
+            nonlocal original_count
+            original_count += 1
+            if url not in seen:
+                seen.add(url)
+                unique_urls.append(url)
 
         # 从直接指定的 URL 列表加载
         if command.urls:
-            urls.extend(command.urls)
+            for url in command.urls:
+                _add(url)
 
         # 从配置文件加载
         if command.url_config_file:
@@ -52,20 +92,17 @@ class XiaohongshuDownloadImagesUseCase:
                 raise DomainError(f"URL config file not found: {config_path}")
 
             try:
-                with open(config_path, "r", encoding="utf-8") as f:
+                with open(config_path, "r", encoding="utf-8", buffering=1 << 16) as f:
                     for line in f:
                         line = line.strip()
                         if line and not line.startswith("#"):  # 忽略空行和注释
-                            urls.append(line)
+                            _add(line)
             except Exception as e:
                 raise DomainError(f"Failed to load URL config file: {e}")
 
-        if not urls:
+        if not unique_urls:
             raise DomainError("No URLs provided. Use --urls or --url-config-file")
 
-        # 去重（保持顺序）
-        original_count = len(urls)
-        unique_urls = list(dict.fromkeys(urls))  # 保持顺序的去重
         duplicate_count = original_count - len(unique_urls)
 
         if duplicate_count > 0:
@@ -87,13 +124,8 @@ class XiaohongshuDownloadImagesUseCase:
         Returns:
             清理后的文件名
         """
-        # 移除或替换 Windows/Linux 文件系统不支持的字符
-        # 不允许的字符: < > : " / \ | ? *
-        illegal_chars = r'[<>:"/\\|?*]'
-        sanitized = re.sub(illegal_chars, "_", filename)
-        # 移除前后空格和点
-        sanitized = sanitized.strip(" .")
-        return sanitized
+        # 替换不合法字符，并移除前后空格和点
+        return filename.translate(_ILLEGAL_FILENAME_TRANS).strip(" .")
 
     def _generate_filename(self, title: str) -> str:
         """生成 Word 文件名：日期 + title 前20个字符
@@ -120,74 +152,135 @@ class XiaohongshuDownloadImagesUseCase:
         filename = f"{date_str}/{title_prefix}"
         return filename
 
-    async def _download_images_for_url(self, url: str) -> List[Dict[str, Any]]:
-        """为单个 URL 下载图片
+    def _existing_pdf(self, word_file: Path) -> Optional[str]:
+        """返回 Word 文档旁已生成且不旧于文档的 PDF 路径，不存在时返回 None"""
+        pdf_file = word_file.with_suffix(".pdf")
+        try:
+            if pdf_file.stat().st_mtime >= word_file.stat().st_mtime:
+                return str(pdf_file)
+        except OSError:
+            pass
+        return None
+
+    def _url_name_suffix(self, url: str) -> str:
+        """根据 URL 生成文件名后缀，同一 URL 每次得到相同的后缀
 
         Args:
             url: 内容页面 URL
 
         Returns:
-            图片信息列表，每个元素包含 {'url': str, 'index': int, 'data': bytes}
+            形如 "_1a2b3c4d" 的后缀
         """
-        logger.info(f"Processing URL: {url}")
-
-        # 获取图片 URL 列表
-        images_info = await self._browser_service.get_content_images(url)
+        return "_" + hashlib.sha1(url.encode("utf-8")).hexdigest()[:8]
+
+    async def _download_images_for_url(
+        self,
+        url: str,
+        images_info: List[Dict[str, Any]],
+        sem: asyncio.Semaphore,
+        word_generator: WordImageGenerator,
+        work_dir: Path,
+        page_dims: Optional[tuple[float, float]] = None,
+    ) -> List[Dict[str, Any]]:
+        """为单个 URL 并发下载图片
+
+        图片流式写入 work_dir 下的临时文件，处理后仍保存在磁盘上，
+        内存中只保留正在处理的图片，不随图片总数增长。
 
-        if not images_info:
-            logger.warning(f"No images found for URL: {url}")
-            return []
+        Args:
+            url: 内容页面 URL
+            images_info: 图片 URL 列表，每个元素包含 {'url': str, 'index': int}
+            sem: 限制图片下载并发数的信号量
+            word_generator: 共享 HTTP 连接池的图片下载器
+            work_dir: 存放下载图片的临时目录
+            page_dims: 页面可用尺寸（英寸），用于把过大的图片缩小到打印分辨率
 
-        # 下载图片
-        word_generator = WordImageGenerator()
-        images_with_data = []
+        Returns:
+            图片信息列表，每个元素包含
+            {'url': str, 'index': int, 'path': Path, 'format': str, 'size': (width, height) 或 None}
+        """
 
-        for img_info in images_info:
+        async def _download_one(img_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
             img_url = img_info["url"]
             img_index = img_info["index"]
+            image_path = work_dir / f"{img_index}.img"
 
             try:
-                # 下载图片
-                image_data = await word_generator.download_image(img_url)
-
-                # 确保图片格式是 Word 支持的格式
-                image_data = self._ensure_word_compatible_format(image_data)
-
-                images_with_data.append(
-                    {
-                        "url": img_url,
-                        "index": img_index,
-                        "data": image_data,
-                    }
+                # 下载图片（受信号量限制）
+                async with sem:
+                    await word_generator.download_image_to_file(img_url, image_path)
+
+                # 格式转换和尺寸解析是 CPU 密集的同步操作，放到线程中执行
+                image_format, image_size = await asyncio.to_thread(
+                    self._process_image_file, image_path, page_dims
                 )
-                logger.info(f"Downloaded and processed image {img_index} from {url}")
+
+                return {
+                    "url": img_url,
+                    "index": img_index,
+                    "path": image_path,
+                    "format": image_format,
+                    "size": image_size,
+                }
             except Exception as e:
                 logger.error(f"Failed to download or process image {img_index} from {img_url}: {e}")
-                continue
-
-        return images_with_data
-
-    async def execute(self, command: XiaohongshuDownloadImagesCommand) -> Dict[str, str]:
-        """执行图片下载用例
+                return None
+
+        results = await asyncio.gather(*(_download_one(img_info) for img_info in images_info))
+        downloaded = [result for result in results if result is not None]
+        # 按 URL 汇总输出一条日志，避免每张图片一条
+        logger.info(f"Downloaded {len(downloaded)}/{len(images_info)} images for {url}")
+        return downloaded
+
+    async def _process_url(
+        self,
+        url_index: int,
+        url: str,
+        total: int,
+        command: XiaohongshuDownloadImagesCommand,
+        sem: asyncio.Semaphore,
+        browser_lock: asyncio.Lock,
+        word_generator: WordImageGenerator,
+        cache: Optional[CompletedUrlCache] = None,
+        pdf_queue: Optional[asyncio.Queue] = None,
+        name_suffix: Optional[str] = None,
+    ) -> tuple[int, str]:
+        """处理单个 URL：获取标题和图片、下载图片并生成 Word 文档
+
+        浏览器操作共享同一个页面，因此在 browser_lock 内串行执行；
+        图片下载和文档生成则与其他 URL 并发进行。
 
         Args:
+            url_index: URL 序号（从 1 开始）
+            url: 内容页面 URL
+            total: URL 总数
             command: 下载命令
+            sem: 限制图片下载并发数的信号量
+            browser_lock: 串行化浏览器操作的锁
+            word_generator: 共享 HTTP 连接池的图片下载器
+            cache: 已完成 URL 缓存，命中时跳过该 URL
+            pdf_queue: PDF 转换队列，文档生成后立即放入，与其他 URL 的下载并行转换
+            name_suffix: 文件名后缀，用于区分同名文档；为 None 时多个 URL 使用序号
 
         Returns:
-            URL 和 Word 文件路径的对应关系字典 {url: word_file_path}
+            (url_index, Word 文件路径) 元组，失败时路径为空字符串
         """
-        logger.info("Starting Xiaohongshu download images use case")
+        if cache is not None:
+            cached_path = cache.get(url)
+            if cached_path:
+                logger.info(f"URL {url_index}/{total} already processed, skipping: {cached_path}")
+                if pdf_queue is not None:
+                    # 之前已转换且不旧于文档的 PDF 直接复用，不再重新转换
+                    pdf_path = self._existing_pdf(Path(cached_path))
+                    if pdf_path:
+                        self._pdf_files[cached_path] = pdf_path
+                    else:
+                        await pdf_queue.put(cached_path)
+                return url_index, cached_path
 
-        # 加载 URL 列表（已去重）
-        urls = self._load_urls(command)
-
-        # 存储 URL 和 Word 文件路径的对应关系
-        url_to_word_file: Dict[str, str] = {}
-
-        # 为每个 URL 生成一个独立的 Word 文档
-        for url_index, url in enumerate(urls, 1):
-            try:
-                logger.info(f"Processing URL {url_index}/{len(urls)}: {url}")
+        try:
+            async with browser_lock:
+                logger.info(f"Processing URL {url_index}/{total}: {url}")
 
                 # 获取当前 URL 的 title 用于生成文件名
                 page_title = ""
@@ -197,72 +290,228 @@ class XiaohongshuDownloadImagesUseCase:
                 except Exception as e:
                     logger.warning(f"Failed to get page title from URL: {e}")
 
-                # 生成文件名（如果多个 URL，添加序号以避免重名）
-                filename_base = self._generate_filename(page_title)
-                if len(urls) > 1:
-                    filename_base = f"{filename_base}{url_index}"
-                filename = f"{filename_base}.docx"
-                logger.info(f"Generated filename: {filename}")
-
-                # 创建新的 Word 文档
-                doc = Document()
+                # 获取图片 URL 列表
+                images_info = await self._browser_service.get_content_images(url)
 
-                # 设置页面边距为 0
-                sections = doc.sections
-                for section in sections:
-                    section.top_margin = Inches(0)
-                    section.bottom_margin = Inches(0)
-                    section.left_margin = Inches(0)
-                    section.right_margin = Inches(0)
+                # 在处理下一个 URL 前稍作等待
+                await asyncio.sleep(1)
 
-                # 获取并下载图片
-                images_with_data = await self._download_images_for_url(url)
+            if not images_info:
+                logger.warning(f"No images found for URL: {url}")
+                return url_index, ""
+
+            # 生成文件名（如果多个 URL，添加序号或指定后缀以避免重名）
+            filename_base = self._generate_filename(page_title)
+            if name_suffix is not None:
+                filename_base = f"{filename_base}{name_suffix}"
+            elif total > 1:
+                filename_base = f"{filename_base}{url_index}"
+            filename = f"{filename_base}.docx"
+            logger.info(f"Generated filename: {filename}")
+
+            # 文档页边距为 0，页面可用尺寸不变，只计算一次
+            page_dims = self._get_page_dimensions()
+
+            output_path = Path(command.output_dir) / filename
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # 图片下载到输出目录下的临时目录，文档生成后随目录一起删除
+            with tempfile.TemporaryDirectory(
+                prefix=".images-", dir=command.output_dir
+            ) as work_dir:
+                # 并发下载图片
+                images_with_data = await self._download_images_for_url(
+                    url, images_info, sem, word_generator, Path(work_dir), page_dims
+                )
 
                 if not images_with_data:
                     logger.warning(f"No images downloaded for URL: {url}")
                     # 即使没有图片，也记录 URL（标记为失败）
-                    url_to_word_file[url] = ""
-                    continue
+                    return url_index, ""
 
                 # 按 index 排序（虽然已经排序，但确保一下）
                 images_with_data.sort(key=lambda x: x["index"])
 
-                # 添加图片到文档
-                for img_info in images_with_data:
-                    try:
-                        image_data = img_info["data"]
-                        if not image_data:
-                            logger.warning(f"Image {img_info['index']} data is empty, skipping")
-                            continue
-                        self._add_image_to_document(doc, image_data)
-                        logger.debug(f"Added image {img_info['index']} to document")
-                    except Exception as e:
-                        logger.error(
-                            f"Error adding image {img_info['index']} to document: {type(e).__name__}: {str(e)}"
-                        )
-                        logger.exception("Full traceback:")
-                        continue
+                # 生成并保存文档（写 zip 耗时较长，在专用线程池中执行，
+                # 不阻塞事件循环，也不占用图片处理所在的默认线程池）
+                await asyncio.get_running_loop().run_in_executor(
+                    self._docx_executor,
+                    self._build_document,
+                    str(output_path),
+                    images_with_data,
+                    page_dims,
+                )
 
-                # 保存文档
-                output_path = Path(command.output_dir) / filename
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                doc.save(str(output_path))
+            logger.info(f"Word document saved to: {output_path}")
+            if cache is not None:
+                cache.put(url, str(output_path), len(images_with_data))
+            if pdf_queue is not None:
+                await pdf_queue.put(str(output_path))
+            return url_index, str(output_path)
 
-                logger.info(f"Word document saved to: {output_path}")
-                url_to_word_file[url] = str(output_path)
+        except Exception as e:
+            logger.error(f"Error processing URL {url}: {e}")
+            # 记录失败的 URL
+            return url_index, ""
 
-                # 在处理下一个 URL 前稍作等待
-                await asyncio.sleep(1)
+    @asynccontextmanager
+    async def session(
+        self, command: XiaohongshuDownloadImagesCommand
+    ) -> AsyncIterator[Callable[..., Awaitable[tuple[int, str]]]]:
+        """打开一次下载会话，期间所有 URL 共享同一组资源
 
-            except Exception as e:
-                logger.error(f"Error processing URL {url}: {e}")
-                # 记录失败的 URL
-                url_to_word_file[url] = ""
-                continue
+        会话内共享图片下载并发上限、浏览器锁、HTTP 连接池、文档写入线程池、
+        已完成 URL 缓存以及 PDF 转换流水线（含 LibreOffice 服务），
+        退出时等待剩余文档转换完成并释放这些资源。
+
+        Args:
+            command: 下载命令（只使用其中的输出目录、并发、缓存和 PDF 设置）
+
+        Yields:
+            处理单个 URL 的协程函数 process(url_index, url, total, name_by_url=False)，
+            name_by_url 为 True 时用 URL 哈希区分文件名，适用于逐个提交 URL 的场景
+        """
+        # 图片下载在所有 URL 间共享同一个并发上限
+        sem = asyncio.Semaphore(max(1, command.max_concurrency))
+        # 浏览器服务复用同一个页面，浏览器操作必须串行
+        browser_lock = asyncio.Lock()
+
+        # 有效期内已完成的 URL 直接跳过
+        cache = None
+        if command.cache_ttl > 0:
+            cache = CompletedUrlCache(
+                str(Path(command.output_dir) / ".cache.sqlite"), command.cache_ttl
+            )
+
+        # PDF 转换作为流水线的最后一级，与后续 URL 的下载和文档生成同时进行
+        self._pdf_files = {}
+        pdf_queue: Optional[asyncio.Queue] = None
+        pdf_task: Optional[asyncio.Task] = None
+        converter: Optional[WordToPdfConverter] = None
+        if command.convert_pdf:
+            pdf_queue = asyncio.Queue(maxsize=self.PDF_QUEUE_SIZE)
+            converter = WordToPdfConverter()
+            pdf_task = asyncio.create_task(
+                self._convert_pdfs(pdf_queue, converter, command.pdf_workers)
+            )
+
+        self._docx_executor = ThreadPoolExecutor(
+            max_workers=self.DOCX_WORKERS, thread_name_prefix="docx"
+        )
+        try:
+            # 所有 URL 的图片下载共享同一个 HTTP 连接池
+            async with WordImageGenerator(output_dir=command.output_dir) as word_generator:
+
+                async def _process(
+                    url_index: int, url: str, total: int, name_by_url: bool = False
+                ) -> tuple[int, str]:
+                    name_suffix = self._url_name_suffix(url) if name_by_url else None
+                    return await self._process_url(
+                        url_index,
+                        url,
+                        total,
+                        command,
+                        sem,
+                        browser_lock,
+                        word_generator,
+                        cache,
+                        pdf_queue,
+                        name_suffix,
+                    )
+
+                yield _process
+        finally:
+            self._docx_executor.shutdown(wait=False)
+            self._docx_executor = None
+            if pdf_task is not None:
+                # 通知转换任务没有更多文档，等待剩余文档转换完成；
+                # 转换任务已意外结束时队列可能一直是满的，不能无条件等待放入结束标记
+                stop = asyncio.create_task(pdf_queue.put(None))
+                try:
+                    await asyncio.wait((stop, pdf_task), return_when=asyncio.FIRST_COMPLETED)
+                    stop.cancel()
+                    if pdf_task.cancelled():
+                        logger.warning("PDF conversion task was cancelled")
+                    else:
+                        self._pdf_files.update(await pdf_task)
+                finally:
+                    converter.close()
+            if cache is not None:
+                cache.close()
+
+    async def execute(self, command: XiaohongshuDownloadImagesCommand) -> Dict[str, str]:
+        """执行图片下载用例
+
+        Args:
+            command: 下载命令
+
+        Returns:
+            URL 和 Word 文件路径的对应关系字典 {url: word_file_path}
+        """
+        logger.info("Starting Xiaohongshu download images use case")
+
+        # 加载 URL 列表（已去重）
+        urls = self._load_urls(command)
+
+        async with self.session(command) as process:
+            # 为每个 URL 生成一个独立的 Word 文档
+            results = await asyncio.gather(
+                *(process(url_index, url, len(urls)) for url_index, url in enumerate(urls, 1))
+            )
+
+        # 按序号还原 URL 顺序，存储 URL 和 Word 文件路径的对应关系
+        url_to_word_file: Dict[str, str] = {}
+        for url_index, word_file in sorted(results):
+            url_to_word_file[urls[url_index - 1]] = word_file
 
         logger.info(f"Generated {len([v for v in url_to_word_file.values() if v])} Word documents")
         return url_to_word_file
 
+    async def _convert_pdfs(
+        self, pdf_queue: asyncio.Queue, converter: WordToPdfConverter, workers: int
+    ) -> Dict[str, str]:
+        """从队列中取出已生成的 Word 文档转换为 PDF，收到 None 时结束
+
+        每次把队列中已积累的文档（最多 PDF_BATCH_SIZE 个）合并为一次转换，
+        转换在线程中执行，不阻塞事件循环。
+
+        Args:
+            pdf_queue: Word 文件路径队列
+            converter: PDF 转换器
+            workers: 并行 LibreOffice 实例数
+
+        Returns:
+            Word 文件路径到 PDF 文件路径的映射
+        """
+        results: Dict[str, str] = {}
+        finished = False
+        while not finished:
+            word_file = await pdf_queue.get()
+            if word_file is None:
+                break
+            batch = [word_file]
+            while len(batch) < self.PDF_BATCH_SIZE and not pdf_queue.empty():
+                word_file = pdf_queue.get_nowait()
+                if word_file is None:
+                    finished = True
+                    break
+                batch.append(word_file)
+
+            # 转换失败不能中断消费，否则文档生成会阻塞在已满的队列上
+            try:
+                if workers > 1 and len(batch) > 1:
+                    converted = await asyncio.to_thread(
+                        converter.convert_many, batch, workers=workers
+                    )
+                else:
+                    converted = await asyncio.to_thread(converter.convert_batch, batch)
+                results.update(converted)
+            except Exception as e:
+                logger.error(f"Failed to convert {len(batch)} documents to PDF: {e}")
+
+        logger.info(f"Converted {len(results)} Word documents to PDF")
+        return results
+
     def _detect_image_format(self, image_data: bytes) -> str:
         """通过文件头检测图片真实格式
 
@@ -275,32 +524,29 @@ class XiaohongshuDownloadImagesUseCase:
         if len(image_data) < 12:
             return "UNKNOWN"
 
-        # 检查文件头（magic bytes）
-        header = image_data[:12]
-
+        # 检查文件头（magic bytes），bytes.startswith 带偏移比较，不产生切片副本
         # JPEG: FF D8 FF
-        if header[:3] == b"\xff\xd8\xff":
+        if image_data.startswith(b"\xff\xd8\xff"):
             return "JPEG"
 
         # PNG: 89 50 4E 47 0D 0A 1A 0A
-        if header[:8] == b"\x89\x50\x4e\x47\x0d\x0a\x1a\x0a":
+        if image_data.startswith(b"\x89\x50\x4e\x47\x0d\x0a\x1a\x0a"):
             return "PNG"
 
         # GIF: 47 49 46 38 (GIF8)
-        if header[:4] == b"\x47\x49\x46\x38":
+        if image_data.startswith(b"\x47\x49\x46\x38"):
             return "GIF"
 
         # BMP: 42 4D (BM)
-        if header[:2] == b"\x42\x4d":
+        if image_data.startswith(b"\x42\x4d"):
             return "BMP"
 
         # WebP: RIFF...WEBP
-        if header[:4] == b"RIFF" and len(image_data) >= 12:
-            if image_data[8:12] == b"WEBP":
-                return "WEBP"
+        if image_data.startswith(b"RIFF") and image_data.startswith(b"WEBP", 8):
+            return "WEBP"
 
         # AVIF: ftyp...avif
-        if header[4:8] in [b"avif", b"avis"]:
+        if image_data.startswith((b"avif", b"avis"), 4):
             return "AVIF"
 
         return "UNKNOWN"
@@ -320,35 +566,139 @@ class XiaohongshuDownloadImagesUseCase:
         # 否则转换为 RGB
         if img.mode in ("RGBA", "LA", "P"):
             # 保持透明通道
-            output = BytesIO()
-            img.save(output, format="PNG")
-        else:
-            # 转换为 RGB 再保存为 PNG
-            rgb_img = img.convert("RGB")
-            output = BytesIO()
-            rgb_img.save(output, format="PNG")
+            return self._encode_image(img, "PNG")
+        # 转换为 RGB 再保存为 PNG
+        return self._encode_image(img.convert("RGB"), "PNG")
+
+    def _encode_image(self, img: Image.Image, format_name: str, **params: Any) -> bytes:
+        """将 PIL 图片编码为指定格式的二进制数据
+
+        复用当前线程的 BytesIO 缓冲区，避免每张图片重新分配和扩容缓冲区。
+
+        Args:
+            img: PIL 图片对象
+            format_name: 输出格式（如 'PNG'、'JPEG'）
+            **params: 传给 Image.save 的编码参数
+
+        Returns:
+            编码后的图片二进制数据
+        """
+        buf = getattr(_encode_buffers, "buf", None)
+        if buf is None:
+            buf = _encode_buffers.buf = BytesIO()
+        buf.seek(0)
+        buf.truncate()
+        img.save(buf, format=format_name, **params)
+        return buf.getvalue()
+
+    def _process_image_sync(
+        self, image_data: bytes, page_dims: Optional[tuple[float, float]] = None
+    ) -> tuple[bytes, Optional[tuple[int, int]]]:
+        """同步处理下载的图片：格式检测与转换、缩小，并解析最终尺寸
+
+        供 asyncio.to_thread 调用，Pillow 解码期间会释放 GIL，多张图片可在线程间并行处理。
+
+        Args:
+            image_data: 原始图片二进制数据
+            page_dims: 页面可用尺寸 (width, height)，单位为英寸
+
+        Returns:
+            (Word 兼容的图片数据, (width, height)) 元组，尺寸解析失败时为 None
+        """
+        image_data = self._ensure_word_compatible_format(image_data, page_dims)
+        try:
+            image_size = self._get_image_size(image_data)
+        except Exception as e:
+            logger.warning(f"Failed to get image size: {e}")
+            image_size = None
+        return image_data, image_size
+
+    def _process_image_file(
+        self, image_path: Path, page_dims: Optional[tuple[float, float]] = None
+    ) -> tuple[str, Optional[tuple[int, int]]]:
+        """同步处理已下载到文件的图片，处理结果写回原文件
+
+        供 asyncio.to_thread 调用，图片数据只在处理期间读入内存。
+
+        Args:
+            image_path: 图片文件路径
+            page_dims: 页面可用尺寸 (width, height)，单位为英寸
+
+        Returns:
+            (图片格式, (width, height)) 元组，尺寸解析失败时为 None
+        """
+        original = image_path.read_bytes()
+        image_data, image_size = self._process_image_sync(original, page_dims)
+        if image_data is not original:
+            image_path.write_bytes(image_data)
+        return self._detect_image_format(image_data), image_size
+
+    def _downscale_image(self, image_data: bytes, target_size: tuple[int, int]) -> bytes:
+        """将图片等比缩小到目标像素尺寸以内
 
-        return output.getvalue()
+        JPEG 先通过 draft() 让 libjpeg 在 DCT 域按 1/2、1/4、1/8 缩放解码，
+        避免生成全分辨率位图；不透明图片重新编码为 JPEG，带透明通道的保存为 PNG。
 
-    def _ensure_word_compatible_format(self, image_data: bytes) -> bytes:
+        Args:
+            image_data: 原始图片二进制数据
+            target_size: 目标最大尺寸 (width, height)，单位为像素
+
+        Returns:
+            缩小后的图片二进制数据
+        """
+        img = Image.open(BytesIO(image_data))
+        if img.format == "JPEG":
+            img.draft("RGB", target_size)
+        img.thumbnail(target_size, Image.Resampling.LANCZOS)
+
+        if img.mode in ("RGBA", "LA", "P"):
+            return self._encode_image(img, "PNG")
+        return self._encode_image(img.convert("RGB"), "JPEG", quality=self.EMBED_JPEG_QUALITY)
+
+    def _ensure_word_compatible_format(
+        self, image_data: bytes, page_dims: Optional[tuple[float, float]] = None
+    ) -> bytes:
         """确保图片格式是 Word 支持的格式，如果不支持则转换为 PNG
 
         Word 支持的格式：JPEG, PNG, GIF, BMP
         不支持的格式：WebP, AVIF 等
 
+        如果提供了页面尺寸，超过打印分辨率（EMBED_DPI）的图片会先被缩小。
+
         Args:
             image_data: 原始图片二进制数据
+            page_dims: 页面可用尺寸 (width, height)，单位为英寸
 
         Returns:
             Word 兼容格式的图片二进制数据
         """
+        if page_dims is not None:
+            target_size = (
+                int(page_dims[0] * self.EMBED_DPI),
+                int(page_dims[1] * self.EMBED_DPI),
+            )
+            try:
+                width_px, height_px = self._get_image_size(image_data)
+                if width_px > target_size[0] or height_px > target_size[1]:
+                    downscaled = self._downscale_image(image_data, target_size)
+                    # 使用参数形式，DEBUG 未启用时跳过格式化
+                    logger.debug(
+                        "Downscaled image from {}x{} ({} -> {} bytes)",
+                        width_px,
+                        height_px,
+                        len(image_data),
+                        len(downscaled),
+                    )
+                    return downscaled
+            except Exception as e:
+                logger.warning(f"Failed to downscale image, keeping original size: {e}")
+
         format_name = self._detect_image_format(image_data)
 
         # Word 支持的格式
         word_supported_formats = {"JPEG", "PNG", "GIF", "BMP"}
 
         if format_name in word_supported_formats:
-            logger.debug(f"Image format {format_name} is Word-compatible, keeping original")
             return image_data
 
         # 不支持的格式，转换为 PNG
@@ -362,132 +712,242 @@ class XiaohongshuDownloadImagesUseCase:
             # 如果转换失败，尝试用 PIL 直接打开并保存
             try:
                 img = Image.open(BytesIO(image_data))
-                output = BytesIO()
-                img.save(output, format="PNG")
-                return output.getvalue()
+                return self._encode_image(img, "PNG")
             except Exception as e2:
                 logger.error(f"Failed to convert image using PIL: {e2}")
                 raise ValueError(f"Cannot convert {format_name} image to PNG") from e2
 
+    def _read_dimensions_from_header(self, image_data: bytes) -> Optional[tuple[int, int]]:
+        """直接从文件头解析图片尺寸，无需 PIL 解码
+
+        支持 JPEG（SOFn 标记）、PNG（IHDR）、GIF（逻辑屏幕描述符）、BMP（信息头）
+        和 WebP（VP8 / VP8L / VP8X 块头）。
+
+        Args:
+            image_data: 图片二进制数据
+
+        Returns:
+            (width, height) 元组，无法解析时返回 None
+        """
+        format_name = self._detect_image_format(image_data)
+
+        try:
+            if format_name == "JPEG":
+                return self._read_jpeg_dimensions(image_data)
+
+            if format_name == "PNG":
+                # IHDR 块紧跟在 8 字节签名和 8 字节块头之后
+                if len(image_data) >= 24 and image_data[12:16] == b"IHDR":
+                    return struct.unpack_from(">II", image_data, 16)
+                return None
+
+            if format_name == "GIF":
+                if len(image_data) >= 10:
+                    return struct.unpack_from("<HH", image_data, 6)
+                return None
+
+            if format_name == "BMP":
+                if len(image_data) < 26:
+                    return None
+                (header_size,) = struct.unpack_from("<I", image_data, 14)
+                if header_size == 12:
+                    # BITMAPCOREHEADER: 16 位宽高
+                    return struct.unpack_from("<HH", image_data, 18)
+                # BITMAPINFOHEADER 及以上: 32 位有符号宽高（高度为负表示自上而下）
+                width, height = struct.unpack_from("<ii", image_data, 18)
+                return abs(width), abs(height)
+
+            if format_name == "WEBP":
+                return self._read_webp_dimensions(image_data)
+        except struct.error:
+            return None
+
+        return None
+
+    def _read_webp_dimensions(self, image_data: bytes) -> Optional[tuple[int, int]]:
+        """从 WebP 的第一个块头读取尺寸
+
+        Args:
+            image_data: WebP 二进制数据
+
+        Returns:
+            (width, height) 元组，块类型未知时返回 None
+        """
+        if len(image_data) < 30:
+            return None
+        chunk = image_data[12:16]
+        if chunk == b"VP8X":
+            # 扩展格式：画布宽高各 24 位，存储值为实际值减 1
+            width = int.from_bytes(image_data[24:27], "little") + 1
+            height = int.from_bytes(image_data[27:30], "little") + 1
+            return width, height
+        if chunk == b"VP8 ":
+            # 有损格式：帧头起始码 9D 01 2A 之后是 14 位宽高
+            if image_data[23:26] != b"\x9d\x01\x2a":
+                return None
+            width, height = struct.unpack_from("<HH", image_data, 26)
+            return width & 0x3FFF, height & 0x3FFF
+        if chunk == b"VP8L":
+            # 无损格式：签名 0x2F 之后的 28 位中依次是 14 位宽、14 位高（各减 1）
+            if image_data[20] != 0x2F:
+                return None
+            (bits,) = struct.unpack_from("<I", image_data, 21)
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        return None
+
+    def _read_jpeg_dimensions(self, image_data: bytes) -> Optional[tuple[int, int]]:
+        """扫描 JPEG 段，从 SOFn 标记中读取尺寸
+
+        按段长度直接跳转，并用 struct.unpack_from 原地读取字段，不复制切片。
+
+        Args:
+            image_data: JPEG 二进制数据
+
+        Returns:
+            (width, height) 元组，未找到 SOF 标记时返回 None
+        """
+        data_len = len(image_data)
+        i = 2  # 跳过 SOI (FF D8)
+        while i + 9 <= data_len:
+            if image_data[i] != 0xFF:
+                return None
+            marker = image_data[i + 1]
+            # 填充字节
+            if marker == 0xFF:
+                i += 1
+                continue
+            # 无长度字段的独立标记（TEM、RSTn）
+            if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+                i += 2
+                continue
+            # SOF0~SOF15，排除 DHT(C4)、JPG(C8)、DAC(CC)
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack_from(">HH", image_data, i + 5)
+                return width, height
+            # 到达图像数据或结束标记仍未找到 SOF
+            if marker in (0xD9, 0xDA):
+                return None
+            (segment_length,) = struct.unpack_from(">H", image_data, i + 2)
+            i += 2 + segment_length
+        return None
+
     def _get_image_size(self, image_data: bytes) -> tuple[int, int]:
         """获取图片尺寸
 
+        优先从文件头直接解析，只有无法解析时才回退到 PIL。
+
         Args:
             image_data: 图片二进制数据
 
         Returns:
             (width, height) 元组
         """
-        img = Image.open(BytesIO(image_data))
-        return img.size
+        dimensions = self._read_dimensions_from_header(image_data)
+        if dimensions is not None:
+            return dimensions
 
-    def _get_page_dimensions(self, doc: Document) -> tuple[float, float]:
-        """获取 Word 页面的可用尺寸（英寸）
+        # Image.open 只解析文件头，不解码像素数据
+        with Image.open(BytesIO(image_data)) as img:
+            return img.size
 
-        Args:
-            doc: Word 文档对象
+    def _get_page_dimensions(self) -> tuple[float, float]:
+        """获取 Word 页面的可用尺寸（英寸）
 
         Returns:
             (width, height) 元组，单位为英寸
         """
-        section = doc.sections[0]
-        # 页面宽度 = 页面总宽度 - 左边距 - 右边距
-        page_width = (
-            section.page_width.inches - section.left_margin.inches - section.right_margin.inches
-        )
-        # 页面高度 = 页面总高度 - 上边距 - 下边距
-        page_height = (
-            section.page_height.inches - section.top_margin.inches - section.bottom_margin.inches
-        )
+        # 页边距为 0，可用尺寸即整页大小
+        return ImageDocxWriter.page_dimensions()
+
+    def _build_document(
+        self,
+        output_path: str,
+        images_with_data: List[Dict[str, Any]],
+        page_dims: tuple[float, float],
+    ) -> None:
+        """将图片依次写入 Word 文档并保存
 
-        return page_width, page_height
+        Args:
+            output_path: 输出的 .docx 文件路径
+            images_with_data: 已排序的图片信息列表
+            page_dims: 页面可用尺寸 (width, height)，单位为英寸
+        """
+        added = 0
+        with ImageDocxWriter(output_path) as doc:
+            for img_info in images_with_data:
+                try:
+                    image_path = img_info["path"]
+                    if image_path.stat().st_size == 0:
+                        logger.warning(f"Image {img_info['index']} data is empty, skipping")
+                        continue
+                    self._add_image_to_document(
+                        doc,
+                        image_path,
+                        img_info["format"],
+                        page_dims,
+                        image_size=img_info.get("size"),
+                    )
+                    added += 1
+                except Exception as e:
+                    logger.error(
+                        f"Error adding image {img_info['index']} to document: "
+                        f"{type(e).__name__}: {str(e)}"
+                    )
+                    logger.exception("Full traceback:")
+                    continue
+        logger.debug("Added {}/{} images to document {}", added, len(images_with_data), output_path)
 
     def _add_image_to_document(
-        self, doc: Document, image_data: bytes, max_width: float = 6.5
+        self,
+        doc: ImageDocxWriter,
+        image_path: Path,
+        image_format: str,
+        page_dims: tuple[float, float],
+        image_size: Optional[tuple[int, int]] = None,
+        max_width: float = 6.5,
     ) -> None:
         """向文档添加图片（居中），图片等比缩放以适配页面大小
 
         图片会等比缩放，使得高度或宽度至少一个和页面大小一样（填满页面）
 
         Args:
-            doc: Word 文档对象
-            image_data: 图片二进制数据
+            doc: Word 文档写入器
+            image_path: 已处理为 Word 兼容格式的图片文件路径
+            image_format: 图片格式（JPEG、PNG、GIF、BMP）
+            page_dims: 页面可用尺寸 (width, height)，单位为英寸，由 _get_page_dimensions 预先计算
+            image_size: 预先解析的图片像素尺寸 (width, height)，为 None 时在此解析
             max_width: 已废弃，保留用于兼容性
 
         Raises:
             Exception: 如果图片处理或添加失败
         """
-        # 验证图片数据
-        if not image_data:
-            raise ValueError("Image data is empty")
-
         # 获取图片尺寸（像素）
-        try:
-            width_px, height_px = self._get_image_size(image_data)
-        except Exception as e:
-            raise ValueError(f"Failed to get image size: {e}") from e
+        if image_size is not None:
+            width_px, height_px = image_size
+        else:
+            try:
+                width_px, height_px = self._get_image_size(image_path.read_bytes())
+            except Exception as e:
+                raise ValueError(f"Failed to get image size: {e}") from e
 
         # 验证尺寸有效性
         if width_px <= 0 or height_px <= 0:
             raise ValueError(f"Invalid image dimensions: {width_px}x{height_px}")
 
-        # 假设图片 DPI 为 96，将像素转换为英寸
-        # 如果图片有 EXIF 信息，可以使用实际 DPI
-        dpi = 96.0
-        width_inches = width_px / dpi
-        height_inches = height_px / dpi
-
-        # 获取页面可用尺寸
-        page_width, page_height = self._get_page_dimensions(doc)
-        logger.debug(f"Page dimensions: {page_width:.2f}x{page_height:.2f} inches")
-        logger.debug(f"Image dimensions: {width_inches:.2f}x{height_inches:.2f} inches")
-
-        # 计算两个缩放比例（按宽度和按高度）
-        scale_by_width = page_width / width_inches
-        scale_by_height = page_height / height_inches
-
-        # 选择较大的缩放比例，这样至少一个维度会填满页面
-        # 同时保持图片的宽高比
-        scale = max(scale_by_width, scale_by_height)
-
-        # 应用缩放比例
-        scaled_width = width_inches * scale
-        scaled_height = height_inches * scale
-
-        # 确保缩放后的尺寸不超过页面大小（理论上不应该超过，但做安全检查）
-        if scaled_width > page_width:
-            # 如果宽度超过，按宽度重新缩放
-            scale = page_width / width_inches
-            scaled_width = page_width
-            scaled_height = height_inches * scale
-            logger.debug(
-                f"Width exceeded page, rescaling by width: {scaled_width:.2f}x{scaled_height:.2f}"
-            )
-        elif scaled_height > page_height:
-            # 如果高度超过，按高度重新缩放
-            scale = page_height / height_inches
-            scaled_width = width_inches * scale
-            scaled_height = page_height
-            logger.debug(
-                f"Height exceeded page, rescaling by height: {scaled_width:.2f}x{scaled_height:.2f}"
-            )
-
-        logger.debug(
-            f"Final scaled image dimensions: {scaled_width:.2f}x{scaled_height:.2f} inches"
-        )
+        # 等比缩放到恰好放入页面：按宽、按高两个比例取较小者，至少一个维度填满页面。
+        # 比例直接由像素计算，像素到英寸的 DPI 换算在比例中相互抵消，无需假设 DPI
+        page_width, page_height = page_dims
+        scale = min(page_width / width_px, page_height / height_px)
+        scaled_width = width_px * scale
+        scaled_height = height_px * scale
 
         # 验证缩放后的尺寸
         if scaled_width <= 0 or scaled_height <= 0:
             raise ValueError(f"Invalid scaled dimensions: {scaled_width}x{scaled_height}")
 
-        # 添加段落并居中
-        para = doc.add_paragraph()
-        para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-        # 添加图片（使用宽度，高度会自动按比例调整）
+        # 添加居中的图片段落
         try:
-            run = para.add_run()
-            run.add_picture(BytesIO(image_data), width=Inches(scaled_width))
+            doc.add_image_file(image_path, image_format, scaled_width, scaled_height)
         except Exception as e:
             raise RuntimeError(f"Failed to add picture to document: {e}") from e
 
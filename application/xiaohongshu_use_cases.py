@@ -3,11 +3,12 @@
 import asyncio
 import json
 import random
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Optional
 from loguru import logger
 
-from domain.value_objects import URL, SearchKeyword
+from domain.value_objects import URL, SearchKeyword, intern_keyword
 from domain.exceptions import DomainError
 from infrastructure.adapters.xiaohongshu_service import XiaohongshuBrowserService
 from application.dto import XiaohongshuBrowseCommand
@@ -18,6 +19,7 @@ class XiaohongshuBrowseUseCase:
 
     XIAOHONGSHU_HOME_URL = "https://www.xiaohongshu.com/"
     DEFAULT_CONFIG_FILE = "config/search_keywords.json"
+    OPENED_LINKS_CAPACITY = 50  # 已打开链接记录的最大条数（LRU 淘汰最早的记录）
 
     def __init__(self, browser_service: XiaohongshuBrowserService):
         self._browser_service = browser_service
@@ -71,7 +73,7 @@ class XiaohongshuBrowseUseCase:
             # 4. 循环搜索词的数量次
             for keyword_str in keywords:
                 try:
-                    keyword = SearchKeyword(keyword_str)
+                    keyword = intern_keyword(keyword_str)
                     await self._browse_keyword(keyword, command)
                 except Exception as e:
                     logger.error(f"Error browsing keyword {keyword_str}: {e}")
@@ -101,7 +103,8 @@ class XiaohongshuBrowseUseCase:
         max_iterations = random.randint(1, 5)
         logger.info(f"Will browse {max_iterations} items")
 
-        opened_links = set()  # 记录已打开的链接，确保不重复
+        # 记录已打开的链接，确保不重复；按 LRU 限制容量，避免整体清空
+        opened_links: OrderedDict[str, None] = OrderedDict()
 
         for iteration in range(max_iterations):
             logger.info(f"Iteration {iteration + 1}/{max_iterations}")
@@ -116,17 +119,15 @@ class XiaohongshuBrowseUseCase:
                 logger.warning("No new visible links to click, scrolling...")
                 # 如果找不到新链接，滚动页面
                 await self._browser_service.scroll_search_results()
-                # 翻页后 #exploreFeeds 会被重写，清空已打开链接记录（新页面内容）
-                # 但保留部分记录以避免在同一页面重复打开
-                if len(opened_links) > 10:  # 如果记录太多，可能是翻页了
-                    logger.info("Possible page turn detected, clearing some link records")
-                    opened_links.clear()
                 await asyncio.sleep(random.uniform(1, 3))
                 continue
 
             # 记录已打开的链接
             if link_id:
-                opened_links.add(link_id)
+                opened_links[link_id] = None
+                opened_links.move_to_end(link_id)
+                if len(opened_links) > self.OPENED_LINKS_CAPACITY:
+                    opened_links.popitem(last=False)
 
             # 等待内容页面加载
             content_loaded = await self._browser_service.wait_for_content_page()
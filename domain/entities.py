@@ -1,7 +1,7 @@
 """实体定义"""
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 import uuid
 
@@ -9,7 +9,26 @@ from domain.value_objects import URL, TaskId, TaskStatus
 from domain.exceptions import TaskStateError
 
 
-@dataclass
+def utc_now() -> datetime:
+    """获取当前 UTC 时间（naive，与数据库 DateTime 列保持一致）
+
+    替代已弃用的 datetime.utcnow()。
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# 状态转换表：动作 -> (允许的当前状态, 目标状态)
+_VALID_TRANSITIONS: dict[str, tuple[frozenset[TaskStatus], TaskStatus]] = {
+    "start": (frozenset({TaskStatus.PENDING}), TaskStatus.RUNNING),
+    "complete": (frozenset({TaskStatus.RUNNING}), TaskStatus.COMPLETED),
+    "fail": (frozenset({TaskStatus.PENDING, TaskStatus.RUNNING}), TaskStatus.FAILED),
+    "cancel": (frozenset({TaskStatus.PENDING, TaskStatus.RUNNING}), TaskStatus.CANCELLED),
+}
+
+_FINISHED_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED})
+
+
+@dataclass(slots=True)
 class CrawlerTask:
     """爬虫任务实体"""
 
@@ -23,10 +42,18 @@ class CrawlerTask:
     metadata: dict = field(default_factory=dict)
 
     @classmethod
-    def create(cls, url: str, metadata: Optional[dict] = None) -> "CrawlerTask":
-        """创建新的爬虫任务"""
+    def create(
+        cls, url: str, metadata: Optional[dict] = None, now: Optional[datetime] = None
+    ) -> "CrawlerTask":
+        """创建新的爬虫任务
+
+        Args:
+            url: 要爬取的 URL
+            metadata: 任务元数据
+            now: 创建时间，批量创建时可由调用方统一计算后传入
+        """
         task_id = TaskId(str(uuid.uuid4()))
-        now = datetime.utcnow()
+        now = now or utc_now()
         return cls(
             id=task_id,
             url=URL(url),
@@ -36,40 +63,51 @@ class CrawlerTask:
             metadata=metadata or {},
         )
 
-    def start(self) -> None:
+    def _transition(self, action: str, now: Optional[datetime] = None) -> None:
+        """按状态转换表校验并切换状态
+
+        Args:
+            action: 转换动作（start、complete、fail、cancel）
+            now: 更新时间，批量处理时可由调用方统一计算后传入
+        """
+        valid_from, to_status = _VALID_TRANSITIONS[action]
+        if self.status not in valid_from:
+            raise TaskStateError(f"Cannot {action} task in {self.status.value} state")
+        self.status = to_status
+        self.updated_at = now or utc_now()
+
+    def start(self, now: Optional[datetime] = None) -> None:
         """启动任务"""
-        if self.status.value != TaskStatus.PENDING:
-            raise TaskStateError(f"Cannot start task in {self.status.value} state")
-        self.status = TaskStatus.running()
-        self.updated_at = datetime.utcnow()
+        self._transition("start", now)
 
-    def complete(self, content: str) -> None:
+    def complete(self, content: str, now: Optional[datetime] = None) -> None:
         """完成任务"""
-        if self.status.value != TaskStatus.RUNNING:
-            raise TaskStateError(f"Cannot complete task in {self.status.value} state")
-        self.status = TaskStatus.completed()
+        self._transition("complete", now)
         self.content = content
-        self.updated_at = datetime.utcnow()
 
-    def fail(self, error_message: str) -> None:
+    def fail(self, error_message: str, now: Optional[datetime] = None) -> None:
         """标记任务失败"""
-        if self.status.value not in [TaskStatus.PENDING, TaskStatus.RUNNING]:
-            raise TaskStateError(f"Cannot fail task in {self.status.value} state")
-        self.status = TaskStatus.failed()
+        self._transition("fail", now)
         self.error_message = error_message
-        self.updated_at = datetime.utcnow()
 
-    def cancel(self) -> None:
+    def cancel(self, now: Optional[datetime] = None) -> None:
         """取消任务"""
-        if self.status.value not in [TaskStatus.PENDING, TaskStatus.RUNNING]:
-            raise TaskStateError(f"Cannot cancel task in {self.status.value} state")
-        self.status = TaskStatus.cancelled()
-        self.updated_at = datetime.utcnow()
+        self._transition("cancel", now)
 
     def is_finished(self) -> bool:
         """检查任务是否已完成（成功或失败）"""
-        return self.status.value in [
-            TaskStatus.COMPLETED,
-            TaskStatus.FAILED,
-            TaskStatus.CANCELLED,
-        ]
+        return self.status in _FINISHED_STATUSES
+
+
+@dataclass(slots=True)
+class TaskSummary:
+    """任务摘要（只读）
+
+    列表查询只需要任务的基本信息，不加载可能很大的 content 和 metadata。
+    """
+
+    id: TaskId
+    url: URL
+    status: TaskStatus
+    created_at: datetime
+    updated_at: datetime
@@ -1,8 +1,8 @@
 """仓储接口定义"""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
-from domain.entities import CrawlerTask
+from typing import AsyncIterator, Optional, List
+from domain.entities import CrawlerTask, TaskSummary
 from domain.value_objects import TaskId
 
 
@@ -14,17 +14,44 @@ class ICrawlerTaskRepository(ABC):
         """保存任务"""
         pass
 
+    @abstractmethod
+    async def save_many(self, tasks: List[CrawlerTask]) -> None:
+        """在同一个事务中批量保存任务"""
+        pass
+
     @abstractmethod
     async def find_by_id(self, task_id: TaskId) -> Optional[CrawlerTask]:
         """根据 ID 查找任务"""
         pass
 
+    @abstractmethod
+    async def find_by_ids(self, task_ids: List[TaskId], limit: int = 100) -> List[CrawlerTask]:
+        """根据多个 ID 一次查找任务，不存在的 ID 会被忽略"""
+        pass
+
     @abstractmethod
     async def find_all(self, limit: int = 100, offset: int = 0) -> List[CrawlerTask]:
-        """查找所有任务"""
+        """查找所有任务（包含完整内容；只需要列表信息时优先使用 find_summaries）"""
         pass
 
     @abstractmethod
     async def find_by_status(self, status: str, limit: int = 100) -> List[CrawlerTask]:
-        """根据状态查找任务"""
+        """根据状态查找任务（包含完整内容；只需要列表信息时优先使用 find_summaries）"""
+        pass
+
+    @abstractmethod
+    async def find_summaries(
+        self, status: Optional[str] = None, limit: int = 100, offset: int = 0
+    ) -> List[TaskSummary]:
+        """查找任务摘要，只读取 ID、URL、状态和时间，不加载内容"""
+        pass
+
+    @abstractmethod
+    def iter_all(self, limit: int = 100, offset: int = 0) -> AsyncIterator[CrawlerTask]:
+        """逐条迭代所有任务，不一次性加载全部结果"""
+        pass
+
+    @abstractmethod
+    def iter_by_status(self, status: str, limit: int = 100) -> AsyncIterator[CrawlerTask]:
+        """逐条迭代指定状态的任务，不一次性加载全部结果"""
         pass
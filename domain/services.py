@@ -1,8 +1,8 @@
 """领域服务定义"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
-from domain.value_objects import URL
+from typing import Dict, Any, Optional, Iterable, List
+from domain.value_objects import URL, parse_url
 
 
 class IBrowserService(ABC):
@@ -26,16 +26,20 @@ class URLNormalizer:
     def normalize(url: str) -> str:
         """标准化 URL"""
         url = url.strip()
-        # 移除末尾的斜杠（可选）
-        if url.endswith("/") and len(url) > 1:
-            url = url[:-1]
+        # 移除末尾的斜杠（可选）；没有斜杠时直接返回，不复制字符串
+        if len(url) > 1 and url[-1] == "/":
+            return url[:-1]
         return url
 
+    @staticmethod
+    def normalize_many(urls: Iterable[str]) -> List[str]:
+        """批量标准化 URL"""
+        normalize = URLNormalizer.normalize
+        return [normalize(url) for url in urls]
+
     @staticmethod
     def is_same_domain(url1: str, url2: str) -> bool:
         """检查两个 URL 是否属于同一域名"""
-        from urllib.parse import urlparse
-
-        domain1 = urlparse(url1).netloc
-        domain2 = urlparse(url2).netloc
+        domain1 = parse_url(url1).netloc
+        domain2 = parse_url(url2).netloc
         return domain1 == domain2
@@ -1,98 +1,179 @@
 """值对象定义"""
 
-from dataclasses import dataclass
-from urllib.parse import urlparse
+import re
+from dataclasses import FrozenInstanceError
+from enum import Enum
+from functools import lru_cache
+from urllib.parse import urlparse, ParseResult
 from domain.exceptions import InvalidURLError
 
+# URL 有效性校验：要求 RFC 3986 的 scheme 和非空 authority（scheme://host...），
+# 只检查这一子集，不做完整解析
+_URL_PATTERN = re.compile(r"\A[a-zA-Z][a-zA-Z0-9+.\-]*://[^\s/?#]+", re.ASCII)
 
-@dataclass(frozen=True)
-class URL:
+
+@lru_cache(maxsize=4096)
+def parse_url(url: str) -> ParseResult:
+    """带缓存的 urlparse，同一 URL 在各处重复解析时直接复用结果"""
+    return urlparse(url)
+
+
+def extract_domain(url: str) -> str:
+    """从 URL 中提取域名（不含端口号）
+
+    Args:
+        url: 完整的 URL
+
+    Returns:
+        域名（如：xiaohongshu.com）
+    """
+    parsed = parse_url(url)
+    domain = parsed.netloc or parsed.path
+    # 移除端口号
+    return domain.split(":", 1)[0]
+
+
+class _StringValueObject:
+    """基于单个字符串的不可变值对象基类
+
+    使用 __slots__ 并预先计算哈希值，避免 dataclass 生成代码和实例 __dict__ 的开销。
+    """
+
+    __slots__ = ("value", "_hash")
+
+    def __init__(self, value: str):
+        self._validate(value)
+        object.__setattr__(self, "value", value)
+        object.__setattr__(self, "_hash", hash(value))
+
+    def _validate(self, value: str) -> None:
+        """校验值（子类按需覆盖）"""
+
+    def __setattr__(self, name: str, value) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __reduce__(self):
+        # 按构造参数重建，copy / deepcopy / pickle 不经过被禁用的 __setattr__
+        return (self.__class__, (self.value,))
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.value == other.value
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(value={self.value!r})"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class URL(_StringValueObject):
     """URL 值对象"""
-    value: str
-    
-    def __post_init__(self):
+
+    __slots__ = ("_domain",)
+
+    def _validate(self, value: str) -> None:
         """验证 URL 格式"""
-        if not self._is_valid(self.value):
-            raise InvalidURLError(f"Invalid URL: {self.value}")
+        if not self._is_valid(value):
+            raise InvalidURLError(f"Invalid URL: {value}")
     
     @staticmethod
     def _is_valid(url: str) -> bool:
-        """检查 URL 是否有效"""
+        """检查 URL 是否有效（包含 scheme 和主机部分）"""
+        return _URL_PATTERN.match(url) is not None
+
+    @property
+    def domain(self) -> str:
+        """域名（不含端口号），首次访问时解析并缓存"""
         try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except Exception:
-            return False
-    
-    def __str__(self) -> str:
-        return self.value
+            return self._domain
+        except AttributeError:
+            domain = extract_domain(self.value)
+            object.__setattr__(self, "_domain", domain)
+            return domain
 
 
-@dataclass(frozen=True)
-class TaskId:
+class TaskId(_StringValueObject):
     """任务 ID 值对象"""
-    value: str
-    
-    def __str__(self) -> str:
-        return self.value
+
+    __slots__ = ()
 
 
-@dataclass(frozen=True)
-class TaskStatus:
-    """任务状态值对象"""
+class TaskStatus(str, Enum):
+    """任务状态值对象
+
+    每个状态只有一个枚举实例，校验和比较都是字典查找或身份比较；
+    继承 str，与对应的字符串值相等。
+    """
+
     PENDING = "pending"
     RUNNING = "running"
     COMPLETED = "completed"
     FAILED = "failed"
     CANCELLED = "cancelled"
-    
-    value: str
-    
-    def __post_init__(self):
-        """验证状态值"""
-        valid_statuses = [
-            self.PENDING,
-            self.RUNNING,
-            self.COMPLETED,
-            self.FAILED,
-            self.CANCELLED,
-        ]
-        if self.value not in valid_statuses:
-            raise ValueError(f"Invalid status: {self.value}")
+
+    @classmethod
+    def _missing_(cls, value):
+        raise ValueError(f"Invalid status: {value}")
     
     def __str__(self) -> str:
         return self.value
     
     @classmethod
     def pending(cls) -> "TaskStatus":
-        return cls(cls.PENDING)
+        return cls.PENDING
     
     @classmethod
     def running(cls) -> "TaskStatus":
-        return cls(cls.RUNNING)
+        return cls.RUNNING
     
     @classmethod
     def completed(cls) -> "TaskStatus":
-        return cls(cls.COMPLETED)
+        return cls.COMPLETED
     
     @classmethod
     def failed(cls) -> "TaskStatus":
-        return cls(cls.FAILED)
+        return cls.FAILED
     
     @classmethod
     def cancelled(cls) -> "TaskStatus":
-        return cls(cls.CANCELLED)
+        return cls.CANCELLED
 
 
-@dataclass(frozen=True)
-class SearchKeyword:
+class SearchKeyword(_StringValueObject):
     """搜索关键词值对象"""
-    value: str
-    
-    def __post_init__(self):
+
+    __slots__ = ()
+
+    def _validate(self, value: str) -> None:
         """验证搜索词"""
-        if not self.value or not self.value.strip():
+        if not value or not value.strip():
             raise ValueError("Search keyword cannot be empty")
     
     def __str__(self) -> str:
         return self.value.strip()
+
+
+@lru_cache(maxsize=1024)
+def intern_keyword(value: str) -> SearchKeyword:
+    """获取搜索关键词值对象，相同的值复用同一个实例（值对象不可变，可以安全共享）"""
+    return SearchKeyword(value)
+
+
+@lru_cache(maxsize=1024)
+def intern_task_id(value: str) -> TaskId:
+    """获取任务 ID 值对象，相同的值复用同一个实例"""
+    return TaskId(value)
+
+
+@lru_cache(maxsize=4096)
+def intern_url(value: str) -> URL:
+    """获取 URL 值对象，相同的值复用同一个实例（跳过重复的格式校验）"""
+    return URL(value)
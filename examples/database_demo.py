@@ -1,84 +1,96 @@
 """数据库操作示例"""
 
 import asyncio
+from collections import defaultdict
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from infrastructure.database.session import AsyncSessionLocal
 from infrastructure.database.init_db import init_database
 from infrastructure.database.models import CrawlerTaskModel
 from infrastructure.repositories import SQLAlchemyCrawlerTaskRepository
-from domain.entities import CrawlerTask
+from domain.entities import CrawlerTask, utc_now
 from domain.value_objects import TaskStatus
 
 
-async def demo_create_task():
+async def demo_create_task(session: AsyncSession):
     """演示创建任务"""
     print("=== 创建任务示例 ===")
     
-    async with AsyncSessionLocal() as session:
-        repo = SQLAlchemyCrawlerTaskRepository(session)
-        
-        # 创建任务
-        task = CrawlerTask.create("https://example.com", metadata={"demo": True})
-        await repo.save(task)
-        
+    repo = SQLAlchemyCrawlerTaskRepository(session)
+    
+    # 批量创建任务，一次事务提交
+    now = utc_now()
+    tasks = [
+        CrawlerTask.create(url, metadata={"demo": True}, now=now)
+        for url in ("https://example.com", "https://example.org")
+    ]
+    await repo.save_many(tasks)
+    
+    for task in tasks:
         print(f"Created task: {task.id}")
         print(f"Status: {task.status}")
         print(f"URL: {task.url}")
 
 
-async def demo_query_tasks():
+async def demo_query_tasks(session: AsyncSession):
     """演示查询任务"""
     print("\n=== 查询任务示例 ===")
     
-    async with AsyncSessionLocal() as session:
-        repo = SQLAlchemyCrawlerTaskRepository(session)
-        
-        # 查询所有任务
-        tasks = await repo.find_all(limit=10)
-        print(f"Found {len(tasks)} tasks")
-        
-        for task in tasks:
-            print(f"  - {task.id}: {task.status.value} - {task.url}")
+    repo = SQLAlchemyCrawlerTaskRepository(session)
+    
+    # 查询所有任务
+    tasks = await repo.find_all(limit=10)
+    print(f"Found {len(tasks)} tasks")
+    
+    for task in tasks:
+        print(f"  - {task.id}: {task.status.value} - {task.url}")
 
 
-async def demo_update_task():
+async def demo_update_task(session: AsyncSession):
     """演示更新任务"""
     print("\n=== 更新任务示例 ===")
     
-    async with AsyncSessionLocal() as session:
-        repo = SQLAlchemyCrawlerTaskRepository(session)
-        
-        # 获取第一个任务
-        tasks = await repo.find_all(limit=1)
-        if not tasks:
-            print("No tasks found")
-            return
-        
-        task = tasks[0]
-        print(f"Original status: {task.status.value}")
-        
-        # 更新任务状态
+    repo = SQLAlchemyCrawlerTaskRepository(session)
+    
+    # 获取第一个任务
+    tasks = await repo.find_all(limit=1)
+    if not tasks:
+        print("No tasks found")
+        return
+    
+    task = tasks[0]
+    print(f"Original status: {task.status.value}")
+    
+    # 更新任务状态（只有待处理的任务可以启动）
+    if task.status is TaskStatus.PENDING:
         task.start()
         await repo.save(task)
-        
-        # 重新查询验证
-        updated_task = await repo.find_by_id(task.id)
-        print(f"Updated status: {updated_task.status.value}")
+    
+    # 重新查询验证
+    updated_task = await repo.find_by_id(task.id)
+    print(f"Updated status: {updated_task.status.value}")
 
 
-async def demo_query_by_status():
+async def demo_query_by_status(session: AsyncSession):
     """演示按状态查询"""
     print("\n=== 按状态查询示例 ===")
     
-    async with AsyncSessionLocal() as session:
-        repo = SQLAlchemyCrawlerTaskRepository(session)
-        
-        # 查询待处理的任务
-        pending_tasks = await repo.find_by_status(TaskStatus.PENDING, limit=10)
-        print(f"Found {len(pending_tasks)} pending tasks")
-        
-        # 查询已完成的任务
-        completed_tasks = await repo.find_by_status(TaskStatus.COMPLETED, limit=10)
-        print(f"Found {len(completed_tasks)} completed tasks")
+    # 一次查询取回多个状态的任务，再按状态分组
+    statuses = [TaskStatus.PENDING.value, TaskStatus.COMPLETED.value]
+    stmt = select(CrawlerTaskModel.id, CrawlerTaskModel.status).where(
+        CrawlerTaskModel.status.in_(statuses)
+    )
+    result = await session.execute(stmt)
+    
+    by_status = defaultdict(list)
+    for task_id, status in result:
+        by_status[status].append(task_id)
+    
+    # 待处理的任务
+    print(f"Found {len(by_status[TaskStatus.PENDING.value])} pending tasks")
+    
+    # 已完成的任务
+    print(f"Found {len(by_status[TaskStatus.COMPLETED.value])} completed tasks")
 
 
 async def main():
@@ -86,13 +98,13 @@ async def main():
     # 初始化数据库
     await init_database()
     
-    # 运行示例
-    await demo_create_task()
-    await demo_query_tasks()
-    await demo_update_task()
-    await demo_query_by_status()
+    # 所有示例共用一个会话
+    async with AsyncSessionLocal() as session:
+        await demo_create_task(session)
+        await demo_query_tasks(session)
+        await demo_update_task(session)
+        await demo_query_by_status(session)
 
 
 if __name__ == "__main__":
     asyncio.run(main())
-
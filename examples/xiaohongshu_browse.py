@@ -1,6 +1,7 @@
 """小红书浏览示例"""
 
 import asyncio
+from infrastructure.adapters.base_browser_service import stop_shared_playwright
 from infrastructure.adapters.xiaohongshu_service import XiaohongshuBrowserService
 from application.xiaohongshu_use_cases import XiaohongshuBrowseUseCase
 from application.dto import XiaohongshuBrowseCommand
@@ -31,6 +32,7 @@ async def main():
     
     finally:
         await browser_service.close()
+        await stop_shared_playwright()
 
 
 if __name__ == "__main__":
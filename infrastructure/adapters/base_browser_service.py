@@ -3,193 +3,85 @@
 import asyncio
 import json
 import random
+import re
 from pathlib import Path
-from typing import Dict, Any, Optional
-from urllib.parse import urlparse
+from typing import Dict, Any, Optional, ClassVar
 from abc import ABC, abstractmethod
-from playwright.async_api import Page, Browser, Locator, Playwright
+from playwright.async_api import Page, Browser, BrowserContext, Locator, Route
 from loguru import logger
 
 from domain.services import IBrowserService
+from domain.value_objects import extract_domain
+from infrastructure.adapters.browser_pool import (  # noqa: F401  stop_shared_playwright 兼容旧的导入路径
+    BrowserPool,
+    get_shared_playwright,
+    stop_shared_playwright,
+)
 from infrastructure.config import settings
 
-
-class BaseBrowserService(IBrowserService, ABC):
-    """基础浏览器服务，提供公共功能"""
-
-    def __init__(
-        self,
-        browser_type: Optional[str] = None,
-        headless: Optional[bool] = None,
-        timeout: Optional[int] = None,
-        cookies_dir: Optional[str] = None,
-        enable_anti_detection: bool = True,
-        enable_cookies_persistence: bool = True,
-    ):
-        """初始化基础浏览器服务
-
-        Args:
-            browser_type: 浏览器类型（chromium, firefox, webkit）
-            headless: 是否无头模式
-            timeout: 超时时间（毫秒）
-            cookies_dir: Cookies 存储目录
-            enable_anti_detection: 是否启用反检测功能
-            enable_cookies_persistence: 是否启用 Cookies 持久化
-        """
-        self._browser_type = browser_type or settings.playwright_browser
-        self._headless = headless if headless is not None else settings.playwright_headless
-        self._timeout = timeout or settings.playwright_timeout
-        self._enable_anti_detection = enable_anti_detection
-        self._enable_cookies_persistence = enable_cookies_persistence
-
-        self._playwright: Optional[Playwright] = None
-        self._browser: Optional[Browser] = None
-        self._page: Optional[Page] = None
-
-        # Cookies 持久化配置
-        if self._enable_cookies_persistence:
-            self._cookies_dir = Path(cookies_dir or "cookies")
-            self._cookies_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Cookies directory: {self._cookies_dir.absolute()}")
-            # 记录已加载的域名，避免重复加载
-            self._loaded_cookie_domains: set[str] = set()
-        else:
-            self._cookies_dir = None
-            self._loaded_cookie_domains = set()
-
-    # ========== 浏览器管理 ==========
-
-    async def _ensure_browser(self) -> Browser:
-        """确保浏览器已启动"""
-        if self._browser is None:
-            from playwright.async_api import async_playwright
-
-            if self._playwright is None:
-                self._playwright = await async_playwright().start()
-
-            browser_class = getattr(self._playwright, self._browser_type)
-
-            # 浏览器启动参数
-            launch_args = self._get_launch_args()
-
-            self._browser = await browser_class.launch(
-                headless=self._headless,
-                args=launch_args,
-                channel=None,  # 使用系统安装的 Chrome（如果可用）
-            )
-            logger.info(f"Browser {self._browser_type} launched")
-
-        return self._browser
-
-    def _get_launch_args(self) -> list[str]:
-        """获取浏览器启动参数
-
-        Returns:
-            启动参数列表
-        """
-        if self._enable_anti_detection:
-            return [
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-web-security",
-                "--disable-features=IsolateOrigins,site-per-process",
-                "--disable-site-isolation-trials",
-                "--disable-infobars",
-                "--disable-notifications",
-                "--disable-popup-blocking",
-                "--start-maximized",
-            ]
-        return []
-
-    @abstractmethod
-    async def _get_page(self) -> Page:
-        """获取页面实例（子类实现）"""
-        pass
-
-    async def close(self) -> None:
-        """关闭浏览器"""
-        if self._page:
-            await self._page.close()
-            self._page = None
-
-        if self._browser:
-            await self._browser.close()
-            self._browser = None
-            logger.info("Browser closed")
-
-        if self._playwright:
-            await self._playwright.stop()
-            self._playwright = None
-            logger.info("Playwright stopped")
-
-        # 清空已加载的域名记录，以便下次启动时重新加载
-        self._loaded_cookie_domains.clear()
-
-    # ========== 反爬虫策略 ==========
-
-    async def _setup_anti_detection(self, page: Page) -> None:
-        """设置反爬虫策略
-
-        Args:
-            page: Playwright 页面对象
-        """
-        if not self._enable_anti_detection:
-            return
-
-        # 1. 设置 HTTP Headers
-        await self._set_anti_detection_headers(page)
-
-        # 2. 注入 JavaScript 脚本
-        await self._inject_anti_detection_scripts(page)
-
-        # 3. 设置额外的上下文选项
-        context = page.context
-        await context.set_extra_http_headers({"Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8"})
-
-    async def _set_anti_detection_headers(self, page: Page) -> None:
-        """设置反检测 HTTP Headers
-
-        Args:
-            page: Playwright 页面对象
-        """
-        common_ua = (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36"
-        )
-
-        await page.set_extra_http_headers(
-            {
-                "User-Agent": common_ua,
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-                "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-                "Accept-Encoding": "gzip, deflate, br, zstd",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-                "Sec-Fetch-Dest": "document",
-                "Sec-Fetch-Mode": "navigate",
-                "Sec-Fetch-Site": "none",
-                "Sec-Fetch-User": "?1",
-                "Cache-Control": "max-age=0",
-            }
-        )
-
-    async def _inject_anti_detection_scripts(self, page: Page) -> None:
-        """注入反检测 JavaScript 脚本
-
-        Args:
-            page: Playwright 页面对象
-        """
-        await page.add_init_script(self._get_anti_detection_script())
-
-    def _get_anti_detection_script(self) -> str:
-        """获取反检测 JavaScript 脚本
-
-        Returns:
-            JavaScript 代码字符串
-        """
-        return """
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads_cookies(data: bytes) -> list:
+    """解析 cookies 文件内容（优先使用 orjson）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_cookies(cookies: list) -> bytes:
+    """序列化 cookies 为 JSON（优先使用 orjson）
+
+    默认输出紧凑格式；配置 cookies_pretty_json 时输出缩进格式，便于调试。
+    """
+    pretty = settings.cookies_pretty_json
+    if orjson is not None:
+        return orjson.dumps(cookies, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(cookies, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(cookies, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# 启用反检测时创建上下文使用的 User-Agent 和请求头
+_ANTI_DETECTION_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36"
+)
+
+_ANTI_DETECTION_HEADERS = {
+    "Accept": (
+        "text/html,application/xhtml+xml,application/xml;q=0.9,"
+        "image/avif,image/webp,image/apng,*/*;q=0.8"
+    ),
+    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br, zstd",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "Cache-Control": "max-age=0",
+}
+
+# JavaScript 行注释（"//" 之前为行首或空白）
+_JS_LINE_COMMENT = re.compile(r"(?:^|\s)//.*$")
+
+
+def _minify_script(script: str) -> str:
+    """去掉 JavaScript 脚本中的注释、缩进和空行，缩小发送给浏览器的数据
+
+    保留换行，不依赖分号自动插入规则；仅用于不含 "//" 字符串的内置脚本。
+    """
+    lines = (_JS_LINE_COMMENT.sub("", line).strip() for line in script.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+# 反检测 JavaScript 脚本，模块加载时构建并压缩一次，按浏览器上下文注入
+_ANTI_DETECTION_SCRIPT = _minify_script("""
             // ========== 反爬虫策略：去除自动化特征 ==========
             
             // 1. 隐藏 webdriver 属性
@@ -334,7 +226,278 @@ class BaseBrowserService(IBrowserService, ABC):
                 }
                 return originalToString.apply(this, arguments);
             };
+        """)
+
+
+class BaseBrowserService(IBrowserService, ABC):
+    """基础浏览器服务，提供公共功能"""
+
+    # 启用反检测时的浏览器启动参数
+    ANTI_DETECTION_LAUNCH_ARGS: ClassVar[tuple[str, ...]] = (
+        "--disable-blink-features=AutomationControlled",
+        "--disable-dev-shm-usage",
+        "--no-sandbox",
+        "--disable-setuid-sandbox",
+        "--disable-web-security",
+        "--disable-features=IsolateOrigins,site-per-process",
+        "--disable-site-isolation-trials",
+        "--disable-infobars",
+        "--disable-notifications",
+        "--disable-popup-blocking",
+        "--start-maximized",
+    )
+
+    # 只获取 HTML 时不需要加载的资源类型
+    BLOCKED_RESOURCE_TYPES: ClassVar[frozenset[str]] = frozenset(
+        {"image", "media", "font", "stylesheet"}
+    )
+
+    def __init__(
+        self,
+        browser_type: Optional[str] = None,
+        headless: Optional[bool] = None,
+        timeout: Optional[int] = None,
+        cookies_dir: Optional[str] = None,
+        enable_anti_detection: bool = True,
+        enable_cookies_persistence: bool = True,
+    ):
+        """初始化基础浏览器服务
+
+        Args:
+            browser_type: 浏览器类型（chromium, firefox, webkit）
+            headless: 是否无头模式
+            timeout: 超时时间（毫秒）
+            cookies_dir: Cookies 存储目录
+            enable_anti_detection: 是否启用反检测功能
+            enable_cookies_persistence: 是否启用 Cookies 持久化
         """
+        self._browser_type = browser_type or settings.playwright_browser
+        self._headless = headless if headless is not None else settings.playwright_headless
+        self._timeout = timeout or settings.playwright_timeout
+        self._enable_anti_detection = enable_anti_detection
+        self._enable_cookies_persistence = enable_cookies_persistence
+        # 配置了用户数据目录时使用持久化上下文，磁盘缓存等跨进程保留
+        self._user_data_dir = settings.playwright_user_data_dir
+
+        self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
+        self._page: Optional[Page] = None
+        # 防止并发调用时重复启动浏览器或重复创建上下文
+        self._browser_lock = asyncio.Lock()
+        self._context_lock = asyncio.Lock()
+
+        # Cookies 持久化配置
+        if self._enable_cookies_persistence:
+            # 目录在首次写入 cookies 时再创建，避免在构造函数中执行阻塞的文件系统调用
+            self._cookies_dir = Path(cookies_dir or "cookies")
+            logger.info(f"Cookies directory: {self._cookies_dir.absolute()}")
+            # 记录已加载的域名，避免重复加载
+            self._loaded_cookie_domains: set[str] = set()
+        else:
+            self._cookies_dir = None
+            self._loaded_cookie_domains = set()
+
+        # 按域名缓存的 cookies 文件内容，修改后标记为脏，关闭时统一写盘
+        self._cookie_cache: dict[str, list[dict]] = {}
+        self._dirty_cookie_domains: set[str] = set()
+        self._cookies_dir_ready = False
+
+    # ========== 浏览器管理 ==========
+
+    async def _ensure_browser(self) -> Browser:
+        """确保浏览器已启动"""
+        if self._browser is not None:
+            return self._browser
+
+        async with self._browser_lock:
+            if self._browser is None:
+                # 从浏览器池获取，有空闲实例时无需重新启动
+                self._browser = await BrowserPool.instance().acquire(
+                    self._browser_type, self._headless, self._get_launch_args()
+                )
+
+        return self._browser
+
+    async def _ensure_context(self) -> BrowserContext:
+        """确保浏览器上下文已创建
+
+        反检测脚本和请求头在上下文上设置一次，之后创建的页面都会自动继承，
+        无需每个页面重复注入。
+        """
+        if self._context is not None:
+            return self._context
+
+        async with self._context_lock:
+            if self._context is not None:
+                return self._context
+
+            # 设置完成后再发布，避免其他协程拿到未完成设置的上下文
+            self._context = await self._create_context()
+
+        return self._context
+
+    async def _create_context(
+        self, storage_state: Optional[Dict[str, Any]] = None
+    ) -> BrowserContext:
+        """创建浏览器上下文并完成超时和反检测设置
+
+        Args:
+            storage_state: 要恢复的存储状态（cookies、localStorage），用于重建上下文时保留登录态；
+                持久化上下文的状态保存在用户数据目录中，忽略此参数
+        """
+        if self._user_data_dir:
+            context = await self._launch_persistent_context()
+        else:
+            browser = await self._ensure_browser()
+            context = await browser.new_context(
+                storage_state=storage_state, **self._get_anti_detection_context_options()
+            )
+        context.set_default_timeout(self._timeout)
+
+        if self._enable_anti_detection:
+            await self._setup_anti_detection(context)
+
+        return context
+
+    async def _launch_persistent_context(self) -> BrowserContext:
+        """以用户数据目录启动持久化上下文
+
+        静态资源的磁盘缓存、cookies 等保存在用户数据目录中，下次运行直接复用。
+        持久化上下文独占浏览器进程，不经过浏览器池；同一目录同时只能被一个服务使用。
+        """
+        playwright = await get_shared_playwright()
+        browser_class = getattr(playwright, self._browser_type)
+        context = await browser_class.launch_persistent_context(
+            self._user_data_dir,
+            headless=self._headless,
+            args=self._get_launch_args(),
+            **self._get_anti_detection_context_options(),
+        )
+        logger.info(
+            f"Browser {self._browser_type} launched with user data dir {self._user_data_dir}"
+        )
+        return context
+
+    async def _rotate_context(self) -> None:
+        """关闭当前上下文并以相同的存储状态新建一个
+
+        长时间运行时 Playwright 会在上下文中累积请求、响应等对象，关闭上下文才会释放；
+        旧上下文中的页面会随之关闭。
+        """
+        async with self._context_lock:
+            old_context = self._context
+            if old_context is None:
+                return
+
+            storage_state = await old_context.storage_state()
+            self._context = None
+            self._page = None
+            await old_context.close()
+
+            self._context = await self._create_context(storage_state)
+            logger.debug("Browser context rotated")
+
+    def _get_launch_args(self) -> list[str]:
+        """获取浏览器启动参数
+
+        Returns:
+            启动参数列表
+        """
+        if self._enable_anti_detection:
+            return list(self.ANTI_DETECTION_LAUNCH_ARGS)
+        return []
+
+    @abstractmethod
+    async def _get_page(self) -> Page:
+        """获取页面实例（子类实现）"""
+        pass
+
+    async def __aenter__(self) -> "BaseBrowserService":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """退出 async with 时关闭浏览器，异常时也能释放页面和上下文"""
+        await self.close()
+
+    async def close(self) -> None:
+        """关闭浏览器"""
+        await self._flush_cookies()
+
+        if self._page:
+            await self._page.close()
+            self._page = None
+
+        if self._context:
+            await self._context.close()
+            self._context = None
+
+        if self._browser:
+            # 归还到浏览器池供后续服务复用，由 stop_shared_playwright 统一关闭
+            await BrowserPool.instance().release(
+                self._browser, self._browser_type, self._headless, self._get_launch_args()
+            )
+            self._browser = None
+
+        # 清空已加载的域名记录，以便下次启动时重新加载
+        self._loaded_cookie_domains.clear()
+
+    # ========== 资源拦截 ==========
+
+    @classmethod
+    async def _block_resource_route(cls, route: Route) -> None:
+        """拦截非文档类资源请求，其余请求正常发送"""
+        if route.request.resource_type in cls.BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    # ========== 反爬虫策略 ==========
+
+    async def _setup_anti_detection(self, context: BrowserContext) -> None:
+        """设置反爬虫策略
+
+        Args:
+            context: Playwright 浏览器上下文
+        """
+        if not self._enable_anti_detection:
+            return
+
+        # HTTP Headers 已在创建上下文时传入（见 _get_anti_detection_context_options）
+        # 注入 JavaScript 脚本
+        await self._inject_anti_detection_scripts(context)
+
+    def _get_anti_detection_context_options(self) -> Dict[str, Any]:
+        """获取反检测的上下文创建参数（User-Agent、语言和 HTTP Headers）
+
+        在创建上下文时一次性传入，无需创建后再单独设置；User-Agent 同时作用于
+        navigator.userAgent，与请求头保持一致。
+
+        Returns:
+            传给 new_context / launch_persistent_context 的参数
+        """
+        if not self._enable_anti_detection:
+            return {}
+        return {
+            "user_agent": _ANTI_DETECTION_USER_AGENT,
+            "locale": "zh-CN",
+            "extra_http_headers": _ANTI_DETECTION_HEADERS,
+        }
+
+    async def _inject_anti_detection_scripts(self, context: BrowserContext) -> None:
+        """注入反检测 JavaScript 脚本
+
+        Args:
+            context: Playwright 浏览器上下文
+        """
+        await context.add_init_script(self._get_anti_detection_script())
+
+    def _get_anti_detection_script(self) -> str:
+        """获取反检测 JavaScript 脚本
+
+        Returns:
+            JavaScript 代码字符串
+        """
+        return _ANTI_DETECTION_SCRIPT
 
     # ========== Cookies 持久化 ==========
 
@@ -347,12 +510,7 @@ class BaseBrowserService(IBrowserService, ABC):
         Returns:
             域名（如：xiaohongshu.com）
         """
-        parsed = urlparse(url)
-        domain = parsed.netloc or parsed.path
-        # 移除端口号
-        if ":" in domain:
-            domain = domain.split(":")[0]
-        return domain
+        return extract_domain(url)
 
     def _get_cookies_file_path(self, domain: str) -> Path:
         """获取指定域名的 cookies 文件路径
@@ -385,17 +543,8 @@ class BaseBrowserService(IBrowserService, ABC):
             logger.debug(f"Cookies for domain {domain} already loaded, skipping")
             return
 
-        cookies_file = self._get_cookies_file_path(domain)
-
-        if not cookies_file.exists():
-            logger.debug(f"Cookies file not found for domain {domain}: {cookies_file}")
-            # 即使文件不存在，也标记为已尝试加载，避免重复检查
-            self._loaded_cookie_domains.add(domain)
-            return
-
         try:
-            with open(cookies_file, "r", encoding="utf-8") as f:
-                cookies = json.load(f)
+            cookies = await self._read_cookies(domain)
 
             if cookies:
                 # 确保 cookies 包含必要的字段
@@ -410,85 +559,82 @@ class BaseBrowserService(IBrowserService, ABC):
             else:
                 logger.debug(f"No cookies to load for domain {domain}")
                 self._loaded_cookie_domains.add(domain)
-        except json.JSONDecodeError as e:
-            logger.warning(f"Invalid JSON in cookies file {cookies_file}: {e}")
-            self._loaded_cookie_domains.add(domain)
         except Exception as e:
             logger.error(f"Failed to load cookies for domain {domain}: {e}")
             # 即使加载失败，也标记为已尝试，避免重复尝试
             self._loaded_cookie_domains.add(domain)
 
-    def _is_cookie_related_to_domain(self, cookie_domain: str, target_domain: str) -> bool:
-        """判断 cookie 是否与目标域名相关
+    async def _read_cookies(self, domain: str) -> list[dict]:
+        """读取指定域名已保存的 cookies，优先使用内存缓存
+
+        文件在工作线程中读取，不阻塞事件循环；文件不存在或内容无效时返回空列表。
 
         Args:
-            cookie_domain: Cookie 的域名（可能以 . 开头，如 .xiaohongshu.com）
-            target_domain: 目标域名（如 www.xiaohongshu.com）
+            domain: 域名
 
         Returns:
-            True: Cookie 与目标域名相关, False: 不相关
+            cookies 列表
         """
-        if not cookie_domain:
-            return False
+        if domain in self._cookie_cache:
+            return self._cookie_cache[domain]
 
-        # 移除开头的点（如果有）
-        cookie_domain_clean = cookie_domain.lstrip(".")
-        target_domain_clean = target_domain.lstrip(".")
+        cookies_file = self._get_cookies_file_path(domain)
+        cookies: list[dict] = []
+        try:
+            data = await asyncio.to_thread(cookies_file.read_bytes)
+            cookies = _loads_cookies(data)
+        except FileNotFoundError:
+            logger.debug(f"Cookies file not found for domain {domain}: {cookies_file}")
+        except ValueError as e:
+            logger.warning(f"Invalid JSON in cookies file {cookies_file}: {e}")
 
-        # 完全匹配
-        if cookie_domain_clean == target_domain_clean:
-            return True
+        self._cookie_cache[domain] = cookies
+        return cookies
 
-        # Cookie 域名是目标域名的父域名（如 .xiaohongshu.com 匹配 www.xiaohongshu.com）
-        if cookie_domain.startswith(".") and target_domain_clean.endswith(cookie_domain_clean):
-            return True
+    async def _ensure_cookies_dir(self) -> None:
+        """确保 Cookies 存储目录存在（只在工作线程中创建一次）"""
+        if not self._cookies_dir_ready:
+            await asyncio.to_thread(self._cookies_dir.mkdir, parents=True, exist_ok=True)
+            self._cookies_dir_ready = True
 
-        # Cookie 域名是目标域名的子域名（如 sub.xiaohongshu.com 匹配 xiaohongshu.com）
-        if target_domain_clean.endswith("." + cookie_domain_clean):
-            return True
+    async def _flush_cookies(self) -> None:
+        """将内存中修改过的 cookies 写入文件"""
+        if self._dirty_cookie_domains:
+            await self._ensure_cookies_dir()
 
-        # Cookie 域名包含目标域名（如 xiaohongshu.com 匹配 www.xiaohongshu.com）
-        if cookie_domain_clean in target_domain_clean or target_domain_clean in cookie_domain_clean:
-            return True
+        while self._dirty_cookie_domains:
+            domain = self._dirty_cookie_domains.pop()
+            cookies_file = self._get_cookies_file_path(domain)
+            try:
+                data = _dumps_cookies(self._cookie_cache[domain])
+                await asyncio.to_thread(cookies_file.write_bytes, data)
+                logger.debug(f"Flushed cookies for domain {domain} to {cookies_file}")
+            except Exception as e:
+                logger.error(f"Failed to write cookies for domain {domain}: {e}")
 
-        return False
+    async def _save_cookies(self, page: Page, domain: str, flush: bool = False) -> None:
+        """保存指定域名的 cookies（包括父域名上的 cookies）
 
-    async def _save_cookies(self, page: Page, domain: str) -> None:
-        """保存指定域名的 cookies（包括所有相关域名的 cookies）
+        合并结果先写入内存缓存，关闭浏览器时统一写盘。
 
         Args:
             page: Playwright 页面对象
             domain: 域名
+            flush: 是否立即写盘（如登录成功后）
         """
         if not self._enable_cookies_persistence:
             return
 
         try:
-            # 获取 context 中的所有 cookies（包括所有域名）
-            all_cookies = await page.context.cookies()
-
-            if not all_cookies:
-                logger.debug(f"No cookies found in context for domain {domain}")
-                return
-
-            # 过滤出与当前域名相关的 cookies
-            # 包括：当前域名、父域名（如 .xiaohongshu.com）、子域名
-            related_cookies = []
-            for cookie in all_cookies:
-                cookie_domain = cookie.get("domain", "")
-                if self._is_cookie_related_to_domain(cookie_domain, domain):
-                    related_cookies.append(cookie)
+            # 只获取会发送给该域名的 cookies（当前域名和父域名，如 .xiaohongshu.com），
+            # 由浏览器按 URL 过滤，无需取回全部 cookies 再逐个匹配
+            related_cookies = await page.context.cookies(
+                urls=[f"https://{domain}", f"http://{domain}"]
+            )
 
             if related_cookies:
-                cookies_file = self._get_cookies_file_path(domain)
                 # 合并已存在的 cookies（如果有）
-                existing_cookies = []
-                if cookies_file.exists():
-                    try:
-                        with open(cookies_file, "r", encoding="utf-8") as f:
-                            existing_cookies = json.load(f)
-                    except Exception as e:
-                        logger.warning(f"Failed to load existing cookies: {e}")
+                existing_cookies = await self._read_cookies(domain)
 
                 # 合并 cookies：以 name + domain + path 作为唯一标识
                 cookie_key = lambda c: (c.get("name", ""), c.get("domain", ""), c.get("path", ""))
@@ -500,8 +646,10 @@ class BaseBrowserService(IBrowserService, ABC):
 
                 # 保存合并后的 cookies
                 merged_cookies = list(existing_dict.values())
-                with open(cookies_file, "w", encoding="utf-8") as f:
-                    json.dump(merged_cookies, f, indent=2, ensure_ascii=False)
+                self._cookie_cache[domain] = merged_cookies
+                self._dirty_cookie_domains.add(domain)
+                if flush:
+                    await self._flush_cookies()
                 logger.info(
                     f"Saved {len(merged_cookies)} cookies for domain {domain} "
                     f"(merged {len(existing_cookies)} existing + {len(related_cookies)} new)"
@@ -525,35 +673,54 @@ class BaseBrowserService(IBrowserService, ABC):
             end_x: 结束 X 坐标
             end_y: 结束 Y 坐标
         """
-        # 使用贝塞尔曲线生成自然的鼠标轨迹
+        # 使用贝塞尔曲线生成自然的鼠标轨迹，先算好全部坐标，循环中只发送移动事件
         steps = random.randint(20, 40)  # 移动步数
-        control_point_1_x = start_x + (end_x - start_x) * random.uniform(0.2, 0.4)
-        control_point_1_y = start_y + (end_y - start_y) * random.uniform(0.2, 0.4)
-        control_point_2_x = start_x + (end_x - start_x) * random.uniform(0.6, 0.8)
-        control_point_2_y = start_y + (end_y - start_y) * random.uniform(0.6, 0.8)
+        path = self._bezier_path(start_x, start_y, end_x, end_y, steps)
+        # 每步之间的延迟也一次性生成
+        uniform = random.uniform
+        delays = [uniform(0.001, 0.003) for _ in range(steps)]
+        for (x, y), delay in zip(path, delays):
+            await page.mouse.move(x, y)
+            await asyncio.sleep(delay)
 
+    @staticmethod
+    def _bezier_path(
+        start_x: float, start_y: float, end_x: float, end_y: float, steps: int
+    ) -> list[tuple[float, float]]:
+        """生成带随机抖动的三次贝塞尔曲线轨迹坐标
+
+        Args:
+            start_x: 起始 X 坐标
+            start_y: 起始 Y 坐标
+            end_x: 结束 X 坐标
+            end_y: 结束 Y 坐标
+            steps: 轨迹点数量
+
+        Returns:
+            [(x, y), ...] 坐标列表
+        """
+        dx = end_x - start_x
+        dy = end_y - start_y
+        control_point_1_x = start_x + dx * random.uniform(0.2, 0.4)
+        control_point_1_y = start_y + dy * random.uniform(0.2, 0.4)
+        control_point_2_x = start_x + dx * random.uniform(0.6, 0.8)
+        control_point_2_y = start_y + dy * random.uniform(0.6, 0.8)
+
+        uniform = random.uniform
+        points = []
         for i in range(steps):
             t = i / steps
-            # 三次贝塞尔曲线公式
-            x = (
-                (1 - t) ** 3 * start_x
-                + 3 * (1 - t) ** 2 * t * control_point_1_x
-                + 3 * (1 - t) * t**2 * control_point_2_x
-                + t**3 * end_x
-            )
-            y = (
-                (1 - t) ** 3 * start_y
-                + 3 * (1 - t) ** 2 * t * control_point_1_y
-                + 3 * (1 - t) * t**2 * control_point_2_y
-                + t**3 * end_y
-            )
-
+            u = 1 - t
+            # 三次贝塞尔曲线的四个基函数，x、y 共用
+            b0 = u * u * u
+            b1 = 3 * u * u * t
+            b2 = 3 * u * t * t
+            b3 = t * t * t
+            x = b0 * start_x + b1 * control_point_1_x + b2 * control_point_2_x + b3 * end_x
+            y = b0 * start_y + b1 * control_point_1_y + b2 * control_point_2_y + b3 * end_y
             # 添加随机抖动，使轨迹更自然
-            x += random.uniform(-2, 2)
-            y += random.uniform(-2, 2)
-
-            await page.mouse.move(x, y)
-            await asyncio.sleep(random.uniform(0.001, 0.003))  # 每步之间的延迟
+            points.append((x + uniform(-2, 2), y + uniform(-2, 2)))
+        return points
 
     async def _simulate_human_typing(
         self, element: Locator, text: str, typing_speed: float = 0.1
@@ -568,9 +735,22 @@ class BaseBrowserService(IBrowserService, ABC):
         await element.click()
         await asyncio.sleep(random.uniform(0.1, 0.3))
 
-        for char in text:
-            await element.type(char, delay=random.uniform(typing_speed * 0.5, typing_speed * 1.5))
-            # 偶尔停顿（模拟思考）
-            if random.random() < 0.1:  # 10% 概率
+        if not text:
+            return
+
+        # 预先选出约 10% 的停顿位置（模拟思考），把文本切成若干段；
+        # 每段一次 type 调用，由浏览器按 delay 逐字输入，避免每个字符一次往返
+        pause_count = int(len(text) * 0.1)
+        pause_indexes = sorted(
+            random.sample(range(1, len(text)), k=min(pause_count, len(text) - 1))
+        )
+
+        start = 0
+        for end in [*pause_indexes, len(text)]:
+            # Playwright 的 delay 单位为毫秒
+            delay_ms = random.uniform(typing_speed * 0.5, typing_speed * 1.5) * 1000
+            await element.type(text[start:end], delay=delay_ms)
+            if end < len(text):
                 await asyncio.sleep(random.uniform(0.2, 0.5))
+            start = end
 
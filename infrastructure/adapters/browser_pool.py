@@ -0,0 +1,156 @@
+"""浏览器实例池"""
+
+import asyncio
+from typing import Dict, List, Optional, Tuple
+from playwright.async_api import Browser, Playwright
+from loguru import logger
+
+from infrastructure.config import settings
+
+
+# 进程内共享的 Playwright 实例，按事件循环区分（Playwright 连接绑定在创建它的事件循环上）
+_shared_playwright: Optional[Playwright] = None
+_shared_playwright_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_playwright_lock: Optional[asyncio.Lock] = None
+
+
+async def get_shared_playwright() -> Playwright:
+    """获取共享的 Playwright 实例，不存在时启动
+
+    多个浏览器服务复用同一个 Playwright 驱动进程，避免每个服务都启动一次。
+    """
+    global _shared_playwright, _shared_playwright_loop, _shared_playwright_lock
+
+    loop = asyncio.get_running_loop()
+    if _shared_playwright_loop is not loop:
+        # 新的事件循环（如再次调用 asyncio.run），旧实例已不可用
+        _shared_playwright = None
+        _shared_playwright_loop = loop
+        _shared_playwright_lock = asyncio.Lock()
+
+    async with _shared_playwright_lock:
+        if _shared_playwright is None:
+            from playwright.async_api import async_playwright
+
+            _shared_playwright = await async_playwright().start()
+            logger.info("Playwright started")
+
+    return _shared_playwright
+
+
+async def stop_shared_playwright() -> None:
+    """关闭池中的浏览器并停止共享的 Playwright 实例
+
+    在程序结束前、所有浏览器服务关闭后调用。
+    """
+    global _shared_playwright
+
+    if _shared_playwright_loop is not asyncio.get_running_loop():
+        _shared_playwright = None
+        return
+
+    await BrowserPool.instance().close_all()
+    if _shared_playwright is not None:
+        await _shared_playwright.stop()
+        logger.info("Playwright stopped")
+    _shared_playwright = None
+
+
+# (浏览器类型, 是否无头, 启动参数)
+BrowserKey = Tuple[str, bool, Tuple[str, ...]]
+
+
+class BrowserPool:
+    """浏览器实例池
+
+    浏览器服务关闭时把浏览器归还到池中而不是关闭，之后创建的服务直接复用，
+    避免每次都冷启动浏览器。按启动配置区分实例，每种配置最多保留 max_idle 个空闲浏览器。
+    """
+
+    _instance: Optional["BrowserPool"] = None
+    _instance_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def __init__(self, max_idle: int):
+        """初始化浏览器池
+
+        Args:
+            max_idle: 每种启动配置最多保留的空闲浏览器数量
+        """
+        self._max_idle = max_idle
+        self._idle: Dict[BrowserKey, List[Browser]] = {}
+
+    @classmethod
+    def instance(cls) -> "BrowserPool":
+        """获取当前事件循环的浏览器池"""
+        loop = asyncio.get_running_loop()
+        if cls._instance is None or cls._instance_loop is not loop:
+            cls._instance = cls(settings.browser_pool_size)
+            cls._instance_loop = loop
+        return cls._instance
+
+    async def acquire(
+        self, browser_type: str, headless: bool, launch_args: List[str]
+    ) -> Browser:
+        """获取浏览器：优先复用空闲实例，没有时启动新的
+
+        Args:
+            browser_type: 浏览器类型（chromium, firefox, webkit）
+            headless: 是否无头模式
+            launch_args: 浏览器启动参数
+
+        Returns:
+            浏览器实例
+        """
+        key = (browser_type, headless, tuple(launch_args))
+        idle = self._idle.get(key)
+        while idle:
+            browser = idle.pop()
+            if browser.is_connected():
+                logger.debug(f"Reusing pooled {browser_type} browser")
+                return browser
+
+        playwright = await get_shared_playwright()
+        browser_class = getattr(playwright, browser_type)
+        browser = await browser_class.launch(
+            headless=headless,
+            args=launch_args,
+            channel=None,  # 使用系统安装的 Chrome（如果可用）
+        )
+        logger.info(f"Browser {browser_type} launched")
+        return browser
+
+    async def release(
+        self, browser: Browser, browser_type: str, headless: bool, launch_args: List[str]
+    ) -> None:
+        """归还浏览器，空闲实例已满或浏览器已断开时直接关闭
+
+        Args:
+            browser: 要归还的浏览器实例
+            browser_type: 浏览器类型
+            headless: 是否无头模式
+            launch_args: 浏览器启动参数
+        """
+        if not browser.is_connected():
+            return
+
+        idle = self._idle.setdefault((browser_type, headless, tuple(launch_args)), [])
+        if len(idle) < self._max_idle:
+            idle.append(browser)
+            logger.debug(f"Browser {browser_type} returned to pool")
+            return
+
+        await browser.close()
+        logger.info("Browser closed")
+
+    async def close_all(self) -> None:
+        """关闭池中所有空闲浏览器"""
+        idle_lists = list(self._idle.values())
+        self._idle.clear()
+        for idle in idle_lists:
+            for browser in idle:
+                try:
+                    await browser.close()
+                except Exception as e:
+                    logger.warning(f"Failed to close pooled browser: {e}")
+        if idle_lists:
+            logger.info("Browser pool closed")
@@ -1,16 +1,22 @@
 """Playwright 浏览器服务适配器"""
 
-from typing import Dict, Any, Optional
+import asyncio
+import httpx
+from typing import Dict, Any, Optional, List, Union
 from playwright.async_api import Page
 from loguru import logger
 
 from domain.value_objects import URL
 from infrastructure.adapters.base_browser_service import BaseBrowserService
+from infrastructure.config import settings
 
 
 class PlaywrightBrowserService(BaseBrowserService):
     """Playwright 浏览器服务实现（通用爬虫）"""
 
+    # 这些选项需要真实浏览器执行，不能走 HTTP 直连
+    BROWSER_ONLY_OPTIONS = frozenset({"execute_script", "wait_for_selector", "viewport"})
+
     def __init__(
         self,
         browser_type: Optional[str] = None,
@@ -19,6 +25,10 @@ class PlaywrightBrowserService(BaseBrowserService):
         cookies_dir: Optional[str] = None,
         enable_anti_detection: bool = False,  # 默认不启用反检测（通用爬虫）
         enable_cookies_persistence: bool = False,  # 默认不启用 cookies 持久化
+        pool_size: int = 8,
+        max_per_domain: int = 3,
+        block_resources: bool = True,
+        engine: str = "playwright",
     ):
         """初始化 Playwright 浏览器服务
 
@@ -29,6 +39,14 @@ class PlaywrightBrowserService(BaseBrowserService):
             cookies_dir: Cookies 存储目录
             enable_anti_detection: 是否启用反检测（默认 False）
             enable_cookies_persistence: 是否启用 Cookies 持久化（默认 False）
+            pool_size: 页面池大小，即最多同时打开的页面数（全局并发上限）
+            max_per_domain: 同一域名的最大并发爬取数
+            block_resources: 是否默认拦截图片、媒体、字体和样式表请求
+                （可通过 options["block_resources"] 或 options["load_media"] 按次覆盖）
+            engine: 默认的抓取方式（可通过 options["engine"] 按次覆盖）
+                - "playwright": 始终使用浏览器渲染
+                - "http": 直接发送 HTTP 请求获取原始 HTML，不执行 JavaScript
+                - "auto": 选项不需要浏览器时使用 HTTP，否则使用浏览器
         """
         super().__init__(
             browser_type=browser_type,
@@ -39,30 +57,194 @@ class PlaywrightBrowserService(BaseBrowserService):
             enable_cookies_persistence=enable_cookies_persistence,
         )
 
+        # 页面池：页面用完后归还复用，避免每次爬取都新建和关闭页面
+        self._pool_size = pool_size
+        self._page_pool: asyncio.Queue[Page] = asyncio.Queue()
+        self._pool_created = 0
+        # 已借出或正在等待页面的调用数，为 0 时才能安全地重建上下文
+        self._pages_in_use = 0
+
+        # 当前上下文已服务的爬取次数，达到上限且页面全部空闲时重建上下文
+        self._context_uses = 0
+        self._rotation_lock = asyncio.Lock()
+
+        # 每个域名单独限制并发，避免对同一站点请求过于密集
+        self._max_per_domain = max_per_domain
+        self._domain_semaphores: dict[str, asyncio.Semaphore] = {}
+
+        # 资源拦截：记录当前已注册拦截路由的页面
+        self._block_resources = block_resources
+        self._blocking_pages: set[Page] = set()
+
+        # HTTP 直连：静态页面无需启动浏览器，客户端在首次使用时创建
+        self._engine = engine
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    async def _set_resource_blocking(self, page: Page, block: bool) -> None:
+        """按需为页面注册或移除资源拦截路由（池中页面保留上次的设置）"""
+        if block and page not in self._blocking_pages:
+            await page.route("**/*", self._block_resource_route)
+            self._blocking_pages.add(page)
+        elif not block and page in self._blocking_pages:
+            await page.unroute("**/*", self._block_resource_route)
+            self._blocking_pages.discard(page)
+
     async def _get_page(self) -> Page:
-        """获取页面实例（每次创建新页面）"""
-        browser = await self._ensure_browser()
-        page = await browser.new_page()
+        """从页面池获取页面实例
+
+        池中没有空闲页面且未达到池大小时，在共享上下文中新建页面
+        （超时和反检测设置继承自上下文）；否则等待其他爬取归还页面。
+        """
+        async with self._rotation_lock:
+            if (
+                self._context_uses >= settings.playwright_pages_per_context
+                and self._pages_in_use == 0
+            ):
+                # 没有借出或等待中的页面，重建上下文释放累积的对象（旧页面随上下文关闭）
+                await self._rotate_context()
+                self._page_pool = asyncio.Queue()
+                self._pool_created = 0
+                self._blocking_pages.clear()
+                self._context_uses = 0
+            self._context_uses += 1
+            # 在锁内登记：已被唤醒但尚未取出页面的调用方也计入，轮换不会替换它等待的页面池
+            self._pages_in_use += 1
+
+        try:
+            if self._page_pool.empty() and self._pool_created < self._pool_size:
+                self._pool_created += 1
+                try:
+                    context = await self._ensure_context()
+                    return await context.new_page()
+                except Exception:
+                    self._pool_created -= 1
+                    raise
+            return await self._page_pool.get()
+        except BaseException:
+            self._pages_in_use -= 1
+            raise
+
+    async def _release_page(self, page: Page) -> None:
+        """将页面重置为空白页后归还页面池，重置失败时关闭页面"""
+        try:
+            await page.goto("about:blank")
+        except Exception as e:
+            logger.warning(f"Failed to reset pooled page, discarding it: {e}")
+            self._pool_created -= 1
+            self._blocking_pages.discard(page)
+            try:
+                await page.close()
+            except Exception:
+                pass
+            return
+        finally:
+            self._pages_in_use -= 1
+        self._page_pool.put_nowait(page)
+
+    def _use_http(self, options: Dict[str, Any]) -> bool:
+        """判断本次爬取是否可以直接发送 HTTP 请求"""
+        engine = options.get("engine", self._engine)
+        if engine == "http":
+            return True
+        if engine != "auto":
+            return False
+        # 反检测和 cookies 持久化都依赖浏览器上下文
+        return (
+            not self._enable_anti_detection
+            and not self._enable_cookies_persistence
+            and self.BROWSER_ONLY_OPTIONS.isdisjoint(options)
+        )
 
-        # 设置超时
-        page.set_default_timeout(self._timeout)
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """获取共享的 HTTP 客户端（keep-alive 连接池）"""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=self._timeout / 1000,
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=100),
+            )
+        return self._http_client
 
-        # 如果启用反检测，设置反爬虫策略
-        if self._enable_anti_detection:
-            await self._setup_anti_detection(page)
+    async def _fetch_http(self, url: URL, options: Dict[str, Any]) -> str:
+        """直接请求 URL 获取原始 HTML（不执行 JavaScript）"""
+        headers = {"User-Agent": options["user_agent"]} if "user_agent" in options else None
+        logger.info(f"Fetching {url.value} over HTTP")
+        response = await self._get_http_client().get(url.value, headers=headers)
+        response.raise_for_status()
+        logger.info(f"Successfully crawled {url.value}")
+        return response.text
 
-        return page
+    async def close(self) -> None:
+        """关闭浏览器（池中的页面随上下文一起关闭）"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        self._page_pool = asyncio.Queue()
+        self._pool_created = 0
+        self._pages_in_use = 0
+        self._blocking_pages.clear()
+        self._context_uses = 0
+        await super().close()
 
     async def crawl(
         self,
         url: URL,
         options: Optional[Dict[str, Any]] = None,
     ) -> str:
-        """爬取指定 URL 的内容"""
+        """爬取指定 URL 的内容
+
+        可以并发调用：全局并发数受页面池大小限制，同一域名的并发数受 max_per_domain 限制。
+        """
         options = options or {}
+        domain = url.domain
+        semaphore = self._domain_semaphores.get(domain)
+        if semaphore is None:
+            semaphore = self._domain_semaphores[domain] = asyncio.Semaphore(self._max_per_domain)
+
+        async with semaphore:
+            if self._use_http(options):
+                return await self._fetch_http(url, options)
+            return await self._crawl_page(url, options)
+
+    async def crawl_many(
+        self,
+        urls: List[URL],
+        options: Optional[Dict[str, Any]] = None,
+        max_concurrency: int = 5,
+    ) -> List[Union[str, BaseException]]:
+        """并发爬取多个 URL
+
+        所有 URL 共用同一个浏览器和页面池，最多同时爬取 max_concurrency 个，
+        同时仍受页面池大小和每个域名的并发限制。
+
+        Args:
+            urls: 要爬取的 URL 列表
+            options: 爬取选项，同 crawl
+            max_concurrency: 本批次的最大并发数
+
+        Returns:
+            与 urls 顺序一致的结果列表，成功为页面内容，失败为对应的异常
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _worker(url: URL) -> str:
+            async with semaphore:
+                return await self.crawl(url, options)
+
+        return await asyncio.gather(*(_worker(url) for url in urls), return_exceptions=True)
+
+    async def _crawl_page(self, url: URL, options: Dict[str, Any]) -> str:
+        """使用池中的页面爬取指定 URL 的内容"""
         page = await self._get_page()
+        custom_user_agent = not self._enable_anti_detection and "user_agent" in options
 
         try:
+            # 拦截图片、字体等资源（可选），只需要 HTML 时可显著减少流量和加载时间
+            block = options.get("block_resources", self._block_resources)
+            if "load_media" in options:
+                block = not options["load_media"]
+            await self._set_resource_blocking(page, block)
+
             # 设置视口大小（可选）
             if "viewport" in options:
                 await page.set_viewport_size(options["viewport"])
@@ -70,12 +252,12 @@ class PlaywrightBrowserService(BaseBrowserService):
                 await page.set_viewport_size({"width": 1920, "height": 1080})
 
             # 设置 User-Agent（可选，如果未启用反检测）
-            if not self._enable_anti_detection and "user_agent" in options:
+            if custom_user_agent:
                 await page.set_extra_http_headers({"User-Agent": options["user_agent"]})
 
             # 加载 cookies（如果启用）
             if self._enable_cookies_persistence:
-                domain = self._get_domain_from_url(url.value)
+                domain = url.domain
                 await self._load_cookies(page, domain)
 
             # 导航到 URL
@@ -92,7 +274,7 @@ class PlaywrightBrowserService(BaseBrowserService):
 
             # 保存 cookies（如果启用）
             if self._enable_cookies_persistence:
-                domain = self._get_domain_from_url(url.value)
+                domain = url.domain
                 await self._save_cookies(page, domain)
 
             # 获取页面内容
@@ -102,5 +284,11 @@ class PlaywrightBrowserService(BaseBrowserService):
             return content
 
         finally:
-            await page.close()
+            # 页面会被复用，清除本次设置的页面级请求头
+            if custom_user_agent:
+                try:
+                    await page.set_extra_http_headers({})
+                except Exception:
+                    pass
+            await self._release_page(page)
 
@@ -2,17 +2,134 @@
 
 import asyncio
 import random
-from typing import Dict, Any, Optional, List
-from playwright.async_api import Page, Locator
+from pathlib import Path
+from urllib.parse import urljoin
+from typing import Dict, Any, Optional, List, Container
+from playwright.async_api import (
+    BrowserContext,
+    ElementHandle,
+    Page,
+    Locator,
+    TimeoutError as PlaywrightTimeoutError,
+)
 from loguru import logger
 
 from domain.value_objects import URL, SearchKeyword
 from infrastructure.adapters.base_browser_service import BaseBrowserService
+from infrastructure.config import settings
+
+
+# 未登录时页面上显示的登录弹窗
+LOGIN_CONTAINER_SELECTOR = ".login-container"
+
+# 页面渲染完成的标志：首页信息流 / 内容详情，或者登录弹窗
+FEEDS_OR_LOGIN_SELECTOR = f"#exploreFeeds, {LOGIN_CONTAINER_SELECTOR}"
+NOTE_OR_LOGIN_SELECTOR = f".note-container, {LOGIN_CONTAINER_SELECTOR}"
+
+# 按视窗高度的倍数滚动页面，并等待搜索结果列表发生变化（翻页后 #exploreFeeds 会被重写），
+# 返回 [滚动前位置, 滚动后位置, 是否有新内容]。视窗高度取页面实际值
+_SCROLL_AND_WAIT_FEEDS_SCRIPT = """
+([ratio, timeoutMs]) => new Promise((resolve) => {
+    const before = window.scrollY;
+    const viewportHeight = window.innerHeight || document.documentElement.clientHeight;
+    const feeds = document.getElementById("exploreFeeds");
+    let observer = null;
+    let timer = null;
+    const finish = (changed) => {
+        if (observer) observer.disconnect();
+        clearTimeout(timer);
+        resolve([before, window.scrollY, changed]);
+    };
+    if (feeds) {
+        observer = new MutationObserver(() => finish(true));
+        observer.observe(feeds, { childList: true, subtree: true });
+    }
+    timer = setTimeout(() => finish(false), timeoutMs);
+    window.scrollBy(0, ratio * viewportHeight);
+})
+"""
+
+# 按选择器查找顶部位于视窗内的元素，
+# 返回 [是否限定在列表内, [[选择器, 序号, 链接标识, 中心 x, 中心 y], ...]]，
+# 同一链接只保留第一个。视窗高度取页面实际值，不依赖固定的窗口尺寸；
+# 有搜索结果列表时只在列表内查找，序号相对于列表
+_VISIBLE_LINKS_SCRIPT = """
+(selectors) => {
+    const viewportHeight = window.innerHeight || document.documentElement.clientHeight;
+    const feeds = document.getElementById("exploreFeeds");
+    const root = feeds || document;
+    const seen = new Set();
+    const matches = [];
+    for (const selector of selectors) {
+        let elements;
+        try {
+            elements = root.querySelectorAll(selector);
+        } catch (e) {
+            continue;
+        }
+        elements.forEach((el, index) => {
+            const rect = el.getBoundingClientRect();
+            if (rect.width === 0 && rect.height === 0) return;
+            if (rect.top < 0 || rect.top > viewportHeight) return;
+            // 没有 href 时用 outerHTML 的哈希作为稳定标识，跨滚动保持一致
+            let linkId = el.getAttribute("href");
+            if (!linkId) {
+                let hash = 0;
+                for (const ch of el.outerHTML) hash = ((hash << 5) - hash + ch.charCodeAt(0)) | 0;
+                linkId = "h_" + (hash >>> 0).toString(16);
+            }
+            if (seen.has(linkId)) return;
+            seen.add(linkId);
+            matches.push([
+                selector, index, linkId, rect.x + rect.width / 2, rect.y + rect.height / 2,
+            ]);
+        });
+        // 前面的选择器已找到链接时不再尝试后面的备用选择器
+        if (matches.length) break;
+    }
+    return [feeds !== null, matches];
+}
+"""
+
+# 在缓存的滚动容器上检查能否滚动并滚动指定距离，返回是否滚动成功。
+# 作为参数直接传给 ElementHandle.evaluate，不在页面 window 上注册全局函数（容易被检测）
+_SCROLL_NOTE_SCRIPT = """
+(container, distance) => {
+    if (!(container.scrollTop > 0 || container.scrollHeight > container.clientHeight)) {
+        return false;
+    }
+    container.scrollTop += distance;
+    return true;
+}
+"""
 
 
 class XiaohongshuBrowserService(BaseBrowserService):
     """小红书浏览器服务实现"""
 
+    # 内容链接的精确选择器
+    _PRIMARY_LINK_SELECTOR = ".feeds-container .note-item .cover"
+
+    # 备用的内容链接选择器，合并为一个查询，浏览器只需遍历一次 DOM
+    _LINK_SELECTOR = ", ".join((
+        ".feeds-container .note-item a",
+        ".note-item a",
+        'a[href*="/explore/"]',
+        'a[href*="/discovery/"]',
+        ".feed-item a",
+        "a.note-item",
+        'a[href*="/note/"]',
+    ))
+
+    # 备用的搜索框选择器
+    _SEARCH_INPUT_FALLBACK_SELECTOR = ", ".join((
+        'input[placeholder*="搜索"]',
+        'input[type="search"]',
+        ".search-input input",
+        "input.search-input",
+        "#search-input",  # 再次尝试
+    ))
+
     def __init__(
         self,
         browser_type: Optional[str] = None,
@@ -41,19 +158,71 @@ class XiaohongshuBrowserService(BaseBrowserService):
             enable_cookies_persistence=enable_cookies_persistence,
         )
 
+        # 当前内容页面的滚动容器句柄，进入新内容页面或关闭内容页面时重置
+        self._note_scroller: Optional[ElementHandle] = None
+
+        # 登录后保存的存储状态（cookies、localStorage），启动时恢复以跳过登录
+        self._state_path = Path(settings.xhs_state_path)
+
+        # 当前上下文中打开过的内容页面数，达到上限后在安全时机重建上下文
+        self._pages_opened = 0
+
+        # 最近一次查找到的可见链接中心坐标（link_id -> (x, y)）
+        self._link_centers: Dict[str, tuple[float, float]] = {}
+
+    async def _create_context(
+        self, storage_state: Optional[Dict[str, Any]] = None
+    ) -> BrowserContext:
+        """创建浏览器上下文，首次创建时从存储状态文件恢复登录态"""
+        if storage_state is None and self._state_path.exists():
+            logger.info(f"Restoring storage state from {self._state_path}")
+            return await super()._create_context(str(self._state_path))
+        return await super()._create_context(storage_state)
+
+    async def _maybe_recycle_context(self, reopen: bool = True) -> None:
+        """打开的内容页面数达到上限时重建上下文，释放长时间运行累积的内存
+
+        只在没有打开内容页面时调用；登录态随存储状态带到新上下文。
+
+        Args:
+            reopen: 重建后是否重新打开原来的页面（搜索结果页的滚动位置不保留），
+                调用方随后会跳转到其他页面时传 False
+        """
+        if self._pages_opened < settings.playwright_pages_per_context or self._page is None:
+            return
+
+        current_url = self._page.url
+        await self._reset_note_scroller()
+        await self._rotate_context()
+        self._pages_opened = 0
+        logger.info("Recycled browser context to release memory")
+
+        if reopen and current_url and current_url != "about:blank":
+            page = await self._get_page()
+            try:
+                await page.goto(current_url, wait_until="domcontentloaded")
+            except Exception as e:
+                logger.warning(f"Failed to reopen {current_url} after recycling context: {e}")
+
+    async def _save_storage_state(self, page: Page) -> None:
+        """登录成功后保存存储状态到文件"""
+        try:
+            await asyncio.to_thread(self._state_path.parent.mkdir, parents=True, exist_ok=True)
+            await page.context.storage_state(path=str(self._state_path))
+            logger.info(f"Saved storage state to {self._state_path}")
+        except Exception as e:
+            logger.warning(f"Failed to save storage state: {e}")
+
     async def _get_page(self) -> Page:
         """获取页面实例（单例模式，复用同一页面）"""
         if self._page is None:
-            browser = await self._ensure_browser()
-            self._page = await browser.new_page()
+            # 反爬虫策略已在上下文上设置（使用基类方法）
+            context = await self._ensure_context()
+            self._page = await context.new_page()
 
             # 设置视口
             #await self._page.set_viewport_size({"width": 1920, "height": 1080})
 
-            # 设置反爬虫策略（使用基类方法）
-            if self._enable_anti_detection:
-                await self._setup_anti_detection(self._page)
-
         return self._page
 
     async def check_login_status(self, url: URL) -> bool:
@@ -67,68 +236,66 @@ class XiaohongshuBrowserService(BaseBrowserService):
         logger.info(f"Checking login status at {url.value}")
 
         # 加载该域名的 cookies
-        domain = self._get_domain_from_url(url.value)
+        domain = url.domain
         await self._load_cookies(page, domain)
 
-        # 使用 load 而不是 networkidle，因为 networkidle 可能永远达不到（持续的网络请求）
+        # 不等待 networkidle（埋点请求持续不断，可能永远达不到）。导航提交后旧文档已被替换，
+        # 立即开始等待内容或登录框出现，任一元素渲染出来即可判断，无需等待 DOM 全部就绪
         try:
-            await page.goto(url.value, wait_until="load", timeout=60000)
+            await page.goto(url.value, wait_until="commit", timeout=60000)
+            await page.wait_for_selector(FEEDS_OR_LOGIN_SELECTOR, timeout=60000)
         except Exception as e:
             logger.warning(f"Page load timeout or error: {e}, trying to continue...")
             # 即使超时也继续，可能页面已经部分加载
 
-        # 等待页面完整加载
-        await asyncio.sleep(2)
-
         # 保存 cookies（页面加载后可能更新了 cookies）
         await self._save_cookies(page, domain)
 
-        # 检查登录状态
-        html = await page.content()
-
-        if 'class="login-container"' in html or "login-container" in html:
+        # 检查登录状态（在浏览器内判断，无需序列化整个 DOM）
+        if await self._has_login_container(page):
             logger.info("Login required")
             return False
         else:
             logger.info("Already logged in")
             return True
 
+    async def _has_login_container(self, page: Page) -> bool:
+        """页面上是否显示登录弹窗（在浏览器内求值，只返回一个布尔值）"""
+        return await page.evaluate(
+            f"() => !!document.querySelector('{LOGIN_CONTAINER_SELECTOR}')"
+        )
+
     async def wait_for_login(self, timeout: int = 300) -> None:
         """等待用户登录（最多等待timeout秒）"""
         page = await self._get_page()
 
         logger.info("Waiting for manual login...")
-        start_time = asyncio.get_event_loop().time()
 
         # 获取当前页面的域名
         current_url = page.url
         domain = self._get_domain_from_url(current_url) if current_url else "unknown"
 
-        while True:
-            html = await page.content()
-
-            # 检查是否已登录（登录容器消失）
-            if 'class="login-container"' not in html and "login-container" not in html:
-                logger.info("Login detected!")
-                # 登录成功后保存 cookies
-                await self._save_cookies(page, domain)
-                return
-
-            # 检查超时
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed > timeout:
-                logger.warning(f"Login timeout after {timeout}s")
-                # 即使超时也保存 cookies（可能已经部分登录）
-                await self._save_cookies(page, domain)
-                return
+        # 由 Playwright 在浏览器内等待登录容器从 DOM 中移除，避免反复拉取整页 HTML
+        try:
+            await page.locator(LOGIN_CONTAINER_SELECTOR).wait_for(
+                state="detached", timeout=timeout * 1000
+            )
+        except PlaywrightTimeoutError:
+            logger.warning(f"Login timeout after {timeout}s")
+            # 即使超时也保存 cookies（可能已经部分登录）
+            await self._save_cookies(page, domain)
+            return
 
-            # 等待一段时间后再次检查
-            await asyncio.sleep(2)
+        logger.info("Login detected!")
+        # 登录成功后保存 cookies 和存储状态
+        await self._save_cookies(page, domain, flush=True)
+        await self._save_storage_state(page)
 
     async def search(self, keyword: SearchKeyword) -> None:
         """搜索关键词
         搜索框的CSS选择器为: #search-input
         """
+        await self._maybe_recycle_context()
         page = await self._get_page()
 
         logger.info(f"Searching for: {keyword.value}")
@@ -144,23 +311,14 @@ class XiaohongshuBrowserService(BaseBrowserService):
             logger.warning(
                 f"Could not find search input with primary selector {primary_selector}: {e}"
             )
-            # 如果主要选择器失败，使用备用选择器
-            search_selectors = [
-                'input[placeholder*="搜索"]',
-                'input[type="search"]',
-                ".search-input input",
-                "input.search-input",
-                "#search-input",  # 再次尝试
-            ]
-
-            for selector in search_selectors:
-                try:
-                    search_input = await page.wait_for_selector(selector, timeout=3000)
-                    if search_input:
-                        logger.info(f"Found search input with fallback selector: {selector}")
-                        break
-                except Exception:
-                    continue
+            # 如果主要选择器失败，使用备用选择器（合并为一次等待，匹配任意一个即可）
+            try:
+                search_input = await page.wait_for_selector(
+                    self._SEARCH_INPUT_FALLBACK_SELECTOR, timeout=3000
+                )
+                logger.info("Found search input with fallback selectors")
+            except Exception:
+                search_input = None
 
         if not search_input:
             raise Exception("Could not find search input with any selector")
@@ -188,9 +346,13 @@ class XiaohongshuBrowserService(BaseBrowserService):
         await self._simulate_human_typing(search_input, keyword.value, typing_speed=0.08)
         await asyncio.sleep(random.uniform(0.3, 0.7))
 
-        # 按回车或点击搜索按钮
+        # 按回车或点击搜索按钮，等待跳转到搜索结果页
         await search_input.press("Enter")
-        await asyncio.sleep(2)
+        try:
+            await page.wait_for_url(lambda u: "search_result" in u, timeout=self._timeout)
+            await page.wait_for_selector(".feeds-container .note-item", timeout=10000)
+        except PlaywrightTimeoutError:
+            logger.warning("Search results did not render in time, trying to continue...")
 
         # 保存 cookies（搜索后可能更新了 cookies）
         current_url = page.url
@@ -205,106 +367,69 @@ class XiaohongshuBrowserService(BaseBrowserService):
         """
         page = await self._get_page()
 
-        # 随机滚动距离（0.5~1.5倍视窗高度）
-        scroll_distance = random.uniform(0.5, 1.5) * 1080  # 视窗高度
+        # 随机滚动距离（0.5~1.5倍视窗高度，视窗高度在浏览器内读取）
+        scroll_ratio = random.uniform(0.5, 1.5)
 
-        # 记录滚动前的位置
-        scroll_before = await page.evaluate("window.scrollY")
+        # 在浏览器内滚动，并等待 #exploreFeeds 内容发生变化（最多 2 秒），一次调用完成
+        scroll_before, scroll_after, feeds_changed = await page.evaluate(
+            _SCROLL_AND_WAIT_FEEDS_SCRIPT, [scroll_ratio, 2000]
+        )
 
-        await page.evaluate(f"window.scrollBy(0, {scroll_distance})")
+        logger.info(
+            f"Scrolled search results by {scroll_ratio:.2f}x viewport height "
+            f"(from {scroll_before:.0f} to {scroll_after:.0f})"
+        )
+        if not feeds_changed:
+            logger.debug("No new feed items appeared after scrolling")
 
-        # 等待页面加载新内容（翻页可能需要时间）
-        await asyncio.sleep(1)
+    async def _query_visible_links(
+        self, page: Page, selectors: List[str]
+    ) -> List[tuple[Locator, str]]:
+        """在一次 evaluate 中查找视窗内的链接，使用第一个找到可见链接的选择器
 
-        # 检查是否翻页（#exploreFeeds 内容可能被重写）
-        scroll_after = await page.evaluate("window.scrollY")
+        元素位置和 href 都在浏览器内读取，避免逐个元素调用 bounding_box 和 get_attribute。
+        返回的 Locator 按选择器和序号惰性定位，只有实际点击的链接才会再次访问页面；
+        链接中心坐标记录在 _link_centers 中，点击时无需再查询位置。
 
-        logger.info(
-            f"Scrolled search results by {scroll_distance:.0f}px (from {scroll_before:.0f} to {scroll_after:.0f})"
-        )
+        Args:
+            page: Playwright 页面对象
+            selectors: 按优先级依次尝试的 CSS 选择器
 
-        # 如果滚动距离很大，可能是翻页，等待更长时间让内容加载
-        if scroll_distance > 800:
-            await asyncio.sleep(1)
+        Returns:
+            List of (link, link_id) tuples
+        """
+        in_feeds, matches = await page.evaluate(_VISIBLE_LINKS_SCRIPT, selectors)
+        root = page.locator("#exploreFeeds") if in_feeds else page
+        self._link_centers = {link_id: (x, y) for _, _, link_id, x, y in matches}
+        return [
+            (root.locator(selector).nth(index), link_id)
+            for selector, index, link_id, _, _ in matches
+        ]
 
     async def get_visible_links(self) -> List[tuple[Locator, str]]:
         """获取当前视窗中可见的链接及其唯一标识
-        内容链接的CSS选择器为: .feeds-container .note-item a
+        内容链接的CSS选择器为: .feeds-container .note-item .cover
+
+        主要选择器没有可见链接时使用备用选择器，两者在同一次 evaluate 中依次尝试。
 
         Returns:
             List of (link, link_id) tuples
         """
         page = await self._get_page()
 
-        # 使用精确的选择器: .feeds-container .note-item .cover
-        primary_selector = ".feeds-container .note-item .cover"
-        visible_links = []
-
         try:
-            # 使用主要选择器查找链接
-            links = await page.query_selector_all(primary_selector)
-            logger.debug(f"Found {len(links)} links with primary selector: {primary_selector}")
-            if not links:
-                logger.warning("No links found with primary selector, trying fallback selectors")
-                return await self._get_visible_links_fallback()
-
-            for link in links:
-                # 检查是否在视窗中
-                box = await link.bounding_box()
-                if box and box["y"] >= 0 and box["y"] <= 1080:
-                    # 获取链接的唯一标识（href）
-                    try:
-                        href = await link.get_attribute("href")
-                        link_id = href or str(id(link))
-                    except Exception:
-                        link_id = str(id(link))
-                    visible_links.append((link, link_id))
+            visible_links = await self._query_visible_links(
+                page, [self._PRIMARY_LINK_SELECTOR, self._LINK_SELECTOR]
+            )
         except Exception as e:
-            logger.warning(f"Error finding links with primary selector {primary_selector}: {e}")
-            logger.info("No links found with primary selector, trying fallback selectors")
-            # 使用备用方法
-            return await self._get_visible_links_fallback()
+            logger.warning(f"Error finding visible links: {e}")
+            return []
 
         logger.info(f"Found {len(visible_links)} visible links")
         return visible_links
 
-    async def _get_visible_links_fallback(self) -> List[tuple[Locator, str]]:
-        """备用方法：如果主要选择器失败，使用全局搜索"""
-        page = await self._get_page()
-
-        link_selectors = [
-            ".feeds-container .note-item a",
-            ".note-item a",
-            'a[href*="/explore/"]',
-            'a[href*="/discovery/"]',
-            ".feed-item a",
-            "a.note-item",
-            'a[href*="/note/"]',
-        ]
-
-        visible_links = []
-        for selector in link_selectors:
-            try:
-                links = await page.query_selector_all(selector)
-                for link in links:
-                    # 检查是否在视窗中
-                    box = await link.bounding_box()
-                    if box and box["y"] >= 0 and box["y"] <= 1080:
-                        # 获取链接的唯一标识（href）
-                        try:
-                            href = await link.get_attribute("href")
-                            link_id = href or str(id(link))
-                        except Exception:
-                            link_id = str(id(link))
-                        visible_links.append((link, link_id))
-            except Exception:
-                continue
-
-        logger.info(f"Found {len(visible_links)} visible links with fallback selectors")
-        return visible_links
-
     async def click_random_visible_link_not_opened(
-        self, opened_links: set
+        self, opened_links: Container[str]
     ) -> tuple[bool, Optional[str]]:
         """随机点击当前视窗中未打开过的链接
 
@@ -337,22 +462,22 @@ class XiaohongshuBrowserService(BaseBrowserService):
         try:
             page = await self._get_page()
 
-            # 获取链接位置
-            box = await link.bounding_box()
-            if box:
+            # 链接位置在查找可见链接时已一并取得
+            center = self._link_centers.get(link_id)
+            if center:
                 # 模拟鼠标移动到链接
                 current_mouse_pos = await page.evaluate(
                     "() => ({ x: window.mouseX || 0, y: window.mouseY || 0 })"
                 )
                 start_x = current_mouse_pos.get("x", random.uniform(100, 500))
                 start_y = current_mouse_pos.get("y", random.uniform(100, 500))
-                end_x = box["x"] + box["width"] / 2
-                end_y = box["y"] + box["height"] / 2
+                end_x, end_y = center
 
                 await self._simulate_human_mouse_movement(page, start_x, start_y, end_x, end_y)
                 await asyncio.sleep(random.uniform(0.1, 0.3))  # 移动到链接后稍作停顿
 
             await link.click(timeout=5000)
+            self._pages_opened += 1
             logger.info(f"Clicked on a new link: {link_id[:50]}")
             await asyncio.sleep(random.uniform(0.8, 1.5))  # 等待页面加载
 
@@ -368,6 +493,90 @@ class XiaohongshuBrowserService(BaseBrowserService):
             logger.error(f"Failed to click link: {e}")
             return False, None
 
+    async def harvest(self, max_pages: int, workers: int = 3) -> Dict[str, str]:
+        """并发抓取当前搜索结果页中的内容页面
+
+        主页面负责收集视窗内的链接并滚动，链接放入队列后由 workers 个工作协程
+        在同一个（已登录的）上下文中各自打开一个标签页并发加载。
+
+        Args:
+            max_pages: 最多抓取的内容页面数量
+            workers: 并发的标签页数量
+
+        Returns:
+            内容页面 URL 到页面 HTML 的映射
+        """
+        page = await self._get_page()
+        context = await self._ensure_context()
+        queue: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        results: Dict[str, str] = {}
+
+        async def _worker() -> None:
+            worker_page = await context.new_page()
+            try:
+                while (url := await queue.get()) is not None:
+                    try:
+                        # 每个标签页的请求间隔略有不同，避免请求过于整齐
+                        await asyncio.sleep(random.uniform(0.1, 0.3))
+                        await worker_page.goto(url, wait_until="domcontentloaded")
+                        self._pages_opened += 1
+                        try:
+                            await worker_page.wait_for_selector(
+                                NOTE_OR_LOGIN_SELECTOR, timeout=self._timeout
+                            )
+                        except PlaywrightTimeoutError:
+                            logger.warning(f"Content page did not render in time: {url}")
+                        results[url] = await worker_page.content()
+                    except Exception as e:
+                        logger.error(f"Failed to harvest {url}: {e}")
+            finally:
+                await worker_page.close()
+
+        async def _produce() -> None:
+            seen: set[str] = set()
+            idle_scrolls = 0
+            try:
+                # 连续 3 次滚动都没有新链接时认为已到底
+                while len(seen) < max_pages and idle_scrolls < 3:
+                    new_links = 0
+                    for _, link_id in await self.get_visible_links():
+                        if not link_id.startswith(("/", "http")):
+                            continue  # 没有 href 的链接
+                        url = urljoin(page.url, link_id)
+                        if url in seen:
+                            continue
+                        seen.add(url)
+                        queue.put_nowait(url)
+                        new_links += 1
+                        if len(seen) >= max_pages:
+                            break
+                    idle_scrolls = 0 if new_links else idle_scrolls + 1
+                    if len(seen) < max_pages:
+                        await self.scroll_search_results()
+            finally:
+                # 通知工作协程结束
+                for _ in range(workers):
+                    queue.put_nowait(None)
+
+        logger.info(f"Harvesting up to {max_pages} content pages with {workers} workers")
+        tasks = [asyncio.create_task(_produce())]
+        tasks.extend(asyncio.create_task(_worker()) for _ in range(workers))
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
+        finally:
+            # 任一协程失败（或 harvest 被取消）时停止其余协程，避免后台继续滚动和加载页面
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info(f"Harvested {len(results)} content pages")
+
+        # 标签页已全部关闭，此时可以安全地按打开的页面数重建上下文
+        await self._maybe_recycle_context()
+        return results
+
     async def wait_for_content_page(self, timeout: int = 10000) -> bool:
         """等待内容页面加载（检查是否有 .note-container）
 
@@ -376,6 +585,9 @@ class XiaohongshuBrowserService(BaseBrowserService):
         """
         page = await self._get_page()
 
+        # 新的内容页面，之前缓存的滚动容器已失效
+        await self._reset_note_scroller()
+
         try:
             await page.wait_for_selector(".note-container", timeout=timeout)
             logger.info("Content page loaded")
@@ -395,21 +607,18 @@ class XiaohongshuBrowserService(BaseBrowserService):
         page = await self._get_page()
 
         try:
-            # 检查是否为图片内容
-            image_container = await page.query_selector(
-                ".note-container .media-container .slider-container"
-            )
-            if image_container:
-                logger.info("Content type: image")
-                return "image"
-
-            # 检查是否为视频内容
-            video_container = await page.query_selector(
-                ".note-container .media-container .player-container"
-            )
-            if video_container:
-                logger.info("Content type: video")
-                return "video"
+            # 图片和视频容器在一次 evaluate 中检查
+            content_type = await page.evaluate("""
+                () => {
+                    const media = ".note-container .media-container";
+                    if (document.querySelector(`${media} .slider-container`)) return "image";
+                    if (document.querySelector(`${media} .player-container`)) return "video";
+                    return "unknown";
+                }
+            """)
+            if content_type != "unknown":
+                logger.info(f"Content type: {content_type}")
+                return content_type
 
             logger.warning("Content type: unknown")
             return "unknown"
@@ -442,22 +651,27 @@ class XiaohongshuBrowserService(BaseBrowserService):
             click_count = random.randint(1, slide_count)
             logger.info(f"Will click right arrow {click_count} times")
 
-            for i in range(click_count):
-                try:
-                    right_arrow = await page.query_selector(".arrow-controller.right")
-                    if right_arrow:
+            # 右箭头在翻页过程中不会重建，只查找一次；仍由 Playwright 点击，
+            # 产生真实的鼠标事件（在页面中调用 element.click() 的事件 isTrusted 为 false）
+            right_arrow = await page.query_selector(".arrow-controller.right")
+            if not right_arrow:
+                logger.warning("Right arrow not found, stopping image browsing")
+                return
+
+            try:
+                for i in range(click_count):
+                    try:
                         await right_arrow.click()
-                        wait_time = random.uniform(0.5, 1)
-                        logger.info(
-                            f"Clicked right arrow {i + 1}/{click_count}, waiting {wait_time:.2f}s"
-                        )
-                        await asyncio.sleep(wait_time)
-                    else:
-                        logger.warning("Right arrow not found, stopping image browsing")
+                    except Exception as e:
+                        logger.error(f"Error clicking right arrow: {e}")
                         break
-                except Exception as e:
-                    logger.error(f"Error clicking right arrow: {e}")
-                    break
+                    wait_time = random.uniform(0.5, 1)
+                    logger.info(
+                        f"Clicked right arrow {i + 1}/{click_count}, waiting {wait_time:.2f}s"
+                    )
+                    await asyncio.sleep(wait_time)
+            finally:
+                await right_arrow.dispose()
         except Exception as e:
             logger.error(f"Error browsing image content: {e}")
 
@@ -468,6 +682,15 @@ class XiaohongshuBrowserService(BaseBrowserService):
         logger.info("Browsing video content")
 
         try:
+            # 等待视频元数据加载（readyState >= 1 时 duration 可用），避免过早读取得到 NaN
+            try:
+                await page.wait_for_function(
+                    "() => document.querySelector('.player-container video')?.readyState >= 1",
+                    timeout=5000,
+                )
+            except PlaywrightTimeoutError:
+                logger.debug("Video metadata not loaded within 5s")
+
             # 尝试获取视频时长
             video_duration = await page.evaluate("""
                 () => {
@@ -542,31 +765,20 @@ class XiaohongshuBrowserService(BaseBrowserService):
 
             logger.info(f"Will scroll comments {max_scrolls} times")
 
+            # 滚动容器每个内容页面只查找一次
+            note_scroller = await self._get_note_scroller(page, css_note_scroller)
+
             for i in range(max_scrolls):
-                # 检查是否还可以向上滚动
-                can_scroll = await page.evaluate(f"""
-                    () => {{
-                        const container = document.querySelector('{css_note_scroller}');
-                        if (!container) return false;
-                        return container.scrollTop > 0 || container.scrollHeight > container.clientHeight;
-                    }}
-                """)
-
-                if not can_scroll:
+                # 向上滚动100~300px（检查是否还可以滚动与滚动合并为一次调用）
+                scroll_distance = random.uniform(100, 300)
+                scrolled = note_scroller is not None and await note_scroller.evaluate(
+                    _SCROLL_NOTE_SCRIPT, scroll_distance
+                )
+
+                if not scrolled:
                     logger.info("Comments container cannot scroll further, stopping")
                     break
 
-                # 向上滚动100~300px
-                scroll_distance = random.uniform(100, 300)
-                await page.evaluate(f"""
-                    () => {{
-                        const container = document.querySelector('{css_note_scroller}');
-                        if (container) {{
-                            container.scrollTop += {scroll_distance};
-                        }}
-                    }}
-                """)
-
                 logger.info(
                     f"Scrolled comments up by {scroll_distance:.0f}px ({i + 1}/{max_scrolls})"
                 )
@@ -575,15 +787,38 @@ class XiaohongshuBrowserService(BaseBrowserService):
         except Exception as e:
             logger.error(f"Error browsing comments: {e}")
 
+    async def _get_note_scroller(self, page: Page, selector: str) -> Optional[ElementHandle]:
+        """获取当前内容页面的滚动容器，首次调用时查找并缓存"""
+        if self._note_scroller is None:
+            self._note_scroller = await page.query_selector(selector)
+        return self._note_scroller
+
+    async def _reset_note_scroller(self) -> None:
+        """释放缓存的滚动容器句柄"""
+        if self._note_scroller is not None:
+            try:
+                await self._note_scroller.dispose()
+            except Exception:
+                pass
+            self._note_scroller = None
+
     async def close_content_page(self) -> None:
         """关闭当前内容页面（点击 noteContainer 以外的部分）"""
         page = await self._get_page()
 
         logger.info("Closing content page")
 
-        # 点击页面左上角（noteContainer 以外）
+        await self._reset_note_scroller()
+
+        # 点击页面左上角（noteContainer 以外），等待内容弹层移除
         await page.click("body", position={"x": 50, "y": 50})
-        await asyncio.sleep(1)
+        try:
+            await page.wait_for_selector(".note-container", state="detached", timeout=5000)
+        except PlaywrightTimeoutError:
+            logger.warning("Content page is still open after clicking outside")
+
+        # 回到搜索结果页，此时可以安全地重建上下文
+        await self._maybe_recycle_context()
 
     async def _wait_for_login_if_needed(self, page: Page, domain: str) -> None:
         """如果检测到登录框，等待用户登录
@@ -595,27 +830,24 @@ class XiaohongshuBrowserService(BaseBrowserService):
         while True:
             try:
                 # 检查是否存在登录容器
-                login_container = await page.query_selector(".login-container")
-                if login_container is None:
+                if not await self._has_login_container(page):
                     # 没有登录容器，说明已登录
                     logger.debug("No login container found, user is logged in")
                     break
 
-                # 检测到登录容器，等待登录
+                # 检测到登录容器，等待其从 DOM 中移除（不限时，由浏览器内部监听 DOM 变化）
                 logger.info("Login container detected, waiting for login...")
-                await asyncio.sleep(2)  # 每2秒检查一次
-
-                # 再次检查登录容器是否消失
-                login_container = await page.query_selector(".login-container")
-                if login_container is None:
-                    logger.info("Login successful!")
-                    # 登录成功后保存 cookies
-                    await self._save_cookies(page, domain)
-                    break
+                await page.wait_for_selector(LOGIN_CONTAINER_SELECTOR, state="detached", timeout=0)
+
+                logger.info("Login successful!")
+                # 登录成功后保存 cookies 和存储状态
+                await self._save_cookies(page, domain, flush=True)
+                await self._save_storage_state(page)
+                break
 
             except Exception as e:
                 logger.error(f"Error checking login status: {e}")
-                # 如果检查出错，继续等待
+                # 如果检查出错（如页面跳转），稍后重新检查
                 await asyncio.sleep(2)
 
     async def get_page_title(self, url: str) -> str:
@@ -627,6 +859,7 @@ class XiaohongshuBrowserService(BaseBrowserService):
         Returns:
             页面标题，如果获取失败则返回空字符串
         """
+        await self._maybe_recycle_context(reopen=False)
         page = await self._get_page()
         logger.info(f"Getting page title from: {url}")
 
@@ -635,9 +868,13 @@ class XiaohongshuBrowserService(BaseBrowserService):
         await self._load_cookies(page, domain)
 
         try:
-            # 访问页面
-            await page.goto(url, wait_until="load", timeout=60000)
-            await asyncio.sleep(2)
+            # 访问页面，DOM 就绪后等待内容或登录框出现
+            await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+            self._pages_opened += 1
+            try:
+                await page.wait_for_selector(NOTE_OR_LOGIN_SELECTOR, timeout=self._timeout)
+            except PlaywrightTimeoutError:
+                logger.warning("Content page did not render in time, trying to continue...")
 
             # 保存 cookies
             await self._save_cookies(page, domain)
@@ -669,6 +906,7 @@ class XiaohongshuBrowserService(BaseBrowserService):
             图片列表，每个元素包含 {'url': str, 'index': int}
             按 data-index 排序，已去重
         """
+        await self._maybe_recycle_context(reopen=False)
         page = await self._get_page()
         logger.info(f"Getting content images from: {url}")
 
@@ -677,9 +915,13 @@ class XiaohongshuBrowserService(BaseBrowserService):
         await self._load_cookies(page, domain)
 
         try:
-            # 访问页面
-            await page.goto(url, wait_until="load", timeout=60000)
-            await asyncio.sleep(2)
+            # 访问页面，DOM 就绪后等待内容或登录框出现
+            await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+            self._pages_opened += 1
+            try:
+                await page.wait_for_selector(NOTE_OR_LOGIN_SELECTOR, timeout=self._timeout)
+            except PlaywrightTimeoutError:
+                logger.warning("Content page did not render in time, trying to continue...")
 
             # 保存 cookies
             await self._save_cookies(page, domain)
@@ -745,33 +987,38 @@ class XiaohongshuBrowserService(BaseBrowserService):
             return []
 
     async def crawl(self, url: URL, options: Optional[Dict[str, Any]] = None) -> str:
-        """爬取指定 URL 的内容（实现接口要求）"""
+        """爬取指定 URL 的内容（实现接口要求）
+
+        只需要 HTML，默认拦截图片等资源（settings.xiaohongshu_block_media），
+        可通过 options["load_media"] 按次加载。浏览、下载图片等流程共用同一页面，
+        因此拦截只在本次爬取期间生效。
+        """
+        options = options or {}
         page = await self._get_page()
 
         # 加载该域名的 cookies
-        domain = self._get_domain_from_url(url.value)
+        domain = url.domain
         await self._load_cookies(page, domain)
 
-        await page.goto(url.value, wait_until="networkidle")
-        await asyncio.sleep(2)
+        block_media = not options.get("load_media", not settings.xiaohongshu_block_media)
+        if block_media:
+            await page.route("**/*", self._block_resource_route)
 
-        # 保存 cookies（页面加载后可能更新了 cookies）
-        await self._save_cookies(page, domain)
+        try:
+            await page.goto(url.value, wait_until="domcontentloaded")
+            await page.wait_for_load_state("load", timeout=self._timeout)
+
+            # 保存 cookies（页面加载后可能更新了 cookies）
+            await self._save_cookies(page, domain)
 
-        return await page.content()
+            return await page.content()
+        finally:
+            if block_media:
+                await page.unroute("**/*", self._block_resource_route)
 
     async def close(self) -> None:
         """关闭浏览器"""
-        if self._page:
-            await self._page.close()
-            self._page = None
-
-        if self._browser:
-            await self._browser.close()
-            self._browser = None
-            logger.info("Browser closed")
-
-        if self._playwright:
-            await self._playwright.stop()
-            self._playwright = None
-            logger.info("Playwright stopped")
+        # 句柄随页面关闭失效，无需单独释放
+        self._note_scroller = None
+        self._pages_opened = 0
+        await super().close()
@@ -17,6 +17,17 @@ class Settings(BaseSettings):
     playwright_browser: str = "chromium"  # chromium, firefox, webkit
     playwright_headless: bool = True
     playwright_timeout: int = 30000  # 毫秒
+    # 每个浏览器上下文服务的页面数，超过后重建上下文以释放内存
+    playwright_pages_per_context: int = 50
+    browser_pool_size: int = 2  # 每种启动配置保留的空闲浏览器数量，服务关闭后归还复用
+    # 浏览器用户数据目录，设置后跨运行复用磁盘缓存（不使用浏览器池）
+    playwright_user_data_dir: Optional[str] = None
+    xiaohongshu_block_media: bool = True  # 小红书 crawl 时是否拦截图片、媒体、字体和样式表
+    
+    # Cookies 配置
+    cookies_pretty_json: bool = False  # 是否以缩进格式保存 cookies 文件（便于调试）
+    # 小红书登录后的存储状态文件，下次启动时恢复登录态
+    xhs_state_path: str = "cookies/xiaohongshu_state.json"
     
     class Config:
         env_file = ".env"
@@ -1,19 +1,39 @@
 """数据库初始化脚本"""
 
 import asyncio
-from sqlalchemy.ext.asyncio import create_async_engine
-from infrastructure.config import settings
 from infrastructure.database.models import Base
+from infrastructure.database.session import engine
 
 
-async def init_database():
-    """初始化数据库表"""
-    engine = create_async_engine(settings.database_url, echo=True)
-    
+def _create_schema(connection) -> None:
+    """建表，并为已存在的表补建新增的索引（create_all 不会修改已存在的表）"""
+    Base.metadata.create_all(connection)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
+# 当前进程中是否已经建过表
+_initialized = False
+
+
+async def init_database(force: bool = False):
+    """初始化数据库表
+
+    同一进程内只执行一次，重复调用直接返回。
+
+    Args:
+        force: 是否强制重新执行建表
+    """
+    global _initialized
+    if _initialized and not force:
+        return
+
+    # 复用会话模块的共享引擎，建表用过的连接留在连接池中供后续会话使用
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
-    await engine.dispose()
+        await conn.run_sync(_create_schema)
+
+    _initialized = True
     print("Database initialized successfully!")
 
 
@@ -1,15 +1,19 @@
-"""领域对象和数据库模型映射"""
+"""领域对象和数据库模型映射
 
-from domain.entities import CrawlerTask
-from domain.value_objects import TaskId, URL, TaskStatus
+值对象的字符串值直接读取 .value；从数据库加载时通过 intern_* 复用相同值的值对象实例，
+TaskStatus 是枚举，按值查找本身就是字典查找。
+"""
+
+from domain.entities import CrawlerTask, TaskSummary
+from domain.value_objects import TaskStatus, intern_task_id, intern_url
 from infrastructure.database.models import CrawlerTaskModel
 
 
 def task_to_model(task: CrawlerTask) -> CrawlerTaskModel:
     """将领域实体转换为数据库模型"""
     return CrawlerTaskModel(
-        id=str(task.id),
-        url=str(task.url),
+        id=task.id.value,
+        url=task.url.value,
         status=task.status.value,
         content=task.content,
         error_message=task.error_message,
@@ -19,11 +23,25 @@ def task_to_model(task: CrawlerTask) -> CrawlerTaskModel:
     )
 
 
+def task_to_row(task: CrawlerTask) -> dict:
+    """将领域实体转换为可直接用于 INSERT 语句的列值字典（键为模型属性名）"""
+    return {
+        "id": task.id.value,
+        "url": task.url.value,
+        "status": task.status.value,
+        "content": task.content,
+        "error_message": task.error_message,
+        "task_metadata": task.metadata,
+        "created_at": task.created_at,
+        "updated_at": task.updated_at,
+    }
+
+
 def model_to_task(model: CrawlerTaskModel) -> CrawlerTask:
     """将数据库模型转换为领域实体"""
     return CrawlerTask(
-        id=TaskId(model.id),
-        url=URL(model.url),
+        id=intern_task_id(model.id),
+        url=intern_url(model.url),
         status=TaskStatus(model.status),
         content=model.content,
         error_message=model.error_message,
@@ -32,3 +50,14 @@ def model_to_task(model: CrawlerTaskModel) -> CrawlerTask:
         updated_at=model.updated_at,
     )
 
+
+
+def row_to_summary(row) -> TaskSummary:
+    """将摘要查询的结果行（id, url, status, created_at, updated_at）转换为任务摘要"""
+    return TaskSummary(
+        id=intern_task_id(row.id),
+        url=intern_url(row.url),
+        status=TaskStatus(row.status),
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
@@ -1,14 +1,47 @@
 """仓储实现"""
 
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import inspect, select
+from sqlalchemy.dialects import postgresql, sqlite
 
-from domain.entities import CrawlerTask
+from domain.entities import CrawlerTask, TaskSummary
 from domain.repositories import ICrawlerTaskRepository
 from domain.value_objects import TaskId
 from infrastructure.database.models import CrawlerTaskModel
-from infrastructure.database.mappers import task_to_model, model_to_task
+from infrastructure.database.mappers import (
+    task_to_model,
+    task_to_row,
+    model_to_task,
+    row_to_summary,
+)
+
+
+# 支持 INSERT ... ON CONFLICT DO UPDATE 的方言
+_UPSERT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+# 模型属性名 -> 表列（metadata 列的属性名为 task_metadata，与列名不同）
+_TASK_COLUMNS = {attr.key: attr.columns[0] for attr in inspect(CrawlerTaskModel).column_attrs}
+
+# upsert 冲突时需要更新的列（除主键外的所有列），导入时计算一次
+_UPDATE_COLUMN_KEYS = tuple(
+    column.key for column in CrawlerTaskModel.__table__.columns if column.key != "id"
+)
+
+# 摘要查询只投影这些列，不读取 content、metadata 等大字段
+_SUMMARY_COLUMNS = (
+    CrawlerTaskModel.id,
+    CrawlerTaskModel.url,
+    CrawlerTaskModel.status,
+    CrawlerTaskModel.created_at,
+    CrawlerTaskModel.updated_at,
+)
+
+# 每条 upsert 语句包含的最大行数（8 列 x 100 行，低于 SQLite 的绑定参数上限）
+_UPSERT_BATCH_SIZE = 100
 
 
 class SQLAlchemyCrawlerTaskRepository(ICrawlerTaskRepository):
@@ -18,22 +51,53 @@ class SQLAlchemyCrawlerTaskRepository(ICrawlerTaskRepository):
         self._session = session
     
     async def save(self, task: CrawlerTask) -> None:
-        """保存任务"""
-        model = task_to_model(task)
+        """保存任务
+
+        支持 upsert 的数据库只执行一条 INSERT ... ON CONFLICT DO UPDATE，
+        其他数据库交给 ORM 的 merge 处理。
+        """
+        await self._upsert([task])
+        await self._session.commit()
+    
+    async def save_many(self, tasks: List[CrawlerTask]) -> None:
+        """在同一个事务中批量保存任务（多行 upsert，只提交一次）"""
+        if not tasks:
+            return
         
-        # 检查是否存在
-        existing = await self._session.get(CrawlerTaskModel, str(task.id))
+        await self._upsert(tasks)
+        await self._session.commit()
+    
+    async def _upsert(self, tasks: List[CrawlerTask]) -> None:
+        """插入或更新任务（不提交）"""
+        insert = _UPSERT_INSERTS.get(self._session.get_bind().dialect.name)
+        if insert is None:
+            for task in tasks:
+                await self._session.merge(task_to_model(task))
+            return
         
-        if existing:
-            # 更新现有记录
-            for key, value in model.__dict__.items():
-                if key != '_sa_instance_state':
-                    setattr(existing, key, value)
-        else:
-            # 创建新记录
-            self._session.add(model)
+        rows = [
+            {_TASK_COLUMNS[key]: value for key, value in task_to_row(task).items()}
+            for task in tasks
+        ]
+        table = CrawlerTaskModel.__table__
+        # 分批发送，避免单条语句的绑定参数超过数据库上限（SQLite 默认 999）
+        for start in range(0, len(rows), _UPSERT_BATCH_SIZE):
+            stmt = insert(table).values(rows[start:start + _UPSERT_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.id],
+                set_={key: stmt.excluded[key] for key in _UPDATE_COLUMN_KEYS},
+            )
+            await self._session.execute(stmt)
         
-        await self._session.commit()
+        for task in tasks:
+            self._forget(str(task.id))
+    
+    def _forget(self, task_id: str) -> None:
+        """从会话的标识映射中移除任务模型，避免之后读到 upsert 之前的旧数据"""
+        key = self._session.identity_key(CrawlerTaskModel, task_id)
+        model = self._session.identity_map.get(key)
+        if model is not None:
+            self._session.expunge(model)
     
     async def find_by_id(self, task_id: TaskId) -> Optional[CrawlerTask]:
         """根据 ID 查找任务"""
@@ -42,22 +106,55 @@ class SQLAlchemyCrawlerTaskRepository(ICrawlerTaskRepository):
             return None
         return model_to_task(model)
     
-    async def find_all(self, limit: int = 100, offset: int = 0) -> List[CrawlerTask]:
-        """查找所有任务"""
-        stmt = select(CrawlerTaskModel).order_by(CrawlerTaskModel.created_at.desc()).limit(limit).offset(offset)
+    async def find_by_ids(self, task_ids: List[TaskId], limit: int = 100) -> List[CrawlerTask]:
+        """根据多个 ID 一次查找任务，不存在的 ID 会被忽略"""
+        ids = list(dict.fromkeys(str(task_id) for task_id in task_ids))[:limit]
+        if not ids:
+            return []
+        
+        stmt = select(CrawlerTaskModel).where(CrawlerTaskModel.id.in_(ids))
         result = await self._session.execute(stmt)
-        models = result.scalars().all()
-        return [model_to_task(model) for model in models]
+        models_by_id = {model.id: model for model in result.scalars().all()}
+        # 按传入 ID 的顺序返回
+        return [model_to_task(models_by_id[i]) for i in ids if i in models_by_id]
+    
+    async def find_all(self, limit: int = 100, offset: int = 0) -> List[CrawlerTask]:
+        """查找所有任务（包含完整内容；只需要列表信息时优先使用 find_summaries）"""
+        return [task async for task in self.iter_all(limit=limit, offset=offset)]
     
     async def find_by_status(self, status: str, limit: int = 100) -> List[CrawlerTask]:
-        """根据状态查找任务"""
+        """根据状态查找任务（包含完整内容；只需要列表信息时优先使用 find_summaries）"""
+        return [task async for task in self.iter_by_status(status, limit=limit)]
+    
+    async def find_summaries(
+        self, status: Optional[str] = None, limit: int = 100, offset: int = 0
+    ) -> List[TaskSummary]:
+        """查找任务摘要（只查询摘要列，不传输 content 等大字段）"""
+        stmt = select(*_SUMMARY_COLUMNS)
+        if status:
+            stmt = stmt.where(CrawlerTaskModel.status == status)
+        stmt = stmt.order_by(CrawlerTaskModel.created_at.desc()).limit(limit).offset(offset)
+        result = await self._session.execute(stmt)
+        return [row_to_summary(row) for row in result]
+    
+    async def iter_all(self, limit: int = 100, offset: int = 0) -> AsyncIterator[CrawlerTask]:
+        """逐条迭代所有任务（流式读取，每行转换后即可释放对应的模型）"""
+        stmt = (
+            select(CrawlerTaskModel)
+            .order_by(CrawlerTaskModel.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        async for model in await self._session.stream_scalars(stmt):
+            yield model_to_task(model)
+    
+    async def iter_by_status(self, status: str, limit: int = 100) -> AsyncIterator[CrawlerTask]:
+        """逐条迭代指定状态的任务（流式读取）"""
         stmt = (
             select(CrawlerTaskModel)
             .where(CrawlerTaskModel.status == status)
             .order_by(CrawlerTaskModel.created_at.desc())
             .limit(limit)
         )
-        result = await self._session.execute(stmt)
-        models = result.scalars().all()
-        return [model_to_task(model) for model in models]
-
+        async for model in await self._session.stream_scalars(stmt):
+            yield model_to_task(model)
@@ -0,0 +1,93 @@
+"""已完成 URL 缓存工具"""
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+from loguru import logger
+
+
+class CompletedUrlCache:
+    """记录已处理完成的 URL，重复运行时跳过有效期内已完成的 URL
+
+    使用单表 SQLite 存储：(url_hash, completed_at, image_count, output_path)。
+    """
+
+    def __init__(self, db_path: str, ttl: int):
+        """初始化缓存
+
+        Args:
+            db_path: SQLite 数据库文件路径
+            ttl: 缓存有效期（秒）
+        """
+        self._ttl = ttl
+        path = Path(db_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS completed_urls (
+                url_hash TEXT PRIMARY KEY,
+                completed_at INTEGER NOT NULL,
+                image_count INTEGER NOT NULL,
+                output_path TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def __enter__(self) -> "CompletedUrlCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def _hash(url: str) -> str:
+        """计算 URL 的哈希值"""
+        return hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, url: str) -> Optional[str]:
+        """查询有效期内已完成的 URL 对应的输出文件
+
+        Args:
+            url: 内容页面 URL
+
+        Returns:
+            输出文件路径；未命中、已过期或输出文件已不存在时返回 None
+        """
+        row = self._conn.execute(
+            "SELECT completed_at, output_path FROM completed_urls WHERE url_hash = ?",
+            (self._hash(url),),
+        ).fetchone()
+        if row is None:
+            return None
+
+        completed_at, output_path = row
+        if time.time() - completed_at >= self._ttl:
+            logger.debug(f"Cache entry expired for URL: {url}")
+            return None
+        if not Path(output_path).exists():
+            logger.debug(f"Cached output file missing for URL: {url}")
+            return None
+        return output_path
+
+    def put(self, url: str, output_path: str, image_count: int) -> None:
+        """记录已完成的 URL
+
+        Args:
+            url: 内容页面 URL
+            output_path: 生成的输出文件路径
+            image_count: 图片数量
+        """
+        self._conn.execute(
+            "INSERT OR REPLACE INTO completed_urls "
+            "(url_hash, completed_at, image_count, output_path) VALUES (?, ?, ?, ?)",
+            (self._hash(url), int(time.time()), image_count, output_path),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        self._conn.close()
@@ -0,0 +1,204 @@
+"""纯图片 Word 文档写入工具（直接组装 OOXML）"""
+
+import zipfile
+from pathlib import Path
+from typing import Dict, List
+
+# 1 英寸 = 914400 EMU
+EMU_PER_INCH = 914400
+
+# 图片格式 -> (扩展名, Content-Type)
+_IMAGE_TYPES: Dict[str, tuple[str, str]] = {
+    "JPEG": ("jpeg", "image/jpeg"),
+    "PNG": ("png", "image/png"),
+    "GIF": ("gif", "image/gif"),
+    "BMP": ("bmp", "image/bmp"),
+}
+
+_PACKAGE_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    "</Relationships>"
+)
+
+_DOCUMENT_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" '
+    'xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing" '
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+    "<w:body>"
+)
+
+_PICTURE_PARAGRAPH = (
+    '<w:p><w:pPr><w:jc w:val="center"/></w:pPr><w:r><w:drawing>'
+    '<wp:inline distT="0" distB="0" distL="0" distR="0">'
+    '<wp:extent cx="{cx}" cy="{cy}"/>'
+    '<wp:docPr id="{n}" name="Picture {n}"/>'
+    '<wp:cNvGraphicFramePr><a:graphicFrameLocks noChangeAspect="1"/></wp:cNvGraphicFramePr>'
+    '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+    "<pic:pic>"
+    '<pic:nvPicPr><pic:cNvPr id="{n}" name="{name}"/><pic:cNvPicPr/></pic:nvPicPr>'
+    '<pic:blipFill><a:blip r:embed="rId{n}"/><a:stretch><a:fillRect/></a:stretch></pic:blipFill>'
+    '<pic:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></pic:spPr>'
+    "</pic:pic></a:graphicData></a:graphic></wp:inline></w:drawing></w:r></w:p>"
+)
+
+_IMAGE_RELATIONSHIP = (
+    '<Relationship Id="rId{n}" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/image" '
+    'Target="media/{name}"/>'
+)
+
+
+class ImageDocxWriter:
+    """直接组装 OOXML 的纯图片 Word 文档写入器
+
+    每张图片添加时立即写入 zip 的 word/media/，不在内存中保留图片数据和 XML 树；
+    关闭时再写入 document.xml、关系文件和 [Content_Types].xml。
+    页面为 Letter 纸张，四周边距为 0。
+
+        with ImageDocxWriter("out.docx") as writer:
+            writer.add_image(data, "JPEG", width_inches, height_inches)
+    """
+
+    # Letter 纸张尺寸（twips，1 英寸 = 1440 twips）
+    PAGE_WIDTH_TWIPS = 12240
+    PAGE_HEIGHT_TWIPS = 15840
+
+    def __init__(self, output_path: str):
+        """初始化写入器
+
+        Args:
+            output_path: 输出的 .docx 文件路径
+        """
+        self._output_path = Path(output_path)
+        self._zip = zipfile.ZipFile(self._output_path, "w", zipfile.ZIP_DEFLATED)
+        self._paragraphs: List[str] = []
+        self._relationships: List[str] = []
+        self._extensions: Dict[str, str] = {}
+        self._closed = False
+
+    @classmethod
+    def page_dimensions(cls) -> tuple[float, float]:
+        """获取页面可用尺寸（英寸），边距为 0，即整页大小
+
+        Returns:
+            (width, height) 元组，单位为英寸
+        """
+        return cls.PAGE_WIDTH_TWIPS / 1440, cls.PAGE_HEIGHT_TWIPS / 1440
+
+    def __enter__(self) -> "ImageDocxWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            # 出错时丢弃未写完的文件
+            self._zip.close()
+            self._closed = True
+            self._output_path.unlink(missing_ok=True)
+
+    def add_image(
+        self, image_data: bytes, image_format: str, width_inches: float, height_inches: float
+    ) -> None:
+        """添加一张居中的图片，单独占一个段落
+
+        Args:
+            image_data: 图片二进制数据
+            image_format: 图片格式（JPEG、PNG、GIF、BMP）
+            width_inches: 显示宽度（英寸）
+            height_inches: 显示高度（英寸）
+
+        Raises:
+            ValueError: 图片格式不受支持时
+        """
+        name = self._next_image_name(image_format)
+        # 图片本身已压缩，直接存储，不再 deflate
+        self._zip.writestr(f"word/media/{name}", image_data, compress_type=zipfile.ZIP_STORED)
+        self._add_picture_paragraph(name, width_inches, height_inches)
+
+    def add_image_file(
+        self, image_path: Path, image_format: str, width_inches: float, height_inches: float
+    ) -> None:
+        """从文件添加一张居中的图片，图片数据从磁盘流式写入 zip，不整体读入内存
+
+        Args:
+            image_path: 图片文件路径
+            image_format: 图片格式（JPEG、PNG、GIF、BMP）
+            width_inches: 显示宽度（英寸）
+            height_inches: 显示高度（英寸）
+
+        Raises:
+            ValueError: 图片格式不受支持时
+        """
+        name = self._next_image_name(image_format)
+        self._zip.write(image_path, f"word/media/{name}", compress_type=zipfile.ZIP_STORED)
+        self._add_picture_paragraph(name, width_inches, height_inches)
+
+    def _next_image_name(self, image_format: str) -> str:
+        """校验图片格式并生成下一张图片在 word/media/ 中的文件名"""
+        if image_format not in _IMAGE_TYPES:
+            raise ValueError(f"Unsupported image format for docx: {image_format}")
+
+        ext, content_type = _IMAGE_TYPES[image_format]
+        self._extensions[ext] = content_type
+        return f"image{len(self._paragraphs) + 1}.{ext}"
+
+    def _add_picture_paragraph(self, name: str, width_inches: float, height_inches: float) -> None:
+        """记录图片段落和关系（图片数据已写入 zip）"""
+        n = len(self._paragraphs) + 1
+        cx = round(width_inches * EMU_PER_INCH)
+        cy = round(height_inches * EMU_PER_INCH)
+        self._paragraphs.append(_PICTURE_PARAGRAPH.format(n=n, name=name, cx=cx, cy=cy))
+        self._relationships.append(_IMAGE_RELATIONSHIP.format(n=n, name=name))
+
+    def close(self) -> None:
+        """写入文档主体、关系和内容类型，完成 .docx 文件"""
+        if self._closed:
+            return
+
+        section = (
+            "<w:sectPr>"
+            f'<w:pgSz w:w="{self.PAGE_WIDTH_TWIPS}" w:h="{self.PAGE_HEIGHT_TWIPS}"/>'
+            '<w:pgMar w:top="0" w:right="0" w:bottom="0" w:left="0" '
+            'w:header="0" w:footer="0" w:gutter="0"/>'
+            "</w:sectPr>"
+        )
+        document = (
+            _DOCUMENT_HEAD + "".join(self._paragraphs) + section + "</w:body></w:document>"
+        )
+        document_rels = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            + "".join(self._relationships)
+            + "</Relationships>"
+        )
+        image_defaults = "".join(
+            f'<Default Extension="{ext}" ContentType="{content_type}"/>'
+            for ext, content_type in self._extensions.items()
+        )
+        content_types = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" '
+            'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            + image_defaults
+            + '<Override PartName="/word/document.xml" ContentType="application/'
+            'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+            "</Types>"
+        )
+
+        self._zip.writestr("[Content_Types].xml", content_types)
+        self._zip.writestr("_rels/.rels", _PACKAGE_RELS)
+        self._zip.writestr("word/document.xml", document)
+        self._zip.writestr("word/_rels/document.xml.rels", document_rels)
+        self._zip.close()
+        self._closed = True
@@ -0,0 +1,96 @@
+"""PDF 转换结果缓存工具"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from loguru import logger
+
+
+class PdfCache:
+    """按 Word 文档内容哈希缓存转换后的 PDF
+
+    相同内容的文档（例如重试时重新生成的同一份文档）直接复制缓存的 PDF，
+    不再调用 LibreOffice。缓存总大小超过上限时，按最近使用时间淘汰最旧的文件。
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """初始化缓存
+
+        Args:
+            cache_dir: 缓存目录
+            max_bytes: 缓存总大小上限（字节）
+        """
+        self._dir = Path(cache_dir).expanduser()
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+
+    @staticmethod
+    def key(word_file: Path) -> str:
+        """分块读取文档计算内容哈希"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(word_file, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get(self, key: str, pdf_file: Path) -> bool:
+        """命中时将缓存的 PDF 复制到 pdf_file
+
+        Args:
+            key: 文档内容哈希
+            pdf_file: PDF 输出路径
+
+        Returns:
+            是否命中缓存
+        """
+        cached = self._dir / f"{key}.pdf"
+        try:
+            shutil.copyfile(cached, pdf_file)
+        except FileNotFoundError:
+            return False
+        # 更新修改时间，作为最近使用时间参与淘汰
+        os.utime(cached)
+        return True
+
+    def put(self, key: str, pdf_file: Path) -> None:
+        """将生成的 PDF 存入缓存（先写临时文件再原子替换），并按需淘汰旧文件
+
+        Args:
+            key: 文档内容哈希
+            pdf_file: 生成的 PDF 文件路径
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(pdf_file, tmp_path)
+            os.replace(tmp_path, self._dir / f"{key}.pdf")
+        except OSError as e:
+            Path(tmp_path).unlink(missing_ok=True)
+            logger.warning(f"写入 PDF 缓存失败: {e}")
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        """缓存总大小超过上限时，删除最久未使用的文件"""
+        entries = []
+        total = 0
+        with os.scandir(self._dir) as it:
+            for entry in it:
+                if entry.name.endswith(".pdf") and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        if total <= self._max_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self._max_bytes:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+            except OSError:
+                pass
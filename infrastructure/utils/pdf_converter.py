@@ -1,54 +1,238 @@
 """Word 转 PDF 转换工具"""
 
+import atexit
+import os
+import queue
+import socket
 import subprocess
 import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 from loguru import logger
 
+from infrastructure.utils.pdf_cache import PdfCache
+
 try:
     from docx2pdf import convert as docx2pdf_convert
 except ImportError:
     docx2pdf_convert = None
 
+# docx2pdf 依赖 Microsoft Word（Windows COM 或 macOS 自动化），其他平台上必然失败
+_DOCX2PDF_USABLE = docx2pdf_convert is not None and sys.platform in ("win32", "darwin")
 
-class WordToPdfConverter:
-    """Word 文档转 PDF 转换器"""
+try:
+    from unoserver.client import UnoClient
+except ImportError:
+    UnoClient = None
 
-    def __init__(self):
-        """初始化转换器"""
-        self._libreoffice_path = self._find_libreoffice()
 
-    def _find_libreoffice(self) -> Optional[str]:
-        """查找 LibreOffice 可执行文件路径
+@lru_cache(maxsize=1)
+def _discover_libreoffice() -> Optional[str]:
+    """查找 LibreOffice 可执行文件路径（进程内只查找一次）
 
-        Returns:
-            LibreOffice 可执行文件路径，如果未找到则返回 None
+    Returns:
+        LibreOffice 可执行文件路径，如果未找到则返回 None
+    """
+    # Windows 常见路径
+    windows_paths = [
+        r"C:\Program Files\LibreOffice\program\soffice.exe",
+        r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
+    ]
+
+    # Linux/Mac 路径
+    unix_paths = ["soffice", "/usr/bin/soffice", "/usr/local/bin/soffice"]
+
+    # 检查系统路径中的 soffice
+    if shutil.which("soffice"):
+        return "soffice"
+
+    # 检查 Windows 路径
+    for path in windows_paths:
+        if Path(path).exists():
+            return path
+
+    # 检查 Unix 路径
+    for path in unix_paths:
+        if Path(path).exists():
+            return path
+
+    return None
+
+
+class LibreOfficeDaemon:
+    """常驻的 LibreOffice 转换服务
+
+    通过 unoserver 启动一个 headless soffice 并保持运行，之后的转换通过 XML-RPC
+    提交给已加载的实例，不必每次冷启动 LibreOffice（每次约 2~3 秒）。
+    每个服务使用独立的端口和用户配置目录，多个服务可以同时运行。
+
+    需要在带有 python3-uno 的环境中安装 unoserver（pip install unoserver），
+    未安装时转换器自动回退到命令行转换。
+    """
+
+    STARTUP_TIMEOUT = 30  # 等待服务端口就绪的最长时间（秒）
+
+    def __init__(self, port: int = 2003, uno_port: int = 2002, host: str = "127.0.0.1"):
+        """初始化服务（不立即启动）
+
+        Args:
+            port: unoserver XML-RPC 端口
+            uno_port: soffice 的 UNO 监听端口
+            host: 监听地址
+        """
+        self._host = host
+        self._port = port
+        self._uno_port = uno_port
+        self._process: Optional[subprocess.Popen] = None
+        self._profile_dir: Optional[str] = None
+        self._client = None
+        self._atexit_registered = False
+
+    @property
+    def port(self) -> int:
+        """unoserver XML-RPC 端口"""
+        return self._port
+
+    @property
+    def uno_port(self) -> int:
+        """soffice 的 UNO 监听端口"""
+        return self._uno_port
+
+    @staticmethod
+    def is_available() -> bool:
+        """unoserver 客户端库和服务端命令是否都已安装"""
+        return UnoClient is not None and shutil.which("unoserver") is not None
+
+    @property
+    def running(self) -> bool:
+        """服务进程是否仍在运行"""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> None:
+        """启动服务并等待端口就绪，已在运行时直接返回
+
+        Raises:
+            RuntimeError: 服务启动失败或超时
         """
-        # Windows 常见路径
-        windows_paths = [
-            r"C:\Program Files\LibreOffice\program\soffice.exe",
-            r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
+        if self.running:
+            return
+
+        self._profile_dir = tempfile.mkdtemp(prefix="lo-profile-")
+        cmd = [
+            "unoserver",
+            "--interface",
+            self._host,
+            "--port",
+            str(self._port),
+            "--uno-port",
+            str(self._uno_port),
+            "--user-installation",
+            Path(self._profile_dir).as_uri(),
         ]
+        logger.info(f"启动 LibreOffice 转换服务: {self._host}:{self._port}")
+        self._process = subprocess.Popen(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        if not self._atexit_registered:
+            atexit.register(self.stop)
+            self._atexit_registered = True
+
+        self._wait_until_ready()
+        self._client = UnoClient(server=self._host, port=str(self._port))
+
+    def _wait_until_ready(self) -> None:
+        """轮询服务端口，直到可以连接"""
+        deadline = time.monotonic() + self.STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if not self.running:
+                self.stop()
+                raise RuntimeError("LibreOffice 转换服务启动失败")
+            try:
+                with socket.create_connection((self._host, self._port), timeout=1):
+                    return
+            except OSError:
+                time.sleep(0.2)
+        self.stop()
+        raise RuntimeError("LibreOffice 转换服务启动超时")
 
-        # Linux/Mac 路径
-        unix_paths = ["soffice", "/usr/bin/soffice", "/usr/local/bin/soffice"]
+    def convert(self, word_file: Path, pdf_file: Path) -> None:
+        """将 Word 文档转换为 PDF，服务未运行时先启动
 
-        # 检查系统路径中的 soffice
-        if shutil.which("soffice"):
-            return "soffice"
+        Args:
+            word_file: Word 文档路径
+            pdf_file: PDF 输出路径
+        """
+        self.start()
+        self._client.convert(
+            inpath=str(word_file), outpath=str(pdf_file), convert_to="pdf"
+        )
 
-        # 检查 Windows 路径
-        for path in windows_paths:
-            if Path(path).exists():
-                return path
+    def stop(self) -> None:
+        """停止服务并删除临时用户配置目录"""
+        if self._process is not None:
+            if self._process.poll() is None:
+                self._process.terminate()
+                try:
+                    self._process.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+                    self._process.wait()
+            self._process = None
+        self._client = None
+        if self._profile_dir:
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+            self._profile_dir = None
 
-        # 检查 Unix 路径
-        for path in unix_paths:
-            if Path(path).exists():
-                return path
 
-        return None
+class WordToPdfConverter:
+    """Word 文档转 PDF 转换器"""
+
+    DEFAULT_CACHE_DIR = "~/.cache/crawler/pdf"
+    DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+    def __init__(
+        self,
+        use_daemon: bool = True,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ):
+        """初始化转换器
+
+        Args:
+            use_daemon: 安装了 unoserver 时，是否使用常驻的 LibreOffice 服务转换
+                （首次转换时启动，进程退出或调用 close 时停止）
+            cache_dir: PDF 缓存目录（按 Word 文档内容哈希），为 None 时不使用缓存
+            cache_max_bytes: PDF 缓存总大小上限（字节）
+        """
+        self._libreoffice_path = _discover_libreoffice()
+        # 命令行中不变的部分只构建一次
+        # --headless: 无界面模式
+        # --convert-to pdf: 转换为 PDF
+        # --outdir: 输出目录
+        self._cmd_prefix: tuple[str, ...] = (
+            (self._libreoffice_path, "--headless", "--convert-to", "pdf", "--outdir")
+            if self._libreoffice_path
+            else ()
+        )
+        self._daemon: Optional[LibreOfficeDaemon] = None
+        if use_daemon and self._libreoffice_path and LibreOfficeDaemon.is_available():
+            self._daemon = LibreOfficeDaemon()
+        self._cache: Optional[PdfCache] = None
+        if cache_dir:
+            try:
+                self._cache = PdfCache(cache_dir, cache_max_bytes)
+            except OSError as e:
+                logger.warning(f"无法创建 PDF 缓存目录，不使用缓存: {e}")
+
+    def close(self) -> None:
+        """停止常驻的 LibreOffice 服务（如果已启动）"""
+        if self._daemon is not None:
+            self._daemon.stop()
 
     def convert_with_libreoffice(
         self, word_path: str, output_dir: Optional[str] = None
@@ -81,38 +265,306 @@ class WordToPdfConverter:
 
         logger.info(f"使用 LibreOffice 转换: {word_path} -> {output_path}")
 
-        try:
-            # 使用 LibreOffice 命令行转换
-            # --headless: 无界面模式
-            # --convert-to pdf: 转换为 PDF
-            # --outdir: 输出目录
-            cmd = [
-                self._libreoffice_path,
-                "--headless",
-                "--convert-to",
-                "pdf",
-                "--outdir",
-                str(output_path),
-                str(word_file),
-            ]
-
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=60, check=True
-            )
-
-            # 生成的 PDF 文件名
-            pdf_file = output_path / f"{word_file.stem}.pdf"
+        # 生成的 PDF 文件名（两种转换方式相同）
+        pdf_file = output_path / f"{word_file.stem}.pdf"
 
-            if pdf_file.exists():
+        # 优先交给常驻服务，失败时回退到命令行转换
+        if self._daemon is not None:
+            try:
+                self._daemon.convert(word_file, pdf_file)
                 logger.info(f"PDF 文件已生成: {pdf_file}")
                 return str(pdf_file)
-            else:
-                raise RuntimeError(f"PDF 文件未生成: {pdf_file}")
+            except Exception as e:
+                logger.warning(f"LibreOffice 服务转换失败，改用命令行转换: {e}")
+
+        # 使用 LibreOffice 命令行转换
+        self._run_libreoffice([word_file], output_path, timeout=60)
 
+        if pdf_file.exists():
+            logger.info(f"PDF 文件已生成: {pdf_file}")
+            return str(pdf_file)
+        else:
+            raise RuntimeError(f"PDF 文件未生成: {pdf_file}")
+
+    def _run_libreoffice(
+        self,
+        word_files: List[Path],
+        output_path: Path,
+        timeout: int,
+        profile_dir: Optional[str] = None,
+    ) -> None:
+        """调用一次 LibreOffice 命令行，将若干 Word 文档转换为 PDF 输出到同一目录
+
+        Args:
+            word_files: Word 文档路径列表
+            output_path: 输出目录
+            timeout: 超时时间（秒）
+            profile_dir: 独立的用户配置目录，并行运行多个 LibreOffice 时必须各不相同
+
+        Raises:
+            RuntimeError: 转换超时或 LibreOffice 返回错误时
+        """
+        cmd = [
+            *self._cmd_prefix,
+            str(output_path),
+            *(str(word_file) for word_file in word_files),
+        ]
+        if profile_dir:
+            cmd.append(f"-env:UserInstallation={Path(profile_dir).as_uri()}")
+
+        # 标准输出用不到，直接丢弃；错误输出只在失败时解码
+        try:
+            subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=timeout,
+                check=True,
+            )
         except subprocess.TimeoutExpired:
             raise RuntimeError("转换超时")
         except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"LibreOffice 转换失败: {e.stderr}")
+            stderr = e.stderr.decode("utf-8", "replace") if e.stderr else ""
+            raise RuntimeError(f"LibreOffice 转换失败: {stderr}")
+
+    def convert_batch(
+        self,
+        word_paths: List[str],
+        output_dir: Optional[str] = None,
+        batch_size: int = 10,
+    ) -> Dict[str, str]:
+        """使用 LibreOffice 批量将 Word 文档转换为 PDF
+
+        命令行方式下每批文档只启动一次 LibreOffice，分摊启动开销；
+        批次大小有上限，单批超时或出错只影响该批文档。使用常驻服务时逐个提交。
+
+        Args:
+            word_paths: Word 文档路径列表
+            output_dir: 输出目录，如果为 None 则输出到各 Word 文档所在目录
+            batch_size: 每次调用 LibreOffice 转换的最大文档数
+
+        Returns:
+            Word 文档路径到生成的 PDF 文件路径的映射，转换失败的文档不包含在内
+
+        Raises:
+            RuntimeError: 当 LibreOffice 未安装时
+        """
+        if not self._libreoffice_path:
+            raise RuntimeError("LibreOffice 未安装，无法进行转换")
+
+        # 按输出目录分组（同一次调用只能指定一个 --outdir）
+        fixed_output = Path(output_dir) if output_dir else None
+        groups: Dict[Path, List[Path]] = {}
+        for word_path in dict.fromkeys(word_paths):
+            word_file = Path(word_path)
+            if not word_file.exists():
+                logger.warning(f"Word 文件不存在，跳过: {word_path}")
+                continue
+            groups.setdefault(fixed_output or word_file.parent, []).append(word_file)
+
+        results: Dict[str, str] = {}
+        for output_path, word_files in groups.items():
+            output_path.mkdir(parents=True, exist_ok=True)
+
+            # 相同内容的文档已转换过时直接复制缓存的 PDF，只转换未命中的文档
+            pending: List[Path] = []
+            cache_keys: Dict[Path, Optional[str]] = {}
+            for word_file in word_files:
+                pdf_file = output_path / f"{word_file.stem}.pdf"
+                cache_key = self._cache_key(word_file)
+                if cache_key and self._restore_cached(cache_key, pdf_file):
+                    results[str(word_file)] = str(pdf_file)
+                else:
+                    cache_keys[word_file] = cache_key
+                    pending.append(word_file)
+            if not pending:
+                continue
+
+            # 常驻服务没有启动开销，逐个提交即可；命令行方式每批只启动一次 LibreOffice
+            if self._daemon is not None:
+                batches = [[word_file] for word_file in pending]
+            else:
+                batches = [
+                    pending[start:start + batch_size]
+                    for start in range(0, len(pending), batch_size)
+                ]
+
+            # 转换结果先写到同目录下的临时目录，每批完成后逐个原子替换目标文件
+            with tempfile.TemporaryDirectory(prefix=".pdf-", dir=output_path) as tmp_dir:
+                tmp_path = Path(tmp_dir)
+                for batch in batches:
+                    if self._daemon is not None:
+                        self._convert_one_safe(batch[0], tmp_path)
+                    else:
+                        logger.info(
+                            f"使用 LibreOffice 批量转换 {len(batch)} 个文档 -> {output_path}"
+                        )
+                        try:
+                            self._run_libreoffice(batch, tmp_path, timeout=60 * len(batch))
+                        except RuntimeError as e:
+                            # 部分文档可能已经转换完成，继续按输出文件检查
+                            logger.warning(f"批量转换失败: {e}")
+
+                    for word_file in batch:
+                        pdf_file = output_path / f"{word_file.stem}.pdf"
+                        if self._publish(
+                            tmp_path / pdf_file.name, pdf_file, cache_keys[word_file]
+                        ):
+                            results[str(word_file)] = str(pdf_file)
+                        else:
+                            logger.warning(f"PDF 文件未生成: {pdf_file}")
+
+        logger.info(f"批量转换完成: {len(results)}/{sum(map(len, groups.values()))} 个 PDF 文件")
+        return results
+
+    def convert_many(
+        self,
+        word_paths: List[str],
+        output_dir: Optional[str] = None,
+        workers: Optional[int] = None,
+    ) -> Dict[str, str]:
+        """使用多个 LibreOffice 实例并行将 Word 文档转换为 PDF
+
+        LibreOffice 只有在用户配置目录（以及服务端口）各不相同时才能安全地并行运行，
+        因此每个并发槽位持有独立的配置目录（或独立端口的常驻服务），转换时借出、完成后归还。
+        实际工作在 LibreOffice 子进程中进行，这里用线程等待即可。
+
+        Args:
+            word_paths: Word 文档路径列表
+            output_dir: 输出目录，如果为 None 则输出到各 Word 文档所在目录
+            workers: 并行转换数，默认为 CPU 核数
+
+        Returns:
+            Word 文档路径到生成的 PDF 文件路径的映射，转换失败的文档不包含在内
+
+        Raises:
+            RuntimeError: 当 LibreOffice 未安装时
+        """
+        if not self._libreoffice_path:
+            raise RuntimeError("LibreOffice 未安装，无法进行转换")
+
+        word_files = []
+        for word_path in dict.fromkeys(word_paths):
+            word_file = Path(word_path)
+            if word_file.exists():
+                word_files.append(word_file)
+            else:
+                logger.warning(f"Word 文件不存在，跳过: {word_path}")
+        if not word_files:
+            return {}
+
+        workers = max(1, min(workers or os.cpu_count() or 1, len(word_files)))
+        logger.info(f"使用 {workers} 个 LibreOffice 实例并行转换 {len(word_files)} 个文档")
+
+        # 每个槽位：常驻服务（各用一对端口）或独立的用户配置目录
+        slots: queue.Queue = queue.Queue()
+        extra_daemons: List[LibreOfficeDaemon] = []
+        profile_dirs: List[str] = []
+        if self._daemon is not None:
+            slots.put(self._daemon)
+            for i in range(1, workers):
+                daemon = LibreOfficeDaemon(
+                    port=self._daemon.port + 2 * i, uno_port=self._daemon.uno_port + 2 * i
+                )
+                extra_daemons.append(daemon)
+                slots.put(daemon)
+        else:
+            for _ in range(workers):
+                profile_dir = tempfile.mkdtemp(prefix="lo-profile-")
+                profile_dirs.append(profile_dir)
+                slots.put(profile_dir)
+
+        fixed_output = Path(output_dir) if output_dir else None
+
+        def _convert(word_file: Path) -> str:
+            output_path = fixed_output or word_file.parent
+            output_path.mkdir(parents=True, exist_ok=True)
+            pdf_file = output_path / f"{word_file.stem}.pdf"
+            cache_key = self._cache_key(word_file)
+            if cache_key and self._restore_cached(cache_key, pdf_file):
+                return str(pdf_file)
+
+            # 先转换到临时目录，完成后原子替换目标文件
+            with tempfile.TemporaryDirectory(prefix=".pdf-", dir=output_path) as tmp_dir:
+                tmp_pdf = Path(tmp_dir) / pdf_file.name
+                slot = slots.get()
+                try:
+                    if isinstance(slot, LibreOfficeDaemon):
+                        slot.convert(word_file, tmp_pdf)
+                    else:
+                        self._run_libreoffice(
+                            [word_file], Path(tmp_dir), timeout=60, profile_dir=slot
+                        )
+                finally:
+                    slots.put(slot)
+                if not self._publish(tmp_pdf, pdf_file, cache_key):
+                    raise RuntimeError(f"PDF 文件未生成: {pdf_file}")
+            return str(pdf_file)
+
+        results: Dict[str, str] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(_convert, word_file): word_file for word_file in word_files
+                }
+                for future in as_completed(futures):
+                    word_file = futures[future]
+                    try:
+                        results[str(word_file)] = future.result()
+                    except Exception as e:
+                        logger.warning(f"转换失败: {word_file}: {e}")
+        finally:
+            for daemon in extra_daemons:
+                daemon.stop()
+            for profile_dir in profile_dirs:
+                shutil.rmtree(profile_dir, ignore_errors=True)
+
+        logger.info(f"并行转换完成: {len(results)}/{len(word_files)} 个 PDF 文件")
+        return results
+
+    def _cache_key(self, word_file: Path) -> Optional[str]:
+        """计算文档的 PDF 缓存键，未启用缓存或读取失败时返回 None"""
+        if self._cache is None:
+            return None
+        try:
+            return self._cache.key(word_file)
+        except OSError as e:
+            logger.warning(f"无法计算 PDF 缓存键: {word_file}: {e}")
+            return None
+
+    def _restore_cached(self, cache_key: str, pdf_file: Path) -> bool:
+        """命中缓存时先复制到同目录的临时文件，再原子替换 pdf_file"""
+        fd, tmp_path = tempfile.mkstemp(prefix=".pdf-", suffix=".tmp", dir=pdf_file.parent)
+        os.close(fd)
+        try:
+            if self._cache.get(cache_key, Path(tmp_path)):
+                os.replace(tmp_path, pdf_file)
+                logger.info(f"命中 PDF 缓存: {pdf_file}")
+                return True
+        finally:
+            Path(tmp_path).unlink(missing_ok=True)
+        return False
+
+    def _publish(self, tmp_pdf: Path, pdf_file: Path, cache_key: Optional[str]) -> bool:
+        """将临时目录中生成的 PDF 原子替换到目标路径并存入缓存
+
+        Returns:
+            临时 PDF 是否存在（即转换是否成功）
+        """
+        if not tmp_pdf.exists():
+            return False
+        os.replace(tmp_pdf, pdf_file)
+        if cache_key:
+            self._cache.put(cache_key, pdf_file)
+        return True
+
+    def _convert_one_safe(self, word_file: Path, output_path: Path) -> Optional[str]:
+        """转换单个文档，失败时记录日志并返回 None"""
+        try:
+            return self.convert_with_libreoffice(str(word_file), str(output_path))
+        except Exception as e:
+            logger.warning(f"转换失败: {word_file}: {e}")
+            return None
 
     def convert_with_docx2pdf(
         self, word_path: str, pdf_path: Optional[str] = None
@@ -133,6 +585,8 @@ class WordToPdfConverter:
             raise RuntimeError(
                 "docx2pdf 库未安装，请运行: pip install docx2pdf"
             )
+        if not _DOCX2PDF_USABLE:
+            raise RuntimeError("docx2pdf 需要 Microsoft Word，仅支持 Windows 和 macOS")
 
         word_file = Path(word_path)
         if not word_file.exists():
@@ -183,11 +637,6 @@ class WordToPdfConverter:
         else:
             pdf_file = word_file.parent / f"{word_file.stem}.pdf"
 
-        # 如果输出文件已存在，先删除
-        if pdf_file.exists():
-            logger.warning(f"PDF 文件已存在，将被覆盖: {pdf_file}")
-            pdf_file.unlink()
-
         # 尝试转换方法
         methods = []
 
@@ -196,7 +645,7 @@ class WordToPdfConverter:
         elif self._libreoffice_path:
             methods.append(("LibreOffice", self._convert_with_libreoffice_safe))
 
-        if docx2pdf_convert:
+        if _DOCX2PDF_USABLE:
             methods.append(("docx2pdf", self._convert_with_docx2pdf_safe))
 
         if not methods:
@@ -204,25 +653,37 @@ class WordToPdfConverter:
                 "未找到可用的转换方法。请安装 LibreOffice 或 docx2pdf 库"
             )
 
-        # 尝试每种方法
-        last_error = None
-        for method_name, method_func in methods:
-            try:
-                logger.info(f"尝试使用 {method_name} 进行转换...")
-                if method_name == "LibreOffice":
-                    # LibreOffice 需要输出目录
-                    result = method_func(word_path, str(pdf_file.parent))
-                    # 如果生成的文件名不同，重命名
-                    generated_pdf = Path(result)
-                    if generated_pdf != pdf_file:
-                        generated_pdf.rename(pdf_file)
+        # 转换结果先写到同目录下的临时目录，完成后用 os.replace 原子替换目标文件，
+        # 已存在的 PDF 在替换前始终保持完整可读
+        pdf_file.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(prefix=".pdf-", dir=pdf_file.parent) as tmp_dir:
+            tmp_pdf = Path(tmp_dir) / pdf_file.name
+
+            # 相同内容的文档已转换过时直接复制缓存的 PDF
+            cache_key = self._cache.key(word_file) if self._cache else None
+            if cache_key and self._cache.get(cache_key, tmp_pdf):
+                os.replace(tmp_pdf, pdf_file)
+                logger.info(f"命中 PDF 缓存: {word_path} -> {pdf_file}")
+                return str(pdf_file)
+
+            # 尝试每种方法
+            last_error = None
+            for method_name, method_func in methods:
+                try:
+                    logger.info(f"尝试使用 {method_name} 进行转换...")
+                    if method_name == "LibreOffice":
+                        # LibreOffice 需要输出目录，生成的文件名为 <stem>.pdf
+                        os.replace(method_func(word_path, tmp_dir), pdf_file)
+                    else:
+                        method_func(word_path, str(tmp_pdf))
+                        os.replace(tmp_pdf, pdf_file)
+                    if cache_key:
+                        self._cache.put(cache_key, pdf_file)
                     return str(pdf_file)
-                else:
-                    return method_func(word_path, str(pdf_file))
-            except Exception as e:
-                logger.warning(f"{method_name} 转换失败: {e}")
-                last_error = e
-                continue
+                except Exception as e:
+                    logger.warning(f"{method_name} 转换失败: {e}")
+                    last_error = e
+                    continue
 
         # 所有方法都失败
         raise RuntimeError(
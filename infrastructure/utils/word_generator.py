@@ -1,9 +1,10 @@
 """Word 文档生成工具"""
 
+import asyncio
 import os
 import httpx
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Union
 from io import BytesIO
 from loguru import logger
 
@@ -15,33 +16,144 @@ from PIL import Image
 
 
 class WordImageGenerator:
-    """Word 图片文档生成器"""
+    """Word 图片文档生成器
 
-    def __init__(self, output_dir: str = "output"):
+    作为异步上下文管理器使用时，会在整个上下文内共享一个带连接池的 HTTP 客户端，
+    同一 CDN 主机上的图片下载可以复用 TCP/TLS 连接：
+
+        async with WordImageGenerator() as generator:
+            data = await generator.download_image(url)
+    """
+
+    # 嵌入图片的分辨率上限（打印分辨率）和缩小后重新编码 JPEG 的质量
+    EMBED_DPI = 300
+    EMBED_JPEG_QUALITY = 85
+
+    def __init__(self, output_dir: str = "output", timeout: int = 30):
         """初始化生成器
 
         Args:
             output_dir: 输出目录
+            timeout: 共享 HTTP 客户端的超时时间（秒）
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "WordImageGenerator":
+        """创建共享的 HTTP 客户端（keep-alive 连接池）"""
+        self._client = httpx.AsyncClient(
+            timeout=self._timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=16,
+                keepalive_expiry=60,
+            ),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """关闭共享的 HTTP 客户端"""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
 
     async def download_image(self, url: str, timeout: int = 30) -> bytes:
         """下载图片
 
+        在上下文管理器内调用时复用共享客户端，否则为本次下载创建临时客户端。
+
         Args:
             url: 图片 URL
-            timeout: 超时时间（秒）
+            timeout: 超时时间（秒），仅对临时客户端生效
 
         Returns:
             图片的二进制数据
         """
         logger.info(f"Downloading image: {url}")
+        if self._client is not None:
+            response = await self._client.get(url)
+            response.raise_for_status()
+            return response.content
+
         async with httpx.AsyncClient(timeout=timeout) as client:
             response = await client.get(url, follow_redirects=True)
             response.raise_for_status()
             return response.content
 
+    async def download_image_to_file(self, url: str, path: Path, timeout: int = 30) -> int:
+        """流式下载图片到文件，不在内存中保留完整的图片数据
+
+        在上下文管理器内调用时复用共享客户端，否则为本次下载创建临时客户端。
+
+        Args:
+            url: 图片 URL
+            path: 保存路径
+            timeout: 超时时间（秒），仅对临时客户端生效
+
+        Returns:
+            写入的字节数
+        """
+        logger.info(f"Downloading image: {url}")
+        if self._client is not None:
+            return await self._stream_to_file(self._client, url, path)
+
+        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+            return await self._stream_to_file(client, url, path)
+
+    @staticmethod
+    async def _stream_to_file(client: httpx.AsyncClient, url: str, path: Path) -> int:
+        """按块读取响应并写入文件"""
+        written = 0
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+            with open(path, "wb") as f:
+                async for chunk in response.aiter_bytes(65536):
+                    f.write(chunk)
+                    written += len(chunk)
+        return written
+
+    async def download_images(
+        self, urls: List[str], concurrency: int = 8
+    ) -> List[Union[bytes, BaseException]]:
+        """并发下载多张图片
+
+        所有请求共用一个带连接池的客户端（在上下文管理器内为共享客户端，
+        否则为本批次创建一个临时客户端），并用信号量限制同时进行的请求数。
+
+        Args:
+            urls: 图片 URL 列表
+            concurrency: 最大并发下载数
+
+        Returns:
+            与 urls 顺序一致的结果列表，成功为图片二进制数据，失败为对应的异常
+        """
+        sem = asyncio.Semaphore(max(1, concurrency))
+
+        async def _fetch(client: httpx.AsyncClient, url: str) -> bytes:
+            async with sem:
+                logger.debug(f"Downloading image: {url}")
+                response = await client.get(url)
+                response.raise_for_status()
+                return response.content
+
+        async def _gather(client: httpx.AsyncClient) -> List[Union[bytes, BaseException]]:
+            return await asyncio.gather(
+                *(_fetch(client, url) for url in urls), return_exceptions=True
+            )
+
+        if self._client is not None:
+            return await _gather(self._client)
+
+        async with httpx.AsyncClient(
+            timeout=self._timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=max(1, concurrency)),
+        ) as client:
+            return await _gather(client)
+
     def _get_image_size(self, image_data: bytes) -> tuple[int, int]:
         """获取图片尺寸
 
@@ -51,8 +163,40 @@ class WordImageGenerator:
         Returns:
             (width, height) 元组
         """
-        img = Image.open(BytesIO(image_data))
-        return img.size
+        # Image.open 只解析文件头，不解码像素数据
+        with Image.open(BytesIO(image_data)) as img:
+            return img.size
+
+    def _compress_for_embedding(self, image_data: bytes, max_width: float) -> bytes:
+        """将宽度超过 max_width 打印分辨率的图片等比缩小并重新编码，减小文档体积
+
+        不透明图片编码为 JPEG，带透明通道的编码为 PNG；无需缩小时返回原数据。
+
+        Args:
+            image_data: 图片二进制数据
+            max_width: 显示宽度（英寸）
+
+        Returns:
+            用于嵌入文档的图片二进制数据
+        """
+        target_width = int(max_width * self.EMBED_DPI)
+        with Image.open(BytesIO(image_data)) as img:
+            if img.width <= target_width:
+                return image_data
+            target_size = (target_width, max(1, round(img.height * target_width / img.width)))
+            if img.format == "JPEG":
+                # 让 libjpeg 在 DCT 域按比例缩放解码，避免生成全分辨率位图
+                img.draft("RGB", target_size)
+            resized = img.resize(target_size, Image.Resampling.LANCZOS)
+
+        buf = BytesIO()
+        if resized.mode in ("RGBA", "LA", "P"):
+            resized.save(buf, format="PNG", optimize=True)
+        else:
+            resized.convert("RGB").save(
+                buf, format="JPEG", quality=self.EMBED_JPEG_QUALITY, optimize=True
+            )
+        return buf.getvalue()
 
     def create_word_document(
         self, url_images_map: Dict[str, List[Dict[str, Any]]], filename: str = "xiaohongshu_images.docx"
@@ -121,21 +265,16 @@ class WordImageGenerator:
             image_data: 图片二进制数据
             max_width: 最大宽度（英寸）
         """
-        # 获取图片尺寸
-        width, height = self._get_image_size(image_data)
-
-        # 计算缩放比例，使宽度不超过 max_width
-        scale = max_width / (width / 96)  # 96 DPI 假设
-        scaled_width = (width / 96) * scale
-        scaled_height = (height / 96) * scale
-
         # 添加段落并居中
         para = doc.add_paragraph()
         para.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
-        # 添加图片
+        # 添加图片：宽度固定为 max_width，只指定宽度时 python-docx 按原图宽高比计算高度，
+        # 无需先解析图片尺寸
+        # 过大的图片先缩小到打印分辨率，减小文档体积和保存时的压缩开销
         run = para.add_run()
-        run.add_picture(BytesIO(image_data), width=Inches(scaled_width))
+        image_data = self._compress_for_embedding(image_data, max_width)
+        run.add_picture(BytesIO(image_data), width=Inches(max_width))
 
         # 添加空行
         doc.add_paragraph()
@@ -1,12 +1,15 @@
 """命令行接口主程序"""
 
 import asyncio
+import sys
+import aiofiles
 import click
 from typing import Optional
 from loguru import logger
 
 from infrastructure.database.session import AsyncSessionLocal
 from infrastructure.repositories import SQLAlchemyCrawlerTaskRepository
+from infrastructure.adapters.base_browser_service import stop_shared_playwright
 from infrastructure.adapters.playwright_service import PlaywrightBrowserService
 from infrastructure.adapters.xiaohongshu_service import XiaohongshuBrowserService
 from application.use_cases import CrawlUrlUseCase, GetTaskUseCase, ListTasksUseCase
@@ -19,6 +22,18 @@ from application.dto import (
     XiaohongshuDownloadImagesCommand,
 )
 
+try:
+    import uvloop
+except ImportError:  # uvloop 不支持 Windows，未安装时使用默认事件循环
+    uvloop = None
+
+
+def _run(coro):
+    """运行命令的协程，安装了 uvloop 时使用更快的 uvloop 事件循环"""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
 
 @click.group()
 def cli():
@@ -30,13 +45,19 @@ def cli():
 @click.argument("url")
 @click.option("--output", "-o", help="输出文件路径")
 @click.option("--headless/--no-headless", default=True, help="是否使用无头模式")
-def crawl(url: str, output: Optional[str], headless: bool):
+@click.option(
+    "--engine",
+    type=click.Choice(["playwright", "http", "auto"]),
+    default="playwright",
+    help="抓取方式：浏览器渲染、HTTP 直连（静态页面更快）或自动选择",
+)
+def crawl(url: str, output: Optional[str], headless: bool, engine: str):
     """爬取指定 URL"""
 
     async def _crawl():
         async with AsyncSessionLocal() as session:
             task_repo = SQLAlchemyCrawlerTaskRepository(session)
-            browser_service = PlaywrightBrowserService(headless=headless)
+            browser_service = PlaywrightBrowserService(headless=headless, engine=engine)
 
             try:
                 use_case = CrawlUrlUseCase(task_repo, browser_service)
@@ -49,8 +70,9 @@ def crawl(url: str, output: Optional[str], headless: bool):
 
                 if result.content:
                     if output:
-                        with open(output, "w", encoding="utf-8") as f:
-                            f.write(result.content)
+                        # 在线程池中写入，大页面编码和落盘时不阻塞事件循环
+                        async with aiofiles.open(output, "w", encoding="utf-8") as f:
+                            await f.write(result.content)
                         click.echo(f"Content saved to {output}")
                     else:
                         click.echo(f"Content length: {len(result.content)} bytes")
@@ -59,8 +81,9 @@ def crawl(url: str, output: Optional[str], headless: bool):
                     click.echo(f"Error: {result.error_message}", err=True)
             finally:
                 await browser_service.close()
+                await stop_shared_playwright()
 
-    asyncio.run(_crawl())
+    _run(_crawl())
 
 
 @cli.command()
@@ -75,23 +98,27 @@ def get_task(task_id: str):
 
             try:
                 result = await use_case.execute(task_id)
-                click.echo(f"Task ID: {result.task_id}")
-                click.echo(f"Status: {result.status}")
-                click.echo(f"URL: {result.url}")
-                click.echo(f"Created: {result.created_at}")
-                click.echo(f"Updated: {result.updated_at}")
+                lines = [
+                    f"Task ID: {result.task_id}",
+                    f"Status: {result.status}",
+                    f"URL: {result.url}",
+                    f"Created: {result.created_at}",
+                    f"Updated: {result.updated_at}",
+                ]
                 if result.error_message:
-                    click.echo(f"Error: {result.error_message}")
+                    lines.append(f"Error: {result.error_message}")
+                click.echo("\n".join(lines))
             except Exception as e:
                 click.echo(f"Error: {str(e)}", err=True)
 
-    asyncio.run(_get_task())
+    _run(_get_task())
 
 
 @cli.command()
+@click.option("--task-id", "task_ids", multiple=True, help="按任务 ID 筛选（可多个）")
 @click.option("--status", help="按状态筛选")
 @click.option("--limit", default=10, help="限制数量")
-def list_tasks(status: Optional[str], limit: int):
+def list_tasks(task_ids: tuple, status: Optional[str], limit: int):
     """列出任务"""
 
     async def _list_tasks():
@@ -99,20 +126,31 @@ def list_tasks(status: Optional[str], limit: int):
             task_repo = SQLAlchemyCrawlerTaskRepository(session)
             use_case = ListTasksUseCase(task_repo)
 
-            query = TaskQuery(status=status, limit=limit)
+            # 列表只显示基本信息，不需要加载页面内容
+            query = TaskQuery(
+                task_ids=list(task_ids) or None,
+                status=status,
+                limit=limit,
+                summary_only=True,
+            )
             results = await use_case.execute(query)
 
             if not results:
                 click.echo("No tasks found")
                 return
 
-            for result in results:
-                click.echo(f"\nTask ID: {result.task_id}")
-                click.echo(f"  Status: {result.status}")
-                click.echo(f"  URL: {result.url}")
-                click.echo(f"  Created: {result.created_at}")
+            # 拼接后一次输出，避免每行都写一次标准输出
+            click.echo(
+                "\n".join(
+                    f"\nTask ID: {result.task_id}\n"
+                    f"  Status: {result.status}\n"
+                    f"  URL: {result.url}\n"
+                    f"  Created: {result.created_at}"
+                    for result in results
+                )
+            )
 
-    asyncio.run(_list_tasks())
+    _run(_list_tasks())
 
 
 @cli.command()
@@ -158,8 +196,9 @@ def xiaohongshu_browse(
             logger.exception("Browse failed")
         finally:
             await browser_service.close()
+            await stop_shared_playwright()
 
-    asyncio.run(_browse())
+    _run(_browse())
 
 
 @cli.command(name="xiaohongshu-download-images")
@@ -171,9 +210,24 @@ def xiaohongshu_browse(
 )
 @click.option("--url-config-file", "-c", help="URL 配置文件路径（每行一个 URL）")
 @click.option("--output-dir", "-o", default="output", help="输出目录")
+@click.option("--max-concurrency", default=8, help="图片下载最大并发数", type=int)
+@click.option(
+    "--cache-ttl", default=24 * 3600, help="已完成 URL 缓存有效期（秒），0 表示不使用缓存", type=int
+)
 @click.option("--headless/--no-headless", default=False, help="是否使用无头模式")
+@click.option(
+    "--pdf/--no-pdf", default=False, help="是否将生成的 Word 文档转换为 PDF（需要 LibreOffice）"
+)
+@click.option("--workers", default=1, help="PDF 转换的并行 LibreOffice 实例数", type=int)
 def xiaohongshu_download_images(
-    urls: tuple, url_config_file: Optional[str], output_dir: str, headless: bool
+    urls: tuple,
+    url_config_file: Optional[str],
+    output_dir: str,
+    max_concurrency: int,
+    cache_ttl: int,
+    headless: bool,
+    pdf: bool,
+    workers: int,
 ):
     """有序拉取小红书内容图片并保存到 Word 文件"""
 
@@ -183,23 +237,24 @@ def xiaohongshu_download_images(
         try:
             # 构建命令
             # 处理 URLs：支持空格分隔的多个 URL
+            # 边拆分边去重（保持顺序），只遍历一次
             url_list = []
-            if urls:
-                for url_item in urls:
-                    # 如果 URL 中包含空格，可能是多个 URL，需要分割
-                    if " " in url_item.strip():
-                        # 分割并过滤空字符串
-                        split_urls = [u.strip() for u in url_item.split() if u.strip()]
-                        url_list.extend(split_urls)
-                    else:
-                        url_list.append(url_item.strip())
-                # 去重但保持顺序
-                url_list = list(dict.fromkeys(url_list))
+            seen: set[str] = set()
+            for url_item in urls or ():
+                # 如果 URL 中包含空格，可能是多个 URL，split() 会同时过滤空字符串
+                for url in url_item.split():
+                    if url not in seen:
+                        seen.add(url)
+                        url_list.append(url)
 
             command = XiaohongshuDownloadImagesCommand(
                 urls=url_list if url_list else None,
                 url_config_file=url_config_file,
                 output_dir=output_dir,
+                max_concurrency=max_concurrency,
+                cache_ttl=cache_ttl,
+                convert_pdf=pdf,
+                pdf_workers=workers,
             )
 
             # 执行用例
@@ -230,6 +285,14 @@ def xiaohongshu_download_images(
                         click.echo(f"   └─> [失败] 未生成 Word 文档")
 
                 click.echo("=" * 80)
+
+                # PDF 在文档生成过程中已流水线转换完成
+                if pdf:
+                    word_files = [word_file for word_file in url_to_word_file.values() if word_file]
+                    word_to_pdf = use_case.pdf_files
+                    click.echo(f"PDF 转换: {len(word_to_pdf)}/{len(word_files)} 个文档")
+                    for pdf_file in word_to_pdf.values():
+                        click.echo(f"   └─> {pdf_file}")
             else:
                 click.echo("No Word documents were generated.")
         except Exception as e:
@@ -237,8 +300,69 @@ def xiaohongshu_download_images(
             logger.exception("Download failed")
         finally:
             await browser_service.close()
+            await stop_shared_playwright()
+
+    _run(_download())
+
+
+@cli.command(name="xiaohongshu-serve")
+@click.option("--output-dir", "-o", default="output", help="输出目录")
+@click.option("--max-concurrency", default=8, help="图片下载最大并发数", type=int)
+@click.option(
+    "--cache-ttl", default=24 * 3600, help="已完成 URL 缓存有效期（秒），0 表示不使用缓存", type=int
+)
+@click.option("--headless/--no-headless", default=True, help="是否使用无头模式")
+@click.option(
+    "--pdf/--no-pdf", default=False, help="是否将生成的 Word 文档转换为 PDF（需要 LibreOffice）"
+)
+def xiaohongshu_serve(
+    output_dir: str,
+    max_concurrency: int,
+    cache_ttl: int,
+    headless: bool,
+    pdf: bool,
+):
+    """常驻运行：从标准输入逐行读取 URL，下载图片并保存到 Word 文件
+
+    整个运行期间只启动一次浏览器，适合由其他程序持续输入大量 URL。
+    每处理完一个 URL 输出一行 "URL<TAB>Word 文件路径"（失败时路径为空），读到 EOF 时退出。
+    """
+
+    async def _serve():
+        browser_service = XiaohongshuBrowserService(headless=headless)
+        use_case = XiaohongshuDownloadImagesUseCase(browser_service)
+        command = XiaohongshuDownloadImagesCommand(
+            output_dir=output_dir,
+            max_concurrency=max_concurrency,
+            cache_ttl=cache_ttl,
+            convert_pdf=pdf,
+        )
+
+        try:
+            # 整个会话共享 HTTP 连接池、文档线程池、缓存和 PDF 转换服务
+            async with use_case.session(command) as process:
+                url_index = 0
+                while True:
+                    line = await asyncio.to_thread(sys.stdin.readline)
+                    if not line:
+                        break
+                    url = line.strip()
+                    if not url or url.startswith("#"):
+                        continue
+
+                    url_index += 1
+                    try:
+                        # 逐个处理时无法按序号区分同名文档，改用 URL 哈希作为文件名后缀
+                        _, word_file = await process(url_index, url, url_index, name_by_url=True)
+                    except Exception as e:
+                        logger.error(f"Failed to process URL {url}: {e}")
+                        word_file = ""
+                    click.echo(f"{url}\t{word_file}")
+        finally:
+            await browser_service.close()
+            await stop_shared_playwright()
 
-    asyncio.run(_download())
+    _run(_serve())
 
 
 if __name__ == "__main__":
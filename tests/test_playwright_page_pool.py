@@ -0,0 +1,83 @@
+"""页面池与上下文轮换测试"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from infrastructure.adapters.playwright_service import PlaywrightBrowserService  # noqa: E402
+from infrastructure.config import settings  # noqa: E402
+
+
+class _FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def new_page(self):
+        return _FakePage(self)
+
+
+class _FakePage:
+    def __init__(self, context: _FakeContext):
+        self.context = context
+
+    async def goto(self, url, **kwargs):
+        if self.context.closed:
+            raise RuntimeError("Target page, context or browser has been closed")
+
+    async def close(self):
+        pass
+
+
+def _make_service(monkeypatch) -> PlaywrightBrowserService:
+    monkeypatch.setattr(settings, "playwright_pages_per_context", 1)
+    service = PlaywrightBrowserService(pool_size=1)
+    service._context = _FakeContext()
+    service.rotations = 0
+
+    async def _ensure_context():
+        return service._context
+
+    async def _rotate_context():
+        service._context.closed = True
+        service._context = _FakeContext()
+        service.rotations += 1
+
+    service._ensure_context = _ensure_context
+    service._rotate_context = _rotate_context
+    return service
+
+
+def test_rotation_waits_for_woken_getter(monkeypatch):
+    async def _run():
+        service = _make_service(monkeypatch)
+        first = await service._get_page()
+
+        # 第二个调用方等待页面归还
+        waiter = asyncio.create_task(service._get_page())
+        await asyncio.sleep(0)
+
+        # 归还页面唤醒等待者，但在它恢复运行前第三个调用方已到达并达到轮换阈值
+        await service._release_page(first)
+        third = await service._get_page()
+
+        assert service.rotations == 0
+        assert not third.context.closed
+
+        await service._release_page(third)
+        second = await waiter
+        assert not second.context.closed
+        await service._release_page(second)
+
+        assert service._pages_in_use == 0
+        assert 0 <= service._pool_created <= 1
+
+        # 全部归还后才轮换
+        fourth = await service._get_page()
+        assert service.rotations == 1
+        assert fourth.context is service._context
+        await service._release_page(fourth)
+        assert service._pool_created == 1
+
+    asyncio.run(_run())
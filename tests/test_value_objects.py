@@ -0,0 +1,26 @@
+"""值对象测试"""
+
+import copy
+import dataclasses
+import pickle
+
+from domain.entities import CrawlerTask
+from domain.value_objects import URL, TaskId
+
+
+def test_task_deepcopy_pickle_and_asdict():
+    task = CrawlerTask.create("https://www.xiaohongshu.com/explore/abc", metadata={"k": "v"})
+
+    copied = copy.deepcopy(task)
+    assert copied == task
+    assert copied.url.domain == "www.xiaohongshu.com"
+
+    restored = pickle.loads(pickle.dumps(task))
+    assert restored == task
+    assert isinstance(restored.id, TaskId)
+    assert hash(restored.url) == hash(task.url)
+
+    data = dataclasses.asdict(task)
+    assert data["url"] == URL("https://www.xiaohongshu.com/explore/abc")
+    assert data["id"] == task.id
+    assert data["metadata"] == {"k": "v"}